@@ -1,10 +1,18 @@
 import logging
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import ORJSONResponse
 
+from infrastructure.exceptions.notifications import InvalidNotificationCursorException
+
 logger = logging.getLogger(__name__)
 
 
 def exception_registry(app: FastAPI) -> None:
-    ...
+    @app.exception_handler(InvalidNotificationCursorException)
+    async def handle_invalid_notification_cursor(
+        request: Request,
+        exc: InvalidNotificationCursorException,
+    ) -> ORJSONResponse:
+        logger.info('Rejected request with invalid cursor: %s', exc.cursor)
+        return ORJSONResponse({'detail': exc.message}, status_code=400)
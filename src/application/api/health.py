@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from application.external_events.consumers.base import BaseConsumer
+from infrastructure.senders.email.base import BaseEmailSender
+
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=['health'])
+
+
+@dataclass
+class HealthMonitor:
+    consumer: BaseConsumer
+    consume_task: asyncio.Task
+    mongodb_client: AsyncIOMotorClient
+    email_sender: BaseEmailSender
+    cache_ttl: float = 5.0
+    timeout: float = 2.0
+    dependencies: dict[str, bool] = field(default_factory=dict, init=False)
+    checked_at: float = field(default=float('-inf'), init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+    def check_liveness(self) -> dict[str, bool]:
+        return {'consumer': not self.consume_task.done()}
+
+    async def check_readiness(self) -> dict[str, bool]:
+        dependencies = await self.check_dependencies()
+        return self.check_liveness() | dependencies | {'consumer_capacity': not self.consumer.is_saturated}
+
+    async def check_dependencies(self) -> dict[str, bool]:
+        async with self._lock:
+            if time.monotonic() - self.checked_at >= self.cache_ttl:
+                broker, mongodb, smtp = await asyncio.gather(
+                    self._run_check('broker', self._check_broker),
+                    self._run_check('mongodb', self._check_mongodb),
+                    self._run_check('smtp', self.email_sender.check_health),
+                )
+                self.dependencies = {'broker': broker, 'mongodb': mongodb, 'smtp': smtp}
+                self.checked_at = time.monotonic()
+        return self.dependencies
+
+    async def _check_broker(self) -> bool:
+        return self.consumer.is_connected
+
+    async def _check_mongodb(self) -> bool:
+        await self.mongodb_client.admin.command('ping')
+        return True
+
+    async def _run_check(self, name: str, check: Callable[[], Awaitable[bool]]) -> bool:
+        try:
+            return await asyncio.wait_for(check(), self.timeout)
+        except Exception as e:
+            logger.warning('Health check \'%s\' failed: %s', name, str(e) or e.__class__.__name__)
+            return False
+
+
+def get_health_response(checks: dict[str, bool]) -> ORJSONResponse:
+    healthy = all(checks.values())
+    return ORJSONResponse(
+        {'status': 'ok' if healthy else 'unavailable', 'checks': checks},
+        status_code=200 if healthy else 503,
+    )
+
+
+@router.get('/live')
+async def get_liveness(request: Request) -> ORJSONResponse:
+    health_monitor: HealthMonitor | None = getattr(request.app.state, 'health_monitor', None)
+    if health_monitor is None:
+        return get_health_response({'started': False})
+    return get_health_response(health_monitor.check_liveness())
+
+
+@router.get('/ready')
+async def get_readiness(request: Request) -> ORJSONResponse:
+    health_monitor: HealthMonitor | None = getattr(request.app.state, 'health_monitor', None)
+    if health_monitor is None:
+        return get_health_response({'started': False})
+    return get_health_response(await health_monitor.check_readiness())
@@ -1,48 +1,134 @@
 import asyncio
-import logging
-from contextlib import asynccontextmanager
+import atexit
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 from punq import Container
 
 from application.api.exception_handlers import exception_registry
+from application.api.health import HealthMonitor, router as health_router
+from application.api.metrics import router as metrics_router, track_component_metrics
+from application.api.v1.notifications import router as notifications_router
 from application.external_events.consumers.base import BaseConsumer
+from infrastructure.logs.handlers import configure_logging
 from infrastructure.producers.base import BaseProducer
+from infrastructure.producers.outbox import OutboxRelay
+from infrastructure.repositories.base import BaseNotificationRepository, BaseNotificationTemplateRepository
+from infrastructure.senders.email.base import BaseEmailSender
+from infrastructure.senders.sms.base import BaseSMSSender
+from infrastructure.storages.archive import NotificationArchiver
 from infrastructure.storages.database import init_mongodb
+from infrastructure.tracing.otel import configure_tracing, shutdown_tracing
 from motor.motor_asyncio import AsyncIOMotorClient
 from settings.config import settings
+from service.scheduler import CommandScheduler
 from settings.container import initialize_container
 
 
-logging.basicConfig(
+log_listener = configure_logging(
     level=settings.LOG_LEVEL,
-    format=settings.LOG_FORMAT,
+    fmt=settings.LOG_FORMAT,
+    json_output=settings.LOG_JSON,
+    use_queue=settings.LOG_QUEUE_ENABLED,
+    rate_limit=settings.LOG_RATE_LIMIT,
+    rate_limit_burst=settings.LOG_RATE_LIMIT_BURST,
 )
+if log_listener:
+    atexit.register(log_listener.stop)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if settings.NOTIFICATION_SERVICE_TRACING_ENABLED:
+        configure_tracing(
+            'notification-service',
+            sample_ratio=settings.NOTIFICATION_SERVICE_TRACING_SAMPLE_RATIO,
+            exporter=settings.NOTIFICATION_SERVICE_TRACING_EXPORTER,
+        )
+
     client = AsyncIOMotorClient(settings.MONGODB_URL)
     await init_mongodb(client)
 
     container: Container = initialize_container()
     consumer: BaseConsumer = container.resolve(BaseConsumer)
     producer: BaseProducer = container.resolve(BaseProducer)
-
+    email_sender: BaseEmailSender = container.resolve(BaseEmailSender)
+    sms_sender: BaseSMSSender = container.resolve(BaseSMSSender)
+    notification_template_repo: BaseNotificationTemplateRepository = container.resolve(
+        BaseNotificationTemplateRepository
+    )
+    notification_repo: BaseNotificationRepository = container.resolve(BaseNotificationRepository)
+    outbox_relay: OutboxRelay | None = None
+    if settings.OUTBOX_RELAY_ENABLED:
+        outbox_relay = container.resolve(OutboxRelay)
+    scheduler: CommandScheduler | None = None
+    if settings.NOTIFICATION_SERVICE_SCHEDULER_ENABLED:
+        scheduler = container.resolve(CommandScheduler)
+    archiver: NotificationArchiver | None = None
+    if settings.NOTIFICATIONS_ARCHIVE_DIR and settings.NOTIFICATIONS_RETENTION_SECONDS is not None:
+        archiver = container.resolve(NotificationArchiver)
+
+    if settings.NOTIFICATION_SERVICE_METRICS_ENABLED:
+        message_buses = {id(handler.bus): handler.bus for handler in consumer.external_events_map.values()}
+        if scheduler:
+            message_buses[id(scheduler.bus)] = scheduler.bus
+        track_component_metrics(
+            message_buses=list(message_buses.values()),
+            consumer=consumer,
+            producer=producer,
+            notification_repo=notification_repo,
+            notification_template_repo=notification_template_repo,
+        )
+
+    await notification_template_repo.start()
+    await notification_repo.start()
+    await email_sender.start()
+    await sms_sender.start()
     await consumer.start()
     consume_task = asyncio.create_task(consumer.consume())
+    app.state.health_monitor = HealthMonitor(
+        consumer=consumer,
+        consume_task=consume_task,
+        mongodb_client=client,
+        email_sender=email_sender,
+        cache_ttl=settings.NOTIFICATION_SERVICE_HEALTH_CACHE_TTL,
+        timeout=settings.NOTIFICATION_SERVICE_HEALTH_CHECK_TIMEOUT,
+    )
 
     await producer.start()
 
-    yield
+    if outbox_relay:
+        await outbox_relay.start()
 
-    client.close()
+    if scheduler:
+        await scheduler.start()
 
-    await producer.stop()
+    if archiver:
+        await archiver.start()
+
+    yield
+
+    if archiver:
+        await archiver.stop()
 
     consume_task.cancel()
+    with suppress(asyncio.CancelledError, Exception):
+        await consume_task
     await consumer.stop()
+    if scheduler:
+        await scheduler.stop()
+    await notification_repo.stop()
+
+    if outbox_relay:
+        await outbox_relay.stop()
+    await producer.stop()
+    await email_sender.stop()
+    await sms_sender.stop()
+    await notification_template_repo.stop()
+
+    client.close()
+    shutdown_tracing()
 
 
 def create_app():
@@ -54,7 +140,10 @@ def create_app():
         lifespan=lifespan,
         default_response_class=ORJSONResponse,
     )
-    # app.include_router(router, prefix=settings.NOTIFICATION_SERVICE_API_PREFIX)
+    app.include_router(notifications_router, prefix=settings.NOTIFICATION_SERVICE_API_PREFIX)
+    app.include_router(health_router, prefix=settings.NOTIFICATION_SERVICE_HEALTH_PATH)
+    if settings.NOTIFICATION_SERVICE_METRICS_ENABLED:
+        app.include_router(metrics_router, prefix=settings.NOTIFICATION_SERVICE_METRICS_PATH)
     exception_registry(app)
 
     return app
\ No newline at end of file
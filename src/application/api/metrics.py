@@ -0,0 +1,147 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from application.external_events.consumers.base import BaseConsumer
+from application.external_events.consumers.rabbitmq import RabbitMQConsumer
+from application.external_events.dispatchers.partitioned import PartitionedExternalEventDispatcher
+from infrastructure.metrics.prometheus import ComponentMetric, ComponentMetricsCollector, component_metrics
+from infrastructure.producers.base import BaseProducer
+from infrastructure.producers.rabbitmq import RabbitMQProducer
+from infrastructure.repositories.base import BaseNotificationRepository, BaseNotificationTemplateRepository
+from infrastructure.repositories.buffered import BufferedBeanieNotificationRepository
+from infrastructure.repositories.cached import CachedNotificationTemplateRepository
+from service.message_bus import MessageBus
+
+
+router = APIRouter(tags=['metrics'])
+
+
+@router.get('', include_in_schema=False)
+async def get_metrics() -> Response:
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+def track_component_metrics(
+    message_buses: list[MessageBus],
+    consumer: BaseConsumer,
+    producer: BaseProducer,
+    notification_repo: BaseNotificationRepository,
+    notification_template_repo: BaseNotificationTemplateRepository,
+    collector: ComponentMetricsCollector = component_metrics,
+):
+    collector.track(
+        ComponentMetric(
+            'notification_service_message_bus_queue_size',
+            'Messages queued in the message bus.',
+            lambda: sum(message_bus.queue_size for message_bus in message_buses),
+        ),
+        ComponentMetric(
+            'notification_service_message_bus_queue_high_water_mark',
+            'Largest message bus queue size observed.',
+            lambda: max((message_bus.queue_high_water_mark for message_bus in message_buses), default=0),
+        ),
+    )
+
+    if isinstance(consumer, RabbitMQConsumer) and consumer.idempotency_store:
+        idempotency_store = consumer.idempotency_store
+        collector.track(
+            ComponentMetric(
+                'notification_service_idempotency_checks',
+                'Messages checked against the idempotency store.',
+                lambda: idempotency_store.checks,
+                counter=True,
+            ),
+            ComponentMetric(
+                'notification_service_idempotency_duplicates',
+                'Messages skipped as duplicates.',
+                lambda: idempotency_store.duplicates,
+                counter=True,
+            ),
+            ComponentMetric(
+                'notification_service_idempotency_duplicate_rate',
+                'Share of checked messages that were duplicates.',
+                lambda: idempotency_store.duplicate_rate,
+            ),
+        )
+
+    if isinstance(consumer, RabbitMQConsumer) and isinstance(consumer.dispatcher, PartitionedExternalEventDispatcher):
+        dispatcher = consumer.dispatcher
+        collector.track(
+            ComponentMetric(
+                'notification_service_dispatcher_lane_depth',
+                'Jobs queued per dispatcher lane.',
+                lambda: {str(lane): depth for lane, depth in enumerate(dispatcher.lane_depths)},
+                label='lane',
+            ),
+        )
+
+    if isinstance(producer, RabbitMQProducer):
+        collector.track(
+            ComponentMetric(
+                'notification_service_producer_pending_confirms',
+                'Published events awaiting broker confirmation.',
+                lambda: producer.pending_confirms,
+            ),
+            ComponentMetric(
+                'notification_service_producer_confirm_lag_seconds',
+                'Broker confirmation lag of the last published event.',
+                lambda: producer.last_confirm_lag,
+            ),
+            ComponentMetric(
+                'notification_service_producer_max_confirm_lag_seconds',
+                'Largest broker confirmation lag observed.',
+                lambda: producer.max_confirm_lag,
+            ),
+            ComponentMetric(
+                'notification_service_producer_outbox_size',
+                'Events waiting in the producer outbox.',
+                lambda: len(producer.outbox),
+            ),
+        )
+
+    if isinstance(notification_repo, BufferedBeanieNotificationRepository):
+        collector.track(
+            ComponentMetric(
+                'notification_service_write_buffer_size',
+                'Notifications waiting in the write-behind buffer.',
+                lambda: notification_repo.buffer_size,
+            ),
+            ComponentMetric(
+                'notification_service_write_buffer_flush_duration_seconds',
+                'Duration of the last write-behind flush.',
+                lambda: notification_repo.last_flush_duration,
+            ),
+            ComponentMetric(
+                'notification_service_write_buffer_max_flush_duration_seconds',
+                'Longest write-behind flush observed.',
+                lambda: notification_repo.max_flush_duration,
+            ),
+            ComponentMetric(
+                'notification_service_write_buffer_failed_flushes',
+                'Write-behind flushes that requeued notifications.',
+                lambda: notification_repo.failed_flushes,
+                counter=True,
+            ),
+            ComponentMetric(
+                'notification_service_write_buffer_dropped_notifications',
+                'Buffered notifications dropped after being rejected by MongoDB.',
+                lambda: notification_repo.dropped_notifications,
+                counter=True,
+            ),
+        )
+
+    if isinstance(notification_template_repo, CachedNotificationTemplateRepository):
+        collector.track(
+            ComponentMetric(
+                'notification_service_template_cache_hits',
+                'Notification template cache hits.',
+                lambda: notification_template_repo.hits,
+                counter=True,
+            ),
+            ComponentMetric(
+                'notification_service_template_cache_misses',
+                'Notification template cache misses.',
+                lambda: notification_template_repo.misses,
+                counter=True,
+            ),
+        )
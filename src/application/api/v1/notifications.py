@@ -0,0 +1,64 @@
+from contextlib import aclosing
+from datetime import datetime
+from typing import Annotated, AsyncIterator
+
+import orjson
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from infrastructure.models.notifications import NotificationType
+from infrastructure.repositories.base import BaseNotificationQueryRepository
+from infrastructure.repositories.queries import NotificationCursor, NotificationFilters
+from settings.config import settings
+from settings.container import initialize_container
+
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+router = APIRouter(prefix='/notifications', tags=['notifications'])
+
+
+def get_notification_query_repository() -> BaseNotificationQueryRepository:
+    return initialize_container().resolve(BaseNotificationQueryRepository)
+
+
+async def stream_notifications(
+    repo: BaseNotificationQueryRepository,
+    filters: NotificationFilters,
+    limit: int,
+    cursor: NotificationCursor | None = None,
+) -> AsyncIterator[bytes]:
+    streamed = 0
+    last_notification = None
+    async with aclosing(repo.find(filters, limit + 1, cursor)) as notifications:
+        async for notification in notifications:
+            if streamed == limit:
+                next_cursor = NotificationCursor(last_notification['created_at'], last_notification['id'])
+                yield orjson.dumps({'next_cursor': next_cursor.encode()}) + b'\n'
+                return
+
+            yield orjson.dumps(notification) + b'\n'
+            streamed += 1
+            last_notification = notification
+
+
+@router.get('', response_class=StreamingResponse)
+async def list_notifications(
+    repo: Annotated[BaseNotificationQueryRepository, Depends(get_notification_query_repository)],
+    receiver: str | None = None,
+    notification_type: NotificationType | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=settings.NOTIFICATION_SERVICE_API_MAX_PAGE_SIZE)] = 100,
+) -> StreamingResponse:
+    filters = NotificationFilters(
+        receiver=receiver,
+        notification_type=notification_type,
+        created_after=created_after,
+        created_before=created_before,
+    )
+    return StreamingResponse(
+        stream_notifications(repo, filters, limit, NotificationCursor.decode(cursor) if cursor else None),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
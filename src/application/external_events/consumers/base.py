@@ -18,6 +18,14 @@ class BaseConsumer(ABC):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.stop()
 
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    @property
+    def is_saturated(self) -> bool:
+        return False
+
     @abstractmethod
     async def start(self):
         ...
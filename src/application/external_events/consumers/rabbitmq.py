@@ -1,9 +1,14 @@
+import asyncio
 import logging
+import random
+import time
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Awaitable, Callable
 
 import orjson
 
-from aio_pika import connect_robust
+from aio_pika import connect_robust, DeliveryMode, Message
 from aio_pika.abc import (
     AbstractRobustConnection,
     AbstractRobustChannel,
@@ -14,10 +19,42 @@ from aio_pika.abc import (
 )
 
 from application.external_events.consumers.base import BaseConsumer
+from application.external_events.dispatchers.base import BaseExternalEventDispatcher
+from application.external_events.handlers.base import reset_current_message_key, set_current_message_key
+from domain.exceptions.base import DomainException
+from infrastructure.exceptions.notifications import InvalidNotificationTemplateException
+from infrastructure.idempotency.base import BaseIdempotencyStore
+from infrastructure.metrics.prometheus import (
+    UNKNOWN_ROUTING_KEY,
+    MessageMetrics,
+    get_message_metrics,
+    reset_current_message_metrics,
+    set_current_message_metrics,
+)
+from infrastructure.tracing.otel import is_tracing_enabled, record_span_error, start_span
+from service.exceptions.base import ServiceException
 
 
 logger = logging.getLogger(__name__)
 
+RETRY_ATTEMPT_HEADER = 'x-retry-attempt'
+ORIGINAL_ROUTING_KEY_HEADER = 'x-original-routing-key'
+LAST_ERROR_HEADER = 'x-last-error'
+
+
+def topic_matches(pattern: str, routing_key: str) -> bool:
+    return _match_topic_words(tuple(pattern.split('.')), tuple(routing_key.split('.')))
+
+
+@lru_cache(maxsize=1024)
+def _match_topic_words(pattern: tuple[str, ...], words: tuple[str, ...]) -> bool:
+    if not pattern:
+        return not words
+    head, rest = pattern[0], pattern[1:]
+    if head == '#':
+        return any(_match_topic_words(rest, words[index:]) for index in range(len(words) + 1))
+    return bool(words) and head in ('*', words[0]) and _match_topic_words(rest, words[1:])
+
 
 @dataclass
 class RabbitMQConsumer(BaseConsumer):
@@ -29,10 +66,31 @@ class RabbitMQConsumer(BaseConsumer):
     exchange_name: str
     queue_name: str
     consuming_topics: list[str] = field(default_factory=list)
+    prefetch_count: int = 1
+    max_concurrent_messages: int = 1
+    dispatcher: BaseExternalEventDispatcher | None = None
+    idempotency_store: BaseIdempotencyStore | None = None
+    max_retries: int = 5
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 300.0
+    retry_jitter: float = 0.2
+    non_retryable_exceptions: tuple[type[Exception], ...] = (
+        DomainException,
+        ServiceException,
+        InvalidNotificationTemplateException,
+        KeyError,
+        ValueError,
+    )
+    priority_topics: list[str] = field(default_factory=list)
+    priority_max_concurrent_messages: int = 4
     connection: AbstractRobustConnection | None = None
     channel: AbstractRobustChannel | None = None
     exchange: AbstractRobustExchange | None = None
     queue: AbstractRobustQueue | None = None
+    priority_queue: AbstractRobustQueue | None = None
+    in_flight_limiter: asyncio.Semaphore | None = None
+    priority_in_flight_limiter: asyncio.Semaphore | None = None
+    in_flight_tasks: set[asyncio.Task] = field(default_factory=set)
 
     async def start(self):
         self.connection = await connect_robust(
@@ -43,6 +101,9 @@ class RabbitMQConsumer(BaseConsumer):
             virtual_host=self.virtual_host,
         )
         self.channel = await self.connection.channel()
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
+        self.in_flight_limiter = asyncio.Semaphore(self.max_concurrent_messages)
+        self.priority_in_flight_limiter = asyncio.Semaphore(self.priority_max_concurrent_messages)
         self.exchange = await self.channel.declare_exchange(
             self.exchange_name,
             ExchangeType.TOPIC,
@@ -52,6 +113,18 @@ class RabbitMQConsumer(BaseConsumer):
             self.queue_name,
             durable=True,
         )
+        await self.channel.declare_queue(self.dead_letter_queue_name, durable=True)
+        for attempt in range(1, self.max_retries + 1):
+            await self.channel.declare_queue(
+                self.get_retry_queue_name(attempt),
+                durable=True,
+                arguments={
+                    'x-dead-letter-exchange': '',
+                    'x-dead-letter-routing-key': self.queue_name,
+                },
+            )
+        if self.dispatcher:
+            await self.dispatcher.start()
         for key in self.consuming_topics:
             await self.queue.bind(self.exchange, routing_key=key)
             logger.info(
@@ -62,30 +135,266 @@ class RabbitMQConsumer(BaseConsumer):
                 },
             )
 
+        if self.priority_topics:
+            self.priority_queue = await self.channel.declare_queue(self.priority_queue_name, durable=True)
+            for key in self.priority_topics:
+                await self.priority_queue.bind(self.exchange, routing_key=key)
+                logger.info('Priority queue %s bound to routing key %s.', self.priority_queue.name, key)
+
     async def stop(self):
+        if self.in_flight_tasks:
+            logger.info('Waiting for %d in-flight messages to finish', len(self.in_flight_tasks))
+            await asyncio.gather(*self.in_flight_tasks, return_exceptions=True)
+        if self.dispatcher:
+            await self.dispatcher.stop()
         if self.channel:
             await self.channel.close()
         if self.connection:
             await self.connection.close()
 
+    @property
+    def is_connected(self) -> bool:
+        return self.connection is not None and not self.connection.is_closed
+
+    @property
+    def is_saturated(self) -> bool:
+        return self.in_flight_limiter is not None and self.in_flight_limiter.locked()
+
     async def consume(self):
         if not self.connection:
             await self.start()
 
-        async with self.queue.iterator() as queue_iter:
+        consumers = [
+            self._consume_queue(
+                self.queue,
+                self.in_flight_limiter,
+                self.dispatcher,
+                skip_priority_messages=self.priority_queue is not None,
+            ),
+        ]
+        if self.priority_queue:
+            consumers.append(
+                self._consume_queue(
+                    self.priority_queue,
+                    self.priority_in_flight_limiter,
+                    self.dispatcher,
+                    priority=True,
+                ),
+            )
+        await asyncio.gather(*consumers)
+
+    async def _consume_queue(
+        self,
+        queue: AbstractRobustQueue,
+        in_flight_limiter: asyncio.Semaphore,
+        dispatcher: BaseExternalEventDispatcher | None = None,
+        skip_priority_messages: bool = False,
+        priority: bool = False,
+    ):
+        async with queue.iterator() as queue_iter:
             async for message in queue_iter:
-                async with message.process():
-                    await self.process_message(message)
+                if skip_priority_messages and self.is_priority_message(message):
+                    await message.ack()
+                    continue
+
+                try:
+                    body = orjson.loads(message.body)
+                except orjson.JSONDecodeError as e:
+                    logger.exception(
+                        'Rejecting malformed message(%(body)s)',
+                        {'body': message.body},
+                        exc_info=e,
+                    )
+                    await message.reject()
+                    continue
+
+                if not isinstance(body, dict):
+                    logger.error('Rejecting message(%(body)s): body is not a JSON object', {'body': message.body})
+                    await message.reject()
+                    continue
+
+                received_at = time.perf_counter()
+                metrics = get_message_metrics(self.get_metrics_routing_key(self.get_routing_key(message)))
+                await in_flight_limiter.acquire()
+                metrics.in_flight.inc()
+                job = partial(self._process_in_flight, message, body, in_flight_limiter, metrics, received_at)
+                if dispatcher:
+                    try:
+                        await dispatcher.dispatch(body, job, priority=priority)
+                    except BaseException:
+                        metrics.in_flight.dec()
+                        in_flight_limiter.release()
+                        raise
+                else:
+                    task = asyncio.create_task(job())
+                    self.in_flight_tasks.add(task)
+                    task.add_done_callback(self.in_flight_tasks.discard)
+
+    def is_priority_message(self, message: AbstractIncomingMessage) -> bool:
+        # Priority topics are also delivered to the main queue through its wildcard bindings;
+        # first deliveries are handled by the priority queue, retries come back through the main one.
+        if ORIGINAL_ROUTING_KEY_HEADER in (message.headers or {}):
+            return False
+        return any(topic_matches(pattern, message.routing_key) for pattern in self.priority_topics)
+
+    async def _process_in_flight(
+        self,
+        message: AbstractIncomingMessage,
+        body: dict,
+        in_flight_limiter: asyncio.Semaphore,
+        metrics: MessageMetrics,
+        received_at: float,
+    ):
+        token = set_current_message_metrics(metrics)
+        try:
+            async with message.process(requeue=True):
+                await self.process_message(message, body)
+        finally:
+            reset_current_message_metrics(token)
+            metrics.consume_to_ack.observe(time.perf_counter() - received_at)
+            metrics.in_flight.dec()
+            in_flight_limiter.release()
+
+    async def process_message(self, message: AbstractIncomingMessage, body: dict):
+        routing_key = self.get_routing_key(message)
+        if not is_tracing_enabled():
+            return await self._process_message(message, body, routing_key)
 
-    async def process_message(self, message: AbstractIncomingMessage):
+        span_attributes = {
+            'messaging.system': 'rabbitmq',
+            'messaging.destination.name': routing_key,
+            'messaging.message.id': message.message_id or '',
+        }
+        with start_span(f'{routing_key} process', span_attributes, headers=message.headers, consumer=True) as span:
+            await self._process_message(message, body, routing_key, span)
+
+    async def _process_message(self, message: AbstractIncomingMessage, body: dict, routing_key: str, span=None):
+        idempotency_key = self.get_idempotency_key(message, body)
+        metrics = get_message_metrics(self.get_metrics_routing_key(routing_key))
+        claimed = False
+        token = set_current_message_key(idempotency_key)
         try:
-            handler = self.external_events_map.get(message.routing_key)
-            await handler(orjson.loads(message.body)) if handler else (
-                logger.info('No handler found for message with routing key: %s', message.routing_key)
+            if idempotency_key and self.idempotency_store:
+                claimed = await self.idempotency_store.claim(idempotency_key)
+                if not claimed:
+                    logger.info(
+                        'Skipping duplicate message \'%s\' with routing key: %s',
+                        idempotency_key,
+                        routing_key,
+                    )
+                    return
+
+            handler = self.external_events_map.get(routing_key)
+            await handler(body) if handler else (
+                logger.info('No handler found for message with routing key: %s', routing_key)
             )
         except Exception as e:
+            metrics.failed.inc()
+            record_span_error(span, e)
             logger.exception(
                 'Error processing message(%(body)s)',
                 {'body': message.body},
                 exc_info=e,
             )
+            if claimed:
+                await self._settle_idempotency_key(self.idempotency_store.release, idempotency_key)
+            await self.retry_or_dead_letter(message, routing_key, e)
+        else:
+            metrics.succeeded.inc()
+            if claimed:
+                await self._settle_idempotency_key(self.idempotency_store.complete, idempotency_key)
+        finally:
+            reset_current_message_key(token)
+
+    @staticmethod
+    async def _settle_idempotency_key(settle: Callable[[str], Awaitable[None]], key: str):
+        try:
+            await settle(key)
+        except Exception as e:
+            logger.exception('Error settling idempotency key \'%s\': %s', key, str(e))
+
+    async def retry_or_dead_letter(self, message: AbstractIncomingMessage, routing_key: str, error: Exception):
+        attempt = self.get_retry_attempt(message)
+        headers = {
+            **(message.headers or {}),
+            RETRY_ATTEMPT_HEADER: attempt,
+            ORIGINAL_ROUTING_KEY_HEADER: routing_key,
+            LAST_ERROR_HEADER: f'{error.__class__.__name__}: {error}'[:1024],
+        }
+
+        try:
+            if isinstance(error, self.non_retryable_exceptions) or attempt > self.max_retries:
+                logger.error(
+                    'Dead-lettering message with routing key %s after %d attempt(s)',
+                    routing_key,
+                    attempt,
+                )
+                await self._republish(message, headers, self.dead_letter_queue_name)
+                return
+
+            delay = self.get_retry_delay(attempt)
+            logger.warning(
+                'Retrying message with routing key %s in %.1fs (attempt %d of %d)',
+                routing_key,
+                delay,
+                attempt,
+                self.max_retries,
+            )
+            await self._republish(message, headers, self.get_retry_queue_name(attempt), expiration=delay)
+        except Exception:
+            # The broker refused the republish; back off before the message is requeued
+            # so a broker brownout does not turn into a hot redelivery loop.
+            delay = self.get_retry_delay(min(attempt, self.max_retries))
+            logger.exception('Error republishing message with routing key %s, requeueing in %.1fs', routing_key, delay)
+            await asyncio.sleep(delay)
+            raise
+
+    async def _republish(
+        self,
+        message: AbstractIncomingMessage,
+        headers: dict,
+        queue_name: str,
+        expiration: float | None = None,
+    ):
+        await self.channel.default_exchange.publish(
+            Message(
+                body=message.body,
+                headers=headers,
+                content_type=message.content_type,
+                message_id=message.message_id,
+                delivery_mode=DeliveryMode.PERSISTENT,
+                expiration=expiration,
+            ),
+            routing_key=queue_name,
+        )
+
+    @property
+    def priority_queue_name(self) -> str:
+        return f'{self.queue_name}.priority'
+
+    @property
+    def dead_letter_queue_name(self) -> str:
+        return f'{self.queue_name}.dead-letter'
+
+    def get_retry_queue_name(self, attempt: int) -> str:
+        return f'{self.queue_name}.retry.{attempt}'
+
+    @staticmethod
+    def get_retry_attempt(message: AbstractIncomingMessage) -> int:
+        return int((message.headers or {}).get(RETRY_ATTEMPT_HEADER, 0)) + 1
+
+    def get_retry_delay(self, attempt: int) -> float:
+        delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+        return delay * random.uniform(1 - self.retry_jitter, 1 + self.retry_jitter)
+
+    def get_metrics_routing_key(self, routing_key: str) -> str:
+        return routing_key if routing_key in self.external_events_map else UNKNOWN_ROUTING_KEY
+
+    @staticmethod
+    def get_routing_key(message: AbstractIncomingMessage) -> str:
+        return (message.headers or {}).get(ORIGINAL_ROUTING_KEY_HEADER) or message.routing_key
+
+    @classmethod
+    def get_idempotency_key(cls, message: AbstractIncomingMessage, body: dict) -> str | None:
+        event_id = message.message_id or (body.get('event_id') if isinstance(body, dict) else None)
+        return f'{cls.get_routing_key(message)}:{event_id}' if event_id else None
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+
+Job = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class BaseExternalEventDispatcher(ABC):
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    @abstractmethod
+    async def start(self):
+        ...
+
+    @abstractmethod
+    async def stop(self):
+        ...
+
+    @abstractmethod
+    async def dispatch(self, body: dict, job: Job, priority: bool = False) -> None:
+        ...
@@ -0,0 +1,97 @@
+import asyncio
+import itertools
+import logging
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+
+from application.external_events.dispatchers.base import BaseExternalEventDispatcher, Job
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PartitionedExternalEventDispatcher(BaseExternalEventDispatcher):
+    lanes_count: int
+    lane_depth: int
+    partition_key: str = 'user_id'
+    lanes: list[asyncio.PriorityQueue[tuple[int, int, str | None, bool, Job]]] = field(default_factory=list)
+    workers: list[asyncio.Task] = field(default_factory=list)
+    _lane_slots: list[asyncio.Semaphore] = field(default_factory=list, init=False, repr=False)
+    _round_robin: itertools.count = field(default_factory=itertools.count, init=False, repr=False)
+    _sequence: itertools.count = field(default_factory=itertools.count, init=False, repr=False)
+    _queued_regular: Counter[str] = field(default_factory=Counter, init=False, repr=False)
+
+    @property
+    def lane_depths(self) -> list[int]:
+        return [lane.qsize() for lane in self.lanes]
+
+    async def start(self):
+        if self.workers:
+            return
+
+        self.lanes = [asyncio.PriorityQueue() for _ in range(self.lanes_count)]
+        self._lane_slots = [asyncio.Semaphore(self.lane_depth) for _ in range(self.lanes_count)]
+        self.workers = [
+            asyncio.create_task(self._run_lane(lane, lane_slots))
+            for lane, lane_slots in zip(self.lanes, self._lane_slots)
+        ]
+        logger.info(
+            'Started %(lanes_count)d dispatcher lanes partitioned by %(partition_key)s',
+            {
+                'lanes_count': self.lanes_count,
+                'partition_key': self.partition_key,
+            },
+        )
+
+    async def stop(self):
+        for lane in self.lanes:
+            await lane.join()
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers.clear()
+
+    async def dispatch(self, body: dict, job: Job, priority: bool = False) -> None:
+        if not self.workers:
+            await self.start()
+
+        # Priority jobs are not bounded by lane_depth and run before queued regular jobs of other keys
+        # in their lane; behind a queued regular job of their own key they keep their place.
+        key = body.get(self.partition_key)
+        key = None if key is None else str(key)
+        lane_index = self.get_lane_index(body)
+        if not priority:
+            await self._lane_slots[lane_index].acquire()
+
+        rank = 0 if priority and (key is None or not self._queued_regular[key]) else 1
+        if rank and key is not None:
+            self._queued_regular[key] += 1
+        self.lanes[lane_index].put_nowait((rank, next(self._sequence), key, not priority, job))
+
+    def get_lane_index(self, body: dict) -> int:
+        key = body.get(self.partition_key)
+        if key is None:
+            return next(self._round_robin) % self.lanes_count
+        return zlib.crc32(str(key).encode()) % self.lanes_count
+
+    async def _run_lane(
+        self,
+        lane: asyncio.PriorityQueue[tuple[int, int, str | None, bool, Job]],
+        lane_slots: asyncio.Semaphore,
+    ):
+        while True:
+            rank, _, key, bounded, job = await lane.get()
+            if bounded:
+                lane_slots.release()
+            if rank and key is not None:
+                self._queued_regular[key] -= 1
+                if not self._queued_regular[key]:
+                    del self._queued_regular[key]
+            try:
+                await job()
+            except Exception as e:
+                logger.exception('Dispatcher lane job failed', exc_info=e)
+            finally:
+                lane.task_done()
@@ -1,13 +1,49 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from uuid import NAMESPACE_OID, uuid5
 
+from domain.commands.base import BaseCommand
 from service.message_bus import MessageBus
+from service.scheduler import CommandScheduler
+
+
+_current_message_key: ContextVar[str | None] = ContextVar('current_message_key', default=None)
+
+
+def get_current_message_key() -> str | None:
+    return _current_message_key.get()
+
+
+def set_current_message_key(message_key: str | None) -> Token:
+    return _current_message_key.set(message_key)
+
+
+def reset_current_message_key(token: Token):
+    _current_message_key.reset(token)
 
 
 @dataclass
 class BaseExternalEventHandler(ABC):
     bus: MessageBus
+    scheduler: CommandScheduler | None = field(default=None, kw_only=True)
 
     @abstractmethod
     async def __call__(self, body: dict) -> None:
         ...
+
+    async def dispatch(self, body: dict, command: BaseCommand) -> None:
+        message_key = get_current_message_key()
+        if message_key:
+            command.command_id = uuid5(NAMESPACE_OID, message_key)
+
+        send_at = body.get('send_at')
+        if send_at and self.scheduler is not None:
+            due_at = datetime.fromisoformat(send_at)
+            if due_at.tzinfo is None:
+                due_at = due_at.replace(tzinfo=timezone.utc)
+            if due_at > datetime.now(timezone.utc):
+                await self.scheduler.schedule(command, due_at)
+                return
+        await self.bus.handle(command)
@@ -21,7 +21,8 @@ logger = logging.getLogger(__name__)
 @dataclass
 class UserRegistrationCompletedExternalEventHandler(BaseExternalEventHandler):
     async def __call__(self, body: dict) -> None:
-        await self.bus.handle(
+        await self.dispatch(
+            body,
             SendUserRegistrationCompletedMessageCommand(
                 user_id=body['user_id'],
                 email=EmailVO(body['email']) if body.get('email') else None,
@@ -37,7 +38,8 @@ class UserRegistrationCompletedExternalEventHandler(BaseExternalEventHandler):
 @dataclass
 class UserEmailUpdateInitiatedExternalEventHandler(BaseExternalEventHandler):
     async def __call__(self, body: dict) -> None:
-        await self.bus.handle(
+        await self.dispatch(
+            body,
             SendUserEmailUpdateInitiatedMessageCommand(
                 user_id=body['user_id'],
                 new_email=EmailVO(body['new_email']),
@@ -49,7 +51,8 @@ class UserEmailUpdateInitiatedExternalEventHandler(BaseExternalEventHandler):
 @dataclass
 class UserPhoneNumberUpdateInitiatedExternalEventHandler(BaseExternalEventHandler):
     async def __call__(self, body: dict) -> None:
-        await self.bus.handle(
+        await self.dispatch(
+            body,
             SendUserPhoneNumberUpdateInitiatedMessageCommand(
                 user_id=body['user_id'],
                 new_phone_number=PhoneNumberVO(body['new_phone_number']),
@@ -61,7 +64,8 @@ class UserPhoneNumberUpdateInitiatedExternalEventHandler(BaseExternalEventHandle
 @dataclass
 class UserPasswordResetInitiatedExternalEventHandler(BaseExternalEventHandler):
     async def __call__(self, body: dict) -> None:
-        await self.bus.handle(
+        await self.dispatch(
+            body,
             SendUserPasswordResetInitiatedMessageCommand(
                 user_id=body['user_id'],
                 email=EmailVO(body['email']) if body.get('email') else None,
@@ -74,7 +78,8 @@ class UserPasswordResetInitiatedExternalEventHandler(BaseExternalEventHandler):
 @dataclass
 class UserEmailUpdatedExternalEventHandler(BaseExternalEventHandler):
     async def __call__(self, body: dict) -> None:
-        await self.bus.handle(
+        await self.dispatch(
+            body,
             SendUserEmailUpdatedMessageCommand(
                 user_id=body['user_id'],
                 new_email=EmailVO(body['new_email']),
@@ -85,7 +90,8 @@ class UserEmailUpdatedExternalEventHandler(BaseExternalEventHandler):
 @dataclass
 class UserPhoneNumberUpdatedExternalEventHandler(BaseExternalEventHandler):
     async def __call__(self, body: dict) -> None:
-        await self.bus.handle(
+        await self.dispatch(
+            body,
             SendUserPhoneNumberUpdatedMessageCommand(
                 user_id=body['user_id'],
                 new_phone_number=PhoneNumberVO(body['new_phone_number']),
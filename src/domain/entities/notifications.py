@@ -1,9 +1,31 @@
 from dataclasses import dataclass
+from enum import Enum
 
 from domain.entities.base import BaseEntity
 from domain.value_objects.notifications import EmailVO, PhoneNumberVO
 
 
+class DeliveryStatus(Enum):
+    QUEUED = 'queued'
+    SENDING = 'sending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    BOUNCED = 'bounced'
+
+
+DELIVERY_STATUS_TRANSITIONS: dict[DeliveryStatus, frozenset[DeliveryStatus]] = {
+    DeliveryStatus.QUEUED: frozenset(),
+    DeliveryStatus.SENDING: frozenset({DeliveryStatus.QUEUED, DeliveryStatus.FAILED}),
+    DeliveryStatus.SENT: frozenset({DeliveryStatus.SENDING}),
+    DeliveryStatus.FAILED: frozenset({DeliveryStatus.QUEUED, DeliveryStatus.SENDING}),
+    DeliveryStatus.BOUNCED: frozenset({DeliveryStatus.SENT}),
+}
+
+
+def is_delivery_status_transition_allowed(current: DeliveryStatus, new: DeliveryStatus) -> bool:
+    return current in DELIVERY_STATUS_TRANSITIONS[new]
+
+
 @dataclass(eq=False)
 class EmailNotificationEntity(BaseEntity):
     sender: EmailVO
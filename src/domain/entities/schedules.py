@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from domain.commands.base import BaseCommand
+from domain.entities.base import BaseEntity
+
+
+@dataclass(eq=False)
+class ScheduledCommandEntity(BaseEntity):
+    command: BaseCommand
+    due_at: datetime
+    attempts: int = 0
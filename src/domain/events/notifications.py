@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from domain.events.base import BaseEvent
+
+
+@dataclass
+class NotificationCreatedEvent(BaseEvent):
+    notification_id: UUID
+    notification_type: str
+    receivers: list[str]
@@ -0,0 +1,81 @@
+from dataclasses import fields
+from datetime import datetime, timezone
+from enum import Enum
+from types import NoneType
+from typing import Any, get_args, get_type_hints
+from uuid import UUID
+
+from domain.commands.base import BaseCommand
+from domain.entities.schedules import ScheduledCommandEntity
+from domain.value_objects.base import BaseVO
+from infrastructure.models.schedules import ScheduledCommandModel
+
+
+def convert_command_to_document(command: BaseCommand) -> dict[str, Any]:
+    return {field.name: _to_generic(getattr(command, field.name)) for field in fields(command)}
+
+
+def convert_document_to_command(command_type: type[BaseCommand], document: dict[str, Any]) -> BaseCommand:
+    hints = get_type_hints(command_type)
+    return command_type(**{
+        field.name: _from_generic(hints[field.name], document[field.name])
+        for field in fields(command_type)
+        if field.name in document
+    })
+
+
+def convert_scheduled_command_entity_to_model(scheduled_command: ScheduledCommandEntity) -> ScheduledCommandModel:
+    return ScheduledCommandModel(
+        id=scheduled_command.id,
+        command_type=scheduled_command.command.__class__.__name__,
+        command=convert_command_to_document(scheduled_command.command),
+        due_at=scheduled_command.due_at,
+        attempts=scheduled_command.attempts,
+        created_at=scheduled_command.created_at,
+    )
+
+
+def convert_scheduled_command_model_to_entity(
+    scheduled_command_model: ScheduledCommandModel,
+    command_types: dict[str, type[BaseCommand]],
+) -> ScheduledCommandEntity:
+    due_at = scheduled_command_model.due_at
+    if due_at.tzinfo is None:
+        due_at = due_at.replace(tzinfo=timezone.utc)
+
+    return ScheduledCommandEntity(
+        id=scheduled_command_model.id,
+        command=convert_document_to_command(
+            command_types[scheduled_command_model.command_type],
+            scheduled_command_model.command,
+        ),
+        due_at=due_at,
+        attempts=scheduled_command_model.attempts,
+        created_at=scheduled_command_model.created_at,
+    )
+
+
+def _to_generic(value: Any) -> Any:
+    if isinstance(value, BaseVO):
+        return value.as_generic()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _from_generic(annotation: Any, value: Any) -> Any:
+    if value is None:
+        return None
+
+    for candidate in get_args(annotation) or (annotation,):
+        if candidate is NoneType or not isinstance(candidate, type):
+            continue
+        if issubclass(candidate, (BaseVO, Enum, UUID)):
+            return candidate(value)
+        if issubclass(candidate, datetime):
+            return datetime.fromisoformat(value)
+    return value
@@ -1,17 +1,60 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from bson import Binary
+
 from domain.entities.notifications import EmailNotificationEntity, SMSNotificationEntity
+from domain.events.base import BaseEvent
 from domain.value_objects.notifications import EmailVO, PhoneNumberVO
-from infrastructure.models.notifications import NotificationModel, NotificationType
+from infrastructure.models.notifications import (
+    NotificationDeliveryModel,
+    NotificationModel,
+    NotificationType,
+    OutboxEventModel,
+)
+from infrastructure.producers.base import SerializedEvent
+
+
+def convert_event_to_outbox_model(event: BaseEvent, topic: str) -> OutboxEventModel:
+    serialized = SerializedEvent.from_event(event, topic)
+    return OutboxEventModel(
+        event_id=serialized.event_id,
+        event_type=serialized.event_type,
+        topic=serialized.topic,
+        body=serialized.body.decode(),
+    )
+
+
+def convert_outbox_document_to_serialized_event(document: dict) -> SerializedEvent:
+    return SerializedEvent(
+        event_id=document['event_id'],
+        event_type=document['event_type'],
+        topic=document['topic'],
+        body=document['body'].encode(),
+    )
 
 
 def convert_notification_entity_to_model(
     notification: EmailNotificationEntity | SMSNotificationEntity,
+    event_topics: dict[type[BaseEvent], str] | None = None,
 ) -> NotificationModel:
+    event_topics = event_topics or {}
     return NotificationModel(
         id=notification.id,
         notification_type=NotificationType.EMAIL if isinstance(notification, EmailNotificationEntity) else NotificationType.SMS,
         sender=notification.sender.as_generic(),
         receivers=[receiver.as_generic() for receiver in notification.receivers],
-        message=notification.text
+        message=notification.text,
+        created_at=notification.created_at,
+        deliveries=[
+            NotificationDeliveryModel(receiver=receiver.as_generic(), updated_at=notification.created_at)
+            for receiver in notification.receivers
+        ],
+        outbox=[
+            convert_event_to_outbox_model(event, event_topics[type(event)])
+            for event in notification.events
+            if type(event) in event_topics
+        ],
     )
 
 
@@ -26,6 +69,7 @@ def convert_notification_model_to_entity(
             subject=None,
             text=notification_model.message,
             html=notification_model.message,
+            created_at=notification_model.created_at,
         )
     elif notification_model.notification_type == NotificationType.SMS:
         return SMSNotificationEntity(
@@ -33,6 +77,33 @@ def convert_notification_model_to_entity(
             sender=PhoneNumberVO(notification_model.sender),
             receivers=[PhoneNumberVO(receiver) for receiver in notification_model.receivers],
             text=notification_model.message,
+            created_at=notification_model.created_at,
         )
     else:
-        raise ValueError
\ No newline at end of file
+        raise ValueError
+
+
+def convert_document_id_to_uuid(document_id: Binary | UUID) -> UUID:
+    return document_id.as_uuid() if isinstance(document_id, Binary) else document_id
+
+
+def convert_notification_document_to_summary(document: dict) -> dict:
+    return {
+        'id': convert_document_id_to_uuid(document['_id']),
+        'notification_type': document['notification_type'],
+        'sender': document['sender'],
+        'receivers': document['receivers'],
+        'created_at': _as_utc(document['created_at']),
+        'deliveries': [
+            {
+                'receiver': delivery['receiver'],
+                'status': delivery['status'],
+                'updated_at': _as_utc(delivery['updated_at']),
+            }
+            for delivery in document.get('deliveries', [])
+        ],
+    }
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
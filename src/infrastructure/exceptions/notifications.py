@@ -27,3 +27,31 @@ class MutuallyExclusiveFlagsException(InfrastructureException):
     @property
     def message(self) -> str:
         return 'Both TLS and SSL flags cannot be set to True at the same time'
+
+
+@dataclass(frozen=True, eq=False)
+class InvalidNotificationTemplateException(InfrastructureException):
+    name: str
+    reason: str
+
+    @property
+    def message(self) -> str:
+        return f'Notification template with name <{self.name}> is invalid: {self.reason}'
+
+
+@dataclass(frozen=True, eq=False)
+class InvalidNotificationCursorException(InfrastructureException):
+    cursor: str
+
+    @property
+    def message(self) -> str:
+        return f'Notification cursor <{self.cursor}> is invalid'
+
+
+@dataclass(frozen=True, eq=False)
+class NotificationBufferFullException(InfrastructureException):
+    max_buffer_size: int
+
+    @property
+    def message(self) -> str:
+        return f'Notification write buffer is full <{self.max_buffer_size}>'
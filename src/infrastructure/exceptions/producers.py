@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from infrastructure.exceptions.base import InfrastructureException
+
+
+@dataclass(frozen=True, eq=False)
+class ProducerOutboxFullException(InfrastructureException):
+    max_size: int
+
+    @property
+    def message(self) -> str:
+        return f'Producer outbox is full ({self.max_size} messages), broker is unavailable'
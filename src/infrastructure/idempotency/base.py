@@ -0,0 +1,69 @@
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BaseIdempotencyStore(ABC):
+    max_cached_keys: int = 100_000
+    cached_keys: OrderedDict[str, None] = field(default_factory=OrderedDict, init=False, repr=False)
+    checks: int = field(default=0, init=False)
+    duplicates: int = field(default=0, init=False)
+    cached_duplicates: int = field(default=0, init=False)
+
+    @property
+    def duplicate_rate(self) -> float:
+        return self.duplicates / self.checks if self.checks else 0.0
+
+    async def start(self):
+        ...
+
+    async def stop(self):
+        ...
+
+    async def claim(self, key: str) -> bool:
+        self.checks += 1
+        if key in self.cached_keys:
+            self.cached_keys.move_to_end(key)
+            self.duplicates += 1
+            self.cached_duplicates += 1
+            return False
+
+        self._remember(key)
+        try:
+            claimed = await self._claim(key)
+        except Exception:
+            self.cached_keys.pop(key, None)
+            raise
+
+        if not claimed:
+            self.duplicates += 1
+        return claimed
+
+    async def complete(self, key: str) -> None:
+        await self._complete(key)
+
+    async def release(self, key: str) -> None:
+        self.cached_keys.pop(key, None)
+        await self._release(key)
+
+    def _remember(self, key: str):
+        self.cached_keys[key] = None
+        if len(self.cached_keys) > self.max_cached_keys:
+            self.cached_keys.popitem(last=False)
+
+    @abstractmethod
+    async def _claim(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def _complete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def _release(self, key: str) -> None:
+        ...
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from infrastructure.idempotency.base import BaseIdempotencyStore
+
+
+@dataclass
+class InMemoryIdempotencyStore(BaseIdempotencyStore):
+    async def _claim(self, key: str) -> bool:
+        return True
+
+    async def _complete(self, key: str) -> None:
+        ...
+
+    async def _release(self, key: str) -> None:
+        ...
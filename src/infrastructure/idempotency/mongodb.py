@@ -0,0 +1,46 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from pymongo.errors import DuplicateKeyError
+
+from infrastructure.idempotency.base import BaseIdempotencyStore
+from infrastructure.models.idempotency import ProcessedMessageModel
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BeanieIdempotencyStore(BaseIdempotencyStore):
+    lease: float = 300.0
+
+    async def _claim(self, key: str) -> bool:
+        now = datetime.now(timezone.utc)
+        try:
+            await ProcessedMessageModel(key=key, claimed_at=now).insert()
+            return True
+        except DuplicateKeyError:
+            pass
+
+        result = await ProcessedMessageModel.get_motor_collection().update_one(
+            {
+                'key': key,
+                'completed': False,
+                'claimed_at': {'$lt': now - timedelta(seconds=self.lease)},
+            },
+            {'$set': {'claimed_at': now}},
+        )
+        if result.modified_count:
+            logger.warning('Reclaimed message \'%s\' after an expired processing lease', key)
+            return True
+        return False
+
+    async def _complete(self, key: str) -> None:
+        await ProcessedMessageModel.get_motor_collection().update_one(
+            {'key': key},
+            {'$set': {'completed': True}},
+        )
+
+    async def _release(self, key: str) -> None:
+        await ProcessedMessageModel.get_motor_collection().delete_one({'key': key, 'completed': False})
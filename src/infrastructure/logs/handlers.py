@@ -0,0 +1,102 @@
+import logging
+import queue
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
+
+import orjson
+
+
+@dataclass(slots=True)
+class LoggerRateLimit:
+    tokens: float
+    updated_at: float
+    suppressed: int = 0
+
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self, rate: float, burst: int = 100, max_level: int = logging.INFO):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.max_level = max_level
+        self.limits: dict[str, LoggerRateLimit] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+
+        now = time.monotonic()
+        limit = self.limits.get(record.name)
+        if limit is None:
+            limit = self.limits[record.name] = LoggerRateLimit(tokens=self.burst, updated_at=now)
+
+        limit.tokens = min(self.burst, limit.tokens + (now - limit.updated_at) * self.rate)
+        limit.updated_at = now
+        if limit.tokens < 1:
+            limit.suppressed += 1
+            return False
+
+        limit.tokens -= 1
+        if limit.suppressed:
+            record.suppressed = limit.suppressed
+            limit.suppressed = 0
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'line': record.lineno,
+            'message': record.getMessage(),
+        }
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            entry['suppressed'] = suppressed
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class LocalQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def configure_logging(
+    level: int,
+    fmt: str,
+    json_output: bool = False,
+    use_queue: bool = True,
+    rate_limit: float = 0.0,
+    rate_limit_burst: int = 100,
+    stream: TextIO | None = None,
+) -> QueueListener | None:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JSONFormatter() if json_output else logging.Formatter(fmt))
+
+    listener = None
+    if use_queue:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        handler = LocalQueueHandler(log_queue)
+
+    if rate_limit > 0:
+        handler.addFilter(RateLimitFilter(rate_limit, rate_limit_burst))
+
+    logging.basicConfig(level=level, handlers=[handler], force=True)
+    if listener:
+        listener.start()
+    return listener
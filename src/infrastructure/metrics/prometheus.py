@@ -0,0 +1,122 @@
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Iterator
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+
+
+STAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+MAX_TRACKED_ROUTING_KEYS = 256
+UNKNOWN_ROUTING_KEY = 'unknown'
+
+
+@dataclass(frozen=True, slots=True)
+class MessageMetrics:
+    consume_to_ack: Histogram
+    template_fetch: Histogram
+    render: Histogram
+    db_insert: Histogram
+    provider_send: Histogram
+    succeeded: Counter
+    failed: Counter
+    in_flight: Gauge
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsCollectors:
+    stage_duration: Histogram
+    messages: Counter
+    messages_in_flight: Gauge
+
+    @classmethod
+    def register(cls, registry: CollectorRegistry = REGISTRY) -> 'MetricsCollectors':
+        return cls(
+            stage_duration=Histogram(
+                'notification_service_stage_duration_seconds',
+                'Duration of message processing stages.',
+                ['routing_key', 'stage'],
+                buckets=STAGE_BUCKETS,
+                registry=registry,
+            ),
+            messages=Counter(
+                'notification_service_messages',
+                'Consumed messages by outcome.',
+                ['routing_key', 'outcome'],
+                registry=registry,
+            ),
+            messages_in_flight=Gauge(
+                'notification_service_messages_in_flight',
+                'Messages currently being processed.',
+                ['routing_key'],
+                registry=registry,
+            ),
+        )
+
+    def bind(self, routing_key: str) -> MessageMetrics:
+        return MessageMetrics(
+            consume_to_ack=self.stage_duration.labels(routing_key, 'consume_to_ack'),
+            template_fetch=self.stage_duration.labels(routing_key, 'template_fetch'),
+            render=self.stage_duration.labels(routing_key, 'render'),
+            db_insert=self.stage_duration.labels(routing_key, 'db_insert'),
+            provider_send=self.stage_duration.labels(routing_key, 'provider_send'),
+            succeeded=self.messages.labels(routing_key, 'succeeded'),
+            failed=self.messages.labels(routing_key, 'failed'),
+            in_flight=self.messages_in_flight.labels(routing_key),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ComponentMetric:
+    name: str
+    documentation: str
+    read: Callable[[], float | dict[str, float]]
+    label: str | None = None
+    counter: bool = False
+
+
+@dataclass(eq=False)
+class ComponentMetricsCollector:
+    metrics: dict[str, ComponentMetric] = field(default_factory=dict)
+
+    def track(self, *metrics: ComponentMetric):
+        for metric in metrics:
+            self.metrics[metric.name] = metric
+
+    def collect(self) -> Iterator[Metric]:
+        for metric in list(self.metrics.values()):
+            metric_family = CounterMetricFamily if metric.counter else GaugeMetricFamily
+            value = metric.read()
+            if metric.label is None:
+                yield metric_family(metric.name, metric.documentation, value=value)
+                continue
+
+            family = metric_family(metric.name, metric.documentation, labels=[metric.label])
+            for label_value, sample in value.items():
+                family.add_metric([label_value], sample)
+            yield family
+
+
+collectors = MetricsCollectors.register()
+component_metrics = ComponentMetricsCollector()
+REGISTRY.register(component_metrics)
+
+_current_message_metrics: ContextVar[MessageMetrics | None] = ContextVar('current_message_metrics', default=None)
+
+
+@lru_cache(MAX_TRACKED_ROUTING_KEYS)
+def get_message_metrics(routing_key: str) -> MessageMetrics:
+    return collectors.bind(routing_key)
+
+
+def get_current_message_metrics() -> MessageMetrics | None:
+    return _current_message_metrics.get()
+
+
+def set_current_message_metrics(metrics: MessageMetrics | None) -> Token:
+    return _current_message_metrics.set(metrics)
+
+
+def reset_current_message_metrics(token: Token):
+    _current_message_metrics.reset(token)
@@ -0,0 +1,36 @@
+from beanie import free_fall_migration
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from infrastructure.models.notifications import NotificationModel, NotificationTemplateModel
+from infrastructure.storages.indexes import build_in_background
+
+
+NOTIFICATION_INDEXES = [
+    IndexModel([('receivers', ASCENDING), ('created_at', DESCENDING)], name='receivers_created_at'),
+    IndexModel([('notification_type', ASCENDING), ('created_at', DESCENDING)], name='notification_type_created_at'),
+]
+NOTIFICATION_TEMPLATE_INDEXES = [
+    IndexModel([('name', ASCENDING)], name='name_unique', unique=True),
+]
+DOCUMENT_MODEL_INDEXES = [
+    (NotificationModel, NOTIFICATION_INDEXES),
+    (NotificationTemplateModel, NOTIFICATION_TEMPLATE_INDEXES),
+]
+
+
+class Forward:
+    @free_fall_migration(document_models=[NotificationModel, NotificationTemplateModel])
+    async def create_notification_indexes(self, session):
+        for document_model, indexes in DOCUMENT_MODEL_INDEXES:
+            await document_model.get_motor_collection().create_indexes(
+                [build_in_background(index) for index in indexes],
+            )
+
+
+class Backward:
+    @free_fall_migration(document_models=[NotificationModel, NotificationTemplateModel])
+    async def drop_notification_indexes(self, session):
+        for document_model, indexes in DOCUMENT_MODEL_INDEXES:
+            collection = document_model.get_motor_collection()
+            for index in indexes:
+                await collection.drop_index(index.document['name'])
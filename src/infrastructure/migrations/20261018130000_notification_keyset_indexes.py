@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+
+from beanie import free_fall_migration
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from infrastructure.models.notifications import NotificationModel
+from infrastructure.storages.indexes import build_in_background
+
+
+KEYSET_INDEXES = [
+    IndexModel(
+        [('receivers', ASCENDING), ('created_at', DESCENDING), ('_id', DESCENDING)],
+        name='receivers_created_at_id',
+    ),
+    IndexModel(
+        [('notification_type', ASCENDING), ('created_at', DESCENDING), ('_id', DESCENDING)],
+        name='notification_type_created_at_id',
+    ),
+    IndexModel([('created_at', DESCENDING), ('_id', DESCENDING)], name='created_at_id'),
+]
+REPLACED_INDEXES = [
+    IndexModel([('receivers', ASCENDING), ('created_at', DESCENDING)], name='receivers_created_at'),
+    IndexModel([('notification_type', ASCENDING), ('created_at', DESCENDING)], name='notification_type_created_at'),
+]
+
+
+class Forward:
+    @free_fall_migration(document_models=[NotificationModel])
+    async def create_keyset_indexes(self, session):
+        collection = NotificationModel.get_motor_collection()
+        await collection.update_many(
+            {'created_at': {'$exists': False}},
+            {'$set': {'created_at': datetime.now(timezone.utc)}},
+        )
+        await collection.create_indexes([build_in_background(index) for index in KEYSET_INDEXES])
+
+        existing_indexes = await collection.index_information()
+        for index in REPLACED_INDEXES:
+            if index.document['name'] in existing_indexes:
+                await collection.drop_index(index.document['name'])
+
+
+class Backward:
+    @free_fall_migration(document_models=[NotificationModel])
+    async def drop_keyset_indexes(self, session):
+        collection = NotificationModel.get_motor_collection()
+        await collection.create_indexes([build_in_background(index) for index in REPLACED_INDEXES])
+        for index in KEYSET_INDEXES:
+            await collection.drop_index(index.document['name'])
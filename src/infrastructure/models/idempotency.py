@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class ProcessedMessageModel(Document):
+    key: str
+    completed: bool = False
+    claimed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    class Settings:
+        name = 'processed_messages'
+        indexes = [
+            IndexModel([('key', ASCENDING)], name='key_unique', unique=True),
+            IndexModel([('claimed_at', ASCENDING)], name='claimed_at_ttl', expireAfterSeconds=7 * 24 * 60 * 60),
+        ]
@@ -1,6 +1,11 @@
+from datetime import datetime, timezone
 from enum import Enum
 from uuid import UUID
 from beanie import Document
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from domain.entities.notifications import DeliveryStatus
 
 
 class NotificationType(Enum):
@@ -8,15 +13,54 @@ class NotificationType(Enum):
     SMS = 'sms'
 
 
+class OutboxEventModel(BaseModel):
+    event_id: str
+    event_type: str
+    topic: str
+    body: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class NotificationDeliveryModel(BaseModel):
+    receiver: str
+    status: DeliveryStatus = DeliveryStatus.QUEUED
+    attempts: int = 0
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    error: str | None = None
+
+
 class NotificationModel(Document):
     id: UUID
     notification_type: NotificationType
     sender: str
     receivers: list[str]
     message: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    deliveries: list[NotificationDeliveryModel] = Field(default_factory=list)
+    outbox: list[OutboxEventModel] = Field(default_factory=list)
 
     class Settings:
         name = 'notifications'
+        indexes = [
+            IndexModel(
+                [('receivers', ASCENDING), ('created_at', DESCENDING), ('_id', DESCENDING)],
+                name='receivers_created_at_id',
+            ),
+            IndexModel(
+                [('notification_type', ASCENDING), ('created_at', DESCENDING), ('_id', DESCENDING)],
+                name='notification_type_created_at_id',
+            ),
+            IndexModel([('created_at', DESCENDING), ('_id', DESCENDING)], name='created_at_id'),
+            IndexModel(
+                [('deliveries.status', ASCENDING), ('deliveries.updated_at', DESCENDING)],
+                name='delivery_status_updated_at',
+            ),
+            IndexModel(
+                [('outbox.created_at', ASCENDING)],
+                name='outbox_pending',
+                partialFilterExpression={'outbox.event_id': {'$exists': True}},
+            ),
+        ]
 
 
 class NotificationTemplateModel(Document):
@@ -26,3 +70,6 @@ class NotificationTemplateModel(Document):
 
     class Settings:
         name = 'notification_templates'
+        indexes = [
+            IndexModel([('name', ASCENDING)], name='name_unique', unique=True),
+        ]
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class ScheduledCommandModel(Document):
+    id: UUID
+    command_type: str
+    command: dict[str, Any]
+    due_at: datetime
+    attempts: int = 0
+    locked_until: datetime | None = None
+    lock_token: str | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    class Settings:
+        name = 'scheduled_commands'
+        indexes = [
+            IndexModel([('due_at', ASCENDING), ('locked_until', ASCENDING)], name='due_at_locked_until'),
+            IndexModel(
+                [('lock_token', ASCENDING)],
+                name='lock_token',
+                partialFilterExpression={'lock_token': {'$type': 'string'}},
+            ),
+        ]
@@ -1,8 +1,29 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable
+
+import orjson
 
 from domain.events.base import BaseEvent
 
 
+@dataclass(frozen=True)
+class SerializedEvent:
+    event_id: str
+    event_type: str
+    topic: str
+    body: bytes
+
+    @classmethod
+    def from_event(cls, event: BaseEvent, topic: str) -> 'SerializedEvent':
+        return cls(
+            event_id=str(event.event_id),
+            event_type=event.__class__.__name__,
+            topic=topic,
+            body=orjson.dumps(event.__dict__),
+        )
+
+
 class BaseProducer(ABC):
     async def __aenter__(self):
         await self.start()
@@ -22,3 +43,10 @@ class BaseProducer(ABC):
     @abstractmethod
     async def publish(self, event: BaseEvent, topic: str):
         ...
+
+    async def publish_many(self, messages: Iterable[tuple[BaseEvent, str]]):
+        await self.publish_serialized(SerializedEvent.from_event(event, topic) for event, topic in messages)
+
+    @abstractmethod
+    async def publish_serialized(self, events: Iterable[SerializedEvent], buffer: bool = True):
+        ...
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymongo import ASCENDING, UpdateOne
+
+from infrastructure.converters.notifications import convert_outbox_document_to_serialized_event
+from infrastructure.models.notifications import NotificationModel
+from infrastructure.producers.base import BaseProducer
+
+
+logger = logging.getLogger(__name__)
+
+PENDING_OUTBOX_FILTER = {'outbox.event_id': {'$exists': True}}
+
+
+@dataclass
+class OutboxRelay:
+    producer: BaseProducer
+    batch_size: int = 100
+    interval: float = 1.0
+    relayed_events: int = field(default=0, init=False)
+    failed_relays: int = field(default=0, init=False)
+    relay_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+
+    async def start(self):
+        if self.relay_task is None:
+            self.relay_task = asyncio.create_task(self._relay_periodically())
+
+    async def stop(self):
+        if self.relay_task:
+            self.relay_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.relay_task
+            self.relay_task = None
+
+    async def relay_once(self) -> int:
+        documents = await self._find_pending()
+        if not documents:
+            return 0
+
+        events = [
+            convert_outbox_document_to_serialized_event(entry)
+            for document in documents
+            for entry in document['outbox']
+        ]
+        try:
+            await self.producer.publish_serialized(events, buffer=False)
+        except Exception:
+            self.failed_relays += 1
+            raise
+
+        await self._acknowledge({
+            document['_id']: [entry['event_id'] for entry in document['outbox']]
+            for document in documents
+        })
+        self.relayed_events += len(events)
+        logger.debug('Relayed %d outbox events from %d notifications', len(events), len(documents))
+        return len(documents)
+
+    async def _find_pending(self) -> list[dict[str, Any]]:
+        cursor = (
+            NotificationModel.get_motor_collection()
+            .find(PENDING_OUTBOX_FILTER, {'outbox': 1})
+            .sort('outbox.created_at', ASCENDING)
+            .limit(self.batch_size)
+        )
+        return await cursor.to_list(length=self.batch_size)
+
+    async def _acknowledge(self, event_ids: dict[Any, list[str]]):
+        await NotificationModel.get_motor_collection().bulk_write(
+            [
+                UpdateOne({'_id': notification_id}, {'$pull': {'outbox': {'event_id': {'$in': ids}}}})
+                for notification_id, ids in event_ids.items()
+            ],
+            ordered=False,
+        )
+
+    async def _relay_periodically(self):
+        while True:
+            try:
+                if await self.relay_once() >= self.batch_size:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning('Failed to relay outbox events: %s', str(e))
+            await asyncio.sleep(self.interval)
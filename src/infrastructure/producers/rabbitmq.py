@@ -1,8 +1,13 @@
+import asyncio
 import logging
-from dataclasses import dataclass
+import time
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import Iterable
 
 import aio_pika
-import orjson
 from aio_pika.abc import (
     AbstractRobustConnection,
     AbstractRobustChannel,
@@ -11,7 +16,8 @@ from aio_pika.abc import (
 )
 
 from domain.events.base import BaseEvent
-from infrastructure.producers.base import BaseProducer
+from infrastructure.exceptions.producers import ProducerOutboxFullException
+from infrastructure.producers.base import BaseProducer, SerializedEvent
 
 
 logger = logging.getLogger(__name__)
@@ -28,7 +34,17 @@ class RabbitMQProducer(BaseProducer):
     connection: AbstractRobustConnection | None = None
     channel: AbstractRobustChannel | None = None
     exchange: AbstractExchange | None = None
-
+    publish_batch_size: int = 100
+    outbox_max_size: int = 10000
+    outbox_flush_interval: float = 1.0
+    outbox: deque[SerializedEvent] = field(default_factory=deque, init=False, repr=False)
+    outbox_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _outbox_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    published_count: int = field(default=0, init=False)
+    pending_confirms: int = field(default=0, init=False)
+    last_publish_latency: float = field(default=0.0, init=False)
+    last_confirm_lag: float = field(default=0.0, init=False)
+    max_confirm_lag: float = field(default=0.0, init=False)
 
     async def start(self):
         logger.info(
@@ -46,7 +62,7 @@ class RabbitMQProducer(BaseProducer):
             )
             logger.debug('RabbitMQ connection established')
 
-            self.channel = await self.connection.channel()
+            self.channel = await self.connection.channel(publisher_confirms=True)
             logger.debug('RabbitMQ channel created')
 
             self.exchange = await self.channel.declare_exchange(
@@ -60,13 +76,23 @@ class RabbitMQProducer(BaseProducer):
             raise
 
     async def stop(self):
+        if self.outbox:
+            await self.flush_outbox()
+        if self.outbox_task:
+            self.outbox_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.outbox_task
+            self.outbox_task = None
+        if self.outbox:
+            logger.error('Dropping %d unpublished messages from the outbox', len(self.outbox))
+
         logger.info('Closing RabbitMQ connections')
         try:
-            if hasattr(self, 'channel') and self.channel:
+            if self.channel:
                 logger.debug('Closing RabbitMQ channel')
                 await self.channel.close()
 
-            if hasattr(self, 'connection') and self.connection:
+            if self.connection:
                 logger.debug('Closing RabbitMQ connection')
                 await self.connection.close()
 
@@ -76,30 +102,100 @@ class RabbitMQProducer(BaseProducer):
             raise
 
     async def publish(self, event: BaseEvent, topic: str):
-        logger.debug('Publishing %s event to topic \'%s\'', event.__class__.__name__, topic)
-
-        if not hasattr(self, 'connection') or not self.connection or not hasattr(self, 'exchange') or not self.exchange:
-            logger.debug('RabbitMQ connection not established, starting connection')
-            await self.start()
-
+        await self.publish_many([(event, topic)])
+
+    async def publish_serialized(self, events: Iterable[SerializedEvent], buffer: bool = True):
+        failed, error = await self._publish_all(list(events))
+        if failed:
+            self._buffer_or_raise(failed, error, buffer)
+
+    async def flush_outbox(self):
+        async with self._outbox_lock:
+            events = list(self.outbox)
+            if not events:
+                return
+
+            logger.info('Republishing %d messages from the outbox', len(events))
+            failed, error = await self._publish_all(events)
+            for _ in events:
+                self.outbox.popleft()
+            self.outbox.extendleft(reversed(failed))
+            if failed:
+                logger.error('Failed to flush %d of %d outbox messages: %s', len(failed), len(events), str(error))
+
+    async def _publish_all(
+        self,
+        events: list[SerializedEvent],
+    ) -> tuple[list[SerializedEvent], BaseException | None]:
+        started_at = time.perf_counter()
+        try:
+            if self.exchange is None:
+                logger.debug('RabbitMQ connection not established, starting connection')
+                await self.start()
+        except Exception as e:
+            return events, e
+
+        failed: list[SerializedEvent] = []
+        error: BaseException | None = None
+        for batch in batched(events, self.publish_batch_size):
+            results = await asyncio.gather(
+                *(self._publish_confirmed(event) for event in batch),
+                return_exceptions=True,
+            )
+            for event, result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    failed.append(event)
+                    error = result
+
+        self.last_publish_latency = time.perf_counter() - started_at
+        return failed, error
+
+    async def _publish_confirmed(self, event: SerializedEvent):
+        logger.debug('Publishing %s event to topic \'%s\'', event.event_type, event.topic)
+        self.pending_confirms += 1
+        started_at = time.perf_counter()
         try:
             await self.exchange.publish(
                 aio_pika.Message(
-                    body=orjson.dumps(event.__dict__),
+                    body=event.body,
                     content_type='application/json',
+                    message_id=event.event_id,
                 ),
-                routing_key=topic,
-            )
-            logger.info(
-                'Published %s event to topic \'%s\'',
-                event.__class__.__name__,
-                topic,
+                routing_key=event.topic,
             )
         except Exception as e:
             logger.exception(
                 'Failed to publish %s event to topic \'%s\': %s',
-                event.__class__.__name__,
-                topic,
+                event.event_type,
+                event.topic,
                 str(e)
             )
             raise
+        finally:
+            self.pending_confirms -= 1
+
+        self.last_confirm_lag = time.perf_counter() - started_at
+        self.max_confirm_lag = max(self.max_confirm_lag, self.last_confirm_lag)
+        self.published_count += 1
+        logger.info(
+            'Published %s event to topic \'%s\'',
+            event.event_type,
+            event.topic,
+        )
+
+    def _buffer_or_raise(self, events: list[SerializedEvent], error: BaseException, buffer: bool = True):
+        if not buffer or not self.outbox_max_size:
+            raise error
+        if len(self.outbox) + len(events) > self.outbox_max_size:
+            raise ProducerOutboxFullException(max_size=self.outbox_max_size) from error
+
+        self.outbox.extend(events)
+        logger.warning('Buffered %d messages in the producer outbox (%d total)', len(events), len(self.outbox))
+        if self.outbox_task is None:
+            self.outbox_task = asyncio.create_task(self._flush_outbox_periodically())
+
+    async def _flush_outbox_periodically(self):
+        while True:
+            await asyncio.sleep(self.outbox_flush_interval)
+            if self.outbox:
+                await self.flush_outbox()
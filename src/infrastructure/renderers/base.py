@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class RenderedNotificationTemplate:
+    text: str
+    html: str | None = None
+
+
+class BaseCompiledNotificationTemplate(ABC):
+    @abstractmethod
+    def render(self, variables: dict[str, str]) -> RenderedNotificationTemplate:
+        ...
+
+
+class BaseNotificationTemplateRenderer(ABC):
+    @abstractmethod
+    def compile(
+        self,
+        template: dict[str, str | None],
+        variables: Iterable[str],
+    ) -> BaseCompiledNotificationTemplate:
+        ...
+
+    def render(
+        self,
+        template: dict[str, str | None],
+        variables: dict[str, str],
+    ) -> RenderedNotificationTemplate:
+        return self.compile(template, variables.keys()).render(variables)
@@ -0,0 +1,120 @@
+import hashlib
+import html
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from infrastructure.exceptions.notifications import InvalidNotificationTemplateException
+from infrastructure.renderers.base import (
+    BaseCompiledNotificationTemplate,
+    BaseNotificationTemplateRenderer,
+    RenderedNotificationTemplate,
+)
+
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_PATTERN = re.compile(r'%(?:\((?P<name>[^)]*)\)(?P<conversion>.)?|(?P<escaped>%)|(?P<invalid>.?))', re.DOTALL)
+
+Segments = tuple[str | None, ...]
+
+
+def parse_template(name: str, template: str) -> tuple[Segments, frozenset[str]]:
+    # Even positions hold literal text, odd positions hold placeholder names.
+    segments: list[str | None] = []
+    placeholders: set[str] = set()
+    literal: list[str] = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(template):
+        literal.append(template[position:match.start()])
+        position = match.end()
+        if match['escaped']:
+            literal.append('%')
+            continue
+        if match['invalid'] is not None or match['conversion'] != 's' or not match['name']:
+            raise InvalidNotificationTemplateException(name=name, reason=f'unsupported placeholder {match[0]!r}')
+        segments.extend((''.join(literal), match['name']))
+        placeholders.add(match['name'])
+        literal.clear()
+    literal.append(template[position:])
+    segments.append(''.join(literal))
+    return tuple(segments), frozenset(placeholders)
+
+
+def get_template_version(template: dict[str, str | None]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (template['text_template'], template.get('html_template') or ''):
+        digest.update(part.encode())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledNotificationTemplate(BaseCompiledNotificationTemplate):
+    name: str
+    version: str
+    text_segments: Segments
+    html_segments: Segments | None
+    placeholders: frozenset[str]
+
+    def render(self, variables: dict[str, str]) -> RenderedNotificationTemplate:
+        try:
+            text = self._render_segments(self.text_segments, variables)
+            if self.html_segments is None:
+                return RenderedNotificationTemplate(text=text)
+
+            escaped_variables = {key: html.escape(str(variables[key])) for key in self.placeholders}
+        except KeyError as e:
+            raise InvalidNotificationTemplateException(name=self.name, reason=f'unknown placeholder {e}') from None
+        return RenderedNotificationTemplate(
+            text=text,
+            html=self._render_segments(self.html_segments, escaped_variables),
+        )
+
+    @staticmethod
+    def _render_segments(segments: Segments, variables: dict[str, str]) -> str:
+        return ''.join(
+            segment if index % 2 == 0 else str(variables[segment])
+            for index, segment in enumerate(segments)
+        )
+
+
+@dataclass
+class CompiledNotificationTemplateRenderer(BaseNotificationTemplateRenderer):
+    compiled_templates: dict[str, CompiledNotificationTemplate] = field(default_factory=dict)
+
+    def compile(
+        self,
+        template: dict[str, str | None],
+        variables: Iterable[str],
+    ) -> CompiledNotificationTemplate:
+        version = template.get('version') or get_template_version(template)
+        compiled = self.compiled_templates.get(template['name'])
+        if compiled is None or compiled.version != version:
+            compiled = self._compile(template, version)
+            missing = compiled.placeholders.difference(variables)
+            if missing:
+                raise InvalidNotificationTemplateException(
+                    name=compiled.name,
+                    reason=f'unknown placeholders {", ".join(sorted(missing))}',
+                )
+            self.compiled_templates[template['name']] = compiled
+        return compiled
+
+    @staticmethod
+    def _compile(template: dict[str, str | None], version: str) -> CompiledNotificationTemplate:
+        name = template['name']
+        logger.debug('Compiling notification template \'%s\' (version %s)', name, version)
+        text_segments, placeholders = parse_template(name, template['text_template'])
+        html_segments = None
+        if template.get('html_template'):
+            html_segments, html_placeholders = parse_template(name, template['html_template'])
+            placeholders |= html_placeholders
+        return CompiledNotificationTemplate(
+            name=name,
+            version=version,
+            text_segments=text_segments,
+            html_segments=html_segments,
+            placeholders=placeholders,
+        )
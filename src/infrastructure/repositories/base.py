@@ -1,17 +1,62 @@
 import logging
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Iterable
 from uuid import UUID
 
-from domain.entities.notifications import EmailNotificationEntity, SMSNotificationEntity
+from domain.entities.notifications import DeliveryStatus, EmailNotificationEntity, SMSNotificationEntity
+from domain.entities.schedules import ScheduledCommandEntity
+from infrastructure.repositories.queries import NotificationCursor, NotificationFilters
+from infrastructure.tracing.otel import trace_methods
 
 
 logger = logging.getLogger(__name__)
 
+_scoped_notifications: ContextVar[set[EmailNotificationEntity | SMSNotificationEntity] | None] = ContextVar(
+    'scoped_notifications',
+    default=None,
+)
+
+
+@dataclass
+class NotificationScope:
+    notifications: set[EmailNotificationEntity | SMSNotificationEntity] = field(default_factory=set)
+    token: Token | None = field(default=None, init=False, repr=False)
+
+    def __enter__(self) -> set[EmailNotificationEntity | SMSNotificationEntity]:
+        scoped_notifications = _scoped_notifications.get()
+        if scoped_notifications is not None:
+            return scoped_notifications
+
+        self.token = _scoped_notifications.set(self.notifications)
+        return self.notifications
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.token is not None:
+            _scoped_notifications.reset(self.token)
+            self.token = None
+            self.notifications.clear()
+
 
 @dataclass
 class BaseNotificationRepository(ABC):
-    loaded_notifications: set[EmailNotificationEntity | SMSNotificationEntity] = field(default_factory=set, kw_only=True)
+    unscoped_notifications: set[EmailNotificationEntity | SMSNotificationEntity] = field(default_factory=set, kw_only=True)
+
+    @property
+    def loaded_notifications(self) -> set[EmailNotificationEntity | SMSNotificationEntity]:
+        scoped_notifications = _scoped_notifications.get()
+        return self.unscoped_notifications if scoped_notifications is None else scoped_notifications
+
+    async def start(self):
+        ...
+
+    async def stop(self):
+        ...
+
+    def scope(self) -> NotificationScope:
+        return NotificationScope()
 
     @abstractmethod
     async def add(
@@ -27,9 +72,20 @@ class BaseNotificationRepository(ABC):
     ) -> EmailNotificationEntity | SMSNotificationEntity:
         ...
 
+    @abstractmethod
+    async def update_delivery_status(
+        self,
+        notification_id: UUID,
+        status: DeliveryStatus,
+        receivers: Iterable[str] | None = None,
+        error: str | None = None,
+    ) -> None:
+        ...
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         logger.debug('Initializing repository subclass: %s', cls.__name__)
+        trace_methods(cls, ('add', 'get', 'update_delivery_status'))
 
         add = cls.add
         get = cls.get
@@ -58,6 +114,12 @@ class BaseNotificationRepository(ABC):
 
 
 class BaseNotificationTemplateRepository(ABC):
+    async def start(self):
+        ...
+
+    async def stop(self):
+        ...
+
     @abstractmethod
     async def add(
         self,
@@ -73,3 +135,71 @@ class BaseNotificationTemplateRepository(ABC):
         name: str,
     ) -> dict[str, str]:
         ...
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, ('add', 'get'))
+
+
+class BaseNotificationQueryRepository(ABC):
+    @abstractmethod
+    def find(
+        self,
+        filters: NotificationFilters,
+        limit: int,
+        cursor: NotificationCursor | None = None,
+    ) -> AsyncIterator[dict]:
+        ...
+
+
+class BaseScheduledCommandRepository(ABC):
+    @abstractmethod
+    async def add(
+        self,
+        scheduled_command: ScheduledCommandEntity,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def claim_due(
+        self,
+        until: datetime,
+        limit: int,
+        lease: float,
+    ) -> list[ScheduledCommandEntity]:
+        ...
+
+    @abstractmethod
+    async def reschedule(
+        self,
+        scheduled_command_id: UUID,
+        due_at: datetime,
+        attempts: int,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def renew(
+        self,
+        scheduled_command_ids: list[UUID],
+        lease: float,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def release(
+        self,
+        scheduled_command_ids: list[UUID],
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def remove(
+        self,
+        scheduled_command_id: UUID,
+    ) -> None:
+        ...
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, ('add', 'claim_due', 'reschedule', 'renew', 'release', 'remove'))
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable
+from uuid import UUID
+
+from pymongo.errors import BulkWriteError
+
+from domain.entities.notifications import (
+    DeliveryStatus,
+    EmailNotificationEntity,
+    SMSNotificationEntity,
+    is_delivery_status_transition_allowed,
+)
+from infrastructure.converters.notifications import (
+    convert_document_id_to_uuid,
+    convert_notification_entity_to_model,
+    convert_notification_model_to_entity,
+)
+from infrastructure.exceptions.notifications import NotificationBufferFullException
+from infrastructure.models.notifications import NotificationModel
+from infrastructure.repositories.mongodb import BeanieNotificationRepository
+
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+TRANSIENT_WRITE_ERROR_CODES = frozenset({6, 7, 89, 91, 189, 262, 9001, 10107, 11600, 11602, 13435, 13436})
+
+
+@dataclass
+class BufferedBeanieNotificationRepository(BeanieNotificationRepository):
+    flush_size: int = 100
+    flush_interval: float = 0.5
+    max_buffer_size: int = 10000
+    buffer: dict[UUID, NotificationModel] = field(default_factory=dict, init=False, repr=False)
+    flushing: dict[UUID, NotificationModel] = field(default_factory=dict, init=False, repr=False)
+    flushes: int = field(default=0, init=False)
+    flushed_notifications: int = field(default=0, init=False)
+    failed_flushes: int = field(default=0, init=False)
+    dropped_notifications: int = field(default=0, init=False)
+    last_flush_duration: float = field(default=0.0, init=False)
+    max_flush_duration: float = field(default=0.0, init=False)
+    flush_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _flush_requested: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    _flush_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+    @property
+    def buffer_size(self) -> int:
+        return len(self.buffer)
+
+    async def start(self):
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self):
+        if self.flush_task:
+            self.flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.flush_task
+            self.flush_task = None
+        await self.flush()
+        if self.buffer:
+            logger.error('%d notifications were not persisted on shutdown', len(self.buffer))
+
+    async def add(
+        self,
+        notification: EmailNotificationEntity | SMSNotificationEntity,
+    ) -> None:
+        if self.flush_task is None:
+            return await super().add(notification)
+
+        logger.debug('Buffering notification with ID \'%s\'', notification.id)
+        if notification.id in self.buffer:
+            return
+        if len(self.buffer) + len(self.flushing) >= self.max_buffer_size:
+            self._flush_requested.set()
+            raise NotificationBufferFullException(max_buffer_size=self.max_buffer_size)
+
+        self.buffer[notification.id] = convert_notification_entity_to_model(notification, self.event_topics)
+        if len(self.buffer) >= self.flush_size:
+            self._flush_requested.set()
+
+    async def get(
+        self,
+        notification_id: UUID,
+    ) -> EmailNotificationEntity | SMSNotificationEntity:
+        buffered = self.buffer.get(notification_id)
+        if buffered is not None:
+            logger.debug('Notification with ID \'%s\' found in write buffer', notification_id)
+            return convert_notification_model_to_entity(buffered)
+        return await super().get(notification_id)
+
+    async def update_delivery_status(
+        self,
+        notification_id: UUID,
+        status: DeliveryStatus,
+        receivers: Iterable[str] | None = None,
+        error: str | None = None,
+    ) -> None:
+        if notification_id in self.flushing:
+            async with self._flush_lock:
+                pass
+
+        buffered = self.buffer.get(notification_id)
+        if buffered is None:
+            return await super().update_delivery_status(notification_id, status, receivers, error)
+
+        receivers = None if receivers is None else set(receivers)
+        now = datetime.now(timezone.utc)
+        for delivery in buffered.deliveries:
+            if receivers is not None and delivery.receiver not in receivers:
+                continue
+            if not is_delivery_status_transition_allowed(delivery.status, status):
+                continue
+            delivery.status = status
+            delivery.updated_at = now
+            delivery.error = error
+            if status is DeliveryStatus.SENDING:
+                delivery.attempts += 1
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self.buffer:
+                return
+
+            documents = self.flushing = self.buffer
+            self.buffer = {}
+            started_at = time.perf_counter()
+            try:
+                await self._insert_many(list(documents.values()))
+            except BulkWriteError as e:
+                write_errors = {
+                    convert_document_id_to_uuid(error['op']['_id']): error
+                    for error in e.details.get('writeErrors', [])
+                }
+                await self._merge_deliveries([
+                    documents[notification_id]
+                    for notification_id, error in write_errors.items()
+                    if error['code'] == DUPLICATE_KEY_ERROR_CODE and notification_id in documents
+                ])
+                failed_documents = {
+                    notification_id: documents[notification_id]
+                    for notification_id, error in write_errors.items()
+                    if error['code'] in TRANSIENT_WRITE_ERROR_CODES and notification_id in documents
+                }
+                dropped = 0
+                for notification_id, error in write_errors.items():
+                    if error['code'] in TRANSIENT_WRITE_ERROR_CODES or error['code'] == DUPLICATE_KEY_ERROR_CODE:
+                        continue
+                    if notification_id in documents:
+                        dropped += 1
+                        logger.error(
+                            'Dropping buffered notification with ID \'%s\' rejected by MongoDB: %s',
+                            notification_id,
+                            error.get('errmsg'),
+                        )
+                self._requeue(failed_documents)
+                self.dropped_notifications += dropped
+                self.flushed_notifications += len(documents) - len(failed_documents) - dropped
+                if failed_documents:
+                    logger.error('Failed to persist %d of %d buffered notifications', len(failed_documents), len(documents))
+            except Exception as e:
+                self._requeue(documents)
+                logger.exception('Failed to flush %d buffered notifications: %s', len(documents), str(e))
+            else:
+                self.flushed_notifications += len(documents)
+            finally:
+                self.flushing = {}
+                self.flushes += 1
+                self.last_flush_duration = time.perf_counter() - started_at
+                self.max_flush_duration = max(self.max_flush_duration, self.last_flush_duration)
+                logger.debug('Flushed %d notifications in %.3fs', len(documents), self.last_flush_duration)
+
+    async def _insert_many(self, documents: list[NotificationModel]) -> None:
+        await NotificationModel.insert_many(documents, ordered=False)
+
+    async def _merge_deliveries(self, documents: list[NotificationModel]):
+        # A duplicate is a retried notification whose document is already stored;
+        # its buffered deliveries carry the attempts made since, so fold them into the stored ones.
+        for document in documents:
+            for delivery in document.deliveries:
+                if not delivery.attempts:
+                    continue
+                try:
+                    await NotificationModel.find_one(NotificationModel.id == document.id).update(
+                        {
+                            '$set': {
+                                'deliveries.$[delivery].status': delivery.status.value,
+                                'deliveries.$[delivery].updated_at': delivery.updated_at,
+                                'deliveries.$[delivery].error': delivery.error,
+                            },
+                            '$inc': {'deliveries.$[delivery].attempts': delivery.attempts},
+                        },
+                        array_filters=[{'delivery.receiver': delivery.receiver}],
+                    )
+                except Exception as e:
+                    logger.exception('Error merging deliveries of notification with ID \'%s\': %s', document.id, str(e))
+
+    def _requeue(self, documents: dict[UUID, NotificationModel]):
+        if documents:
+            self.failed_flushes += 1
+        self.buffer = documents | self.buffer
+
+    async def _flush_periodically(self):
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            self._flush_requested.clear()
+            await self.flush()
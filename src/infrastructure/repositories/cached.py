@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+
+from infrastructure.models.notifications import NotificationTemplateModel
+from infrastructure.renderers.compiled import get_template_version
+from infrastructure.repositories.base import BaseNotificationTemplateRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedNotificationTemplateRepository(BaseNotificationTemplateRepository):
+    repo: BaseNotificationTemplateRepository
+    ttl: float = 300.0
+    watch_changes: bool = False
+    entries: dict[str, tuple[float, dict[str, str]]] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    watch_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _loading: dict[str, asyncio.Future] = field(default_factory=dict, init=False, repr=False)
+
+    async def start(self):
+        await self.repo.start()
+        if self.watch_changes and self.watch_task is None:
+            self.watch_task = asyncio.create_task(self._watch_template_changes())
+
+    async def stop(self):
+        if self.watch_task:
+            self.watch_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.watch_task
+            self.watch_task = None
+        await self.repo.stop()
+
+    async def add(
+        self,
+        name: str,
+        text_template: str,
+        html_template: str | None = None,
+    ) -> None:
+        await self.repo.add(name=name, text_template=text_template, html_template=html_template)
+        self.invalidate(name)
+
+    async def get(
+        self,
+        name: str,
+    ) -> dict[str, str]:
+        entry = self.entries.get(name)
+        if entry and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        loading = self._loading.get(name)
+        if loading is not None:
+            try:
+                return await asyncio.shield(loading)
+            except asyncio.CancelledError:
+                if not loading.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            return await self.get(name)
+
+        self._loading[name] = loading = asyncio.get_running_loop().create_future()
+        try:
+            template = await self.repo.get(name)
+            template = template | {'version': get_template_version(template)}
+        except Exception as e:
+            loading.set_exception(e)
+            loading.exception()
+            raise
+        else:
+            self.entries[name] = (time.monotonic() + self.ttl, template)
+            loading.set_result(template)
+            return template
+        finally:
+            if not loading.done():
+                loading.cancel()
+            del self._loading[name]
+
+    def invalidate(self, name: str | None = None) -> None:
+        if name is None:
+            logger.debug('Invalidating all cached notification templates')
+            self.entries.clear()
+        else:
+            logger.debug('Invalidating cached notification template \'%s\'', name)
+            self.entries.pop(name, None)
+
+    async def _watch_template_changes(self):
+        collection = NotificationTemplateModel.get_motor_collection()
+        while True:
+            try:
+                async with collection.watch(full_document='updateLookup') as stream:
+                    logger.info('Watching notification template changes')
+                    async for change in stream:
+                        template = change.get('fullDocument')
+                        self.invalidate(template['name'] if template else None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning('Notification template change stream failed: %s', str(e))
+                self.invalidate()
+                await asyncio.sleep(self.ttl)
@@ -1,26 +1,73 @@
 import logging
-from uuid import UUID
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Iterable
+from uuid import UUID, uuid4
 
-from domain.entities.notifications import EmailNotificationEntity, SMSNotificationEntity
-from infrastructure.converters.notifications import convert_notification_entity_to_model, convert_notification_model_to_entity
+from beanie.operators import In
+from bson import Binary
+from pymongo import DESCENDING
+from pymongo.errors import DuplicateKeyError
+
+from domain.commands.base import BaseCommand
+from domain.entities.notifications import (
+    DELIVERY_STATUS_TRANSITIONS,
+    DeliveryStatus,
+    EmailNotificationEntity,
+    SMSNotificationEntity,
+)
+from domain.entities.schedules import ScheduledCommandEntity
+from domain.events.base import BaseEvent
+from infrastructure.converters.commands import (
+    convert_scheduled_command_entity_to_model,
+    convert_scheduled_command_model_to_entity,
+)
+from infrastructure.converters.notifications import (
+    convert_notification_document_to_summary,
+    convert_notification_entity_to_model,
+    convert_notification_model_to_entity,
+)
 from infrastructure.exceptions.notifications import NotificationTemplateNotFoundException, NotificationNotFoundException
 from infrastructure.models.notifications import NotificationTemplateModel, NotificationModel
-from infrastructure.repositories.base import BaseNotificationRepository, BaseNotificationTemplateRepository
+from infrastructure.models.schedules import ScheduledCommandModel
+from infrastructure.repositories.base import (
+    BaseNotificationQueryRepository,
+    BaseNotificationRepository,
+    BaseNotificationTemplateRepository,
+    BaseScheduledCommandRepository,
+)
+from infrastructure.repositories.queries import NotificationCursor, NotificationFilters
 
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_SUMMARY_PROJECTION = {
+    'notification_type': 1,
+    'sender': 1,
+    'receivers': 1,
+    'created_at': 1,
+    'deliveries.receiver': 1,
+    'deliveries.status': 1,
+    'deliveries.updated_at': 1,
+}
+NOTIFICATION_KEYSET_SORT = [('created_at', DESCENDING), ('_id', DESCENDING)]
+
 
+@dataclass
 class BeanieNotificationRepository(BaseNotificationRepository):
+    event_topics: dict[type[BaseEvent], str] = field(default_factory=dict)
+
     async def add(
         self,
         notification: EmailNotificationEntity | SMSNotificationEntity,
     ) -> None:
         logger.debug('Adding notification with ID \'%s\'', notification.id)
         try:
-            notification = convert_notification_entity_to_model(notification)
+            notification = convert_notification_entity_to_model(notification, self.event_topics)
             await notification.insert()
             logger.debug('Notification with ID \'%s\' added to DB', notification.id)
+        except DuplicateKeyError:
+            logger.debug('Notification with ID \'%s\' already exists, keeping its delivery history', notification.id)
         except Exception as e:
             logger.exception('Error adding notification with ID \'%s\': %s', notification.id, str(e))
             raise
@@ -42,6 +89,83 @@ class BeanieNotificationRepository(BaseNotificationRepository):
             logger.exception('Error retrieving notification with ID \'%s\': %s', notification_id, str(e))
             raise
 
+    async def update_delivery_status(
+        self,
+        notification_id: UUID,
+        status: DeliveryStatus,
+        receivers: Iterable[str] | None = None,
+        error: str | None = None,
+    ) -> None:
+        logger.debug('Marking notification with ID \'%s\' as %s', notification_id, status.value)
+        update = {
+            '$set': {
+                'deliveries.$[delivery].status': status.value,
+                'deliveries.$[delivery].updated_at': datetime.now(timezone.utc),
+                'deliveries.$[delivery].error': error,
+            },
+        }
+        if status is DeliveryStatus.SENDING:
+            update['$inc'] = {'deliveries.$[delivery].attempts': 1}
+
+        delivery_filter = {
+            'delivery.status': {'$in': [previous.value for previous in DELIVERY_STATUS_TRANSITIONS[status]]},
+        }
+        if receivers is not None:
+            delivery_filter['delivery.receiver'] = {'$in': list(receivers)}
+
+        try:
+            await NotificationModel.find_one(NotificationModel.id == notification_id).update(
+                update,
+                array_filters=[delivery_filter],
+            )
+        except Exception as e:
+            logger.exception('Error updating delivery status of notification with ID \'%s\': %s', notification_id, str(e))
+            raise
+
+
+@dataclass
+class BeanieNotificationQueryRepository(BaseNotificationQueryRepository):
+    batch_size: int = 500
+
+    async def find(
+        self,
+        filters: NotificationFilters,
+        limit: int,
+        cursor: NotificationCursor | None = None,
+    ) -> AsyncIterator[dict]:
+        documents = (
+            NotificationModel.get_motor_collection()
+            .find(self.build_query(filters, cursor), NOTIFICATION_SUMMARY_PROJECTION)
+            .sort(NOTIFICATION_KEYSET_SORT)
+            .limit(limit)
+            .batch_size(min(limit, self.batch_size))
+        )
+        async for document in documents:
+            yield convert_notification_document_to_summary(document)
+
+    @staticmethod
+    def build_query(filters: NotificationFilters, cursor: NotificationCursor | None = None) -> dict:
+        query = {}
+        if filters.receiver is not None:
+            query['receivers'] = filters.receiver
+        if filters.notification_type is not None:
+            query['notification_type'] = filters.notification_type.value
+
+        created_at = {}
+        if filters.created_after is not None:
+            created_at['$gte'] = filters.created_after
+        if filters.created_before is not None:
+            created_at['$lt'] = filters.created_before
+        if created_at:
+            query['created_at'] = created_at
+
+        if cursor is not None:
+            query['$or'] = [
+                {'created_at': {'$lt': cursor.created_at}},
+                {'created_at': cursor.created_at, '_id': {'$lt': Binary.from_uuid(cursor.id)}},
+            ]
+        return query
+
 
 class BeanieNotificationTemplateRepository(BaseNotificationTemplateRepository):
     async def add(
@@ -84,3 +208,96 @@ class BeanieNotificationTemplateRepository(BaseNotificationTemplateRepository):
         except Exception as e:
             logger.exception('Error retrieving notification template with name \'%s\': %s', name, str(e))
             raise
+
+
+
+@dataclass
+class BeanieScheduledCommandRepository(BaseScheduledCommandRepository):
+    command_types: dict[str, type[BaseCommand]] = field(default_factory=dict)
+
+    async def add(
+        self,
+        scheduled_command: ScheduledCommandEntity,
+    ) -> None:
+        logger.debug('Scheduling command with ID \'%s\' at %s', scheduled_command.id, scheduled_command.due_at)
+        try:
+            await convert_scheduled_command_entity_to_model(scheduled_command).insert()
+        except DuplicateKeyError:
+            logger.debug('Command with ID \'%s\' is already scheduled', scheduled_command.id)
+        except Exception as e:
+            logger.exception('Error scheduling command with ID \'%s\': %s', scheduled_command.id, str(e))
+            raise
+
+    async def claim_due(
+        self,
+        until: datetime,
+        limit: int,
+        lease: float,
+    ) -> list[ScheduledCommandEntity]:
+        now = datetime.now(timezone.utc)
+        claimable = {
+            'due_at': {'$lte': until},
+            '$or': [{'locked_until': None}, {'locked_until': {'$lt': now}}],
+        }
+        collection = ScheduledCommandModel.get_motor_collection()
+        candidates = await collection.find(claimable, {'_id': 1}).sort('due_at', 1).limit(limit).to_list(length=limit)
+        if not candidates:
+            return []
+
+        lock_token = uuid4().hex
+        await collection.update_many(
+            {'_id': {'$in': [candidate['_id'] for candidate in candidates]}, **claimable},
+            {'$set': {'locked_until': now + timedelta(seconds=lease), 'lock_token': lock_token}},
+        )
+        claimed = await ScheduledCommandModel.find(ScheduledCommandModel.lock_token == lock_token).to_list()
+        logger.debug('Claimed %d of %d due scheduled commands', len(claimed), len(candidates))
+
+        scheduled_commands = []
+        for scheduled_command in claimed:
+            if scheduled_command.command_type not in self.command_types:
+                logger.error(
+                    'Unknown command type \'%s\' of scheduled command with ID \'%s\'',
+                    scheduled_command.command_type,
+                    scheduled_command.id,
+                )
+                continue
+            scheduled_commands.append(convert_scheduled_command_model_to_entity(scheduled_command, self.command_types))
+        return scheduled_commands
+
+    async def reschedule(
+        self,
+        scheduled_command_id: UUID,
+        due_at: datetime,
+        attempts: int,
+    ) -> None:
+        await ScheduledCommandModel.find_one(ScheduledCommandModel.id == scheduled_command_id).update(
+            {'$set': {'due_at': due_at, 'attempts': attempts, 'locked_until': None, 'lock_token': None}},
+        )
+
+    async def renew(
+        self,
+        scheduled_command_ids: list[UUID],
+        lease: float,
+    ) -> None:
+        if scheduled_command_ids:
+            await ScheduledCommandModel.find(
+                In(ScheduledCommandModel.id, scheduled_command_ids),
+                {'locked_until': {'$ne': None}},
+            ).update(
+                {'$set': {'locked_until': datetime.now(timezone.utc) + timedelta(seconds=lease)}},
+            )
+
+    async def release(
+        self,
+        scheduled_command_ids: list[UUID],
+    ) -> None:
+        if scheduled_command_ids:
+            await ScheduledCommandModel.find(In(ScheduledCommandModel.id, scheduled_command_ids)).update(
+                {'$set': {'locked_until': None, 'lock_token': None}},
+            )
+
+    async def remove(
+        self,
+        scheduled_command_id: UUID,
+    ) -> None:
+        await ScheduledCommandModel.find_one(ScheduledCommandModel.id == scheduled_command_id).delete()
@@ -0,0 +1,38 @@
+import base64
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID
+
+import orjson
+
+from infrastructure.exceptions.notifications import InvalidNotificationCursorException
+from infrastructure.models.notifications import NotificationType
+
+
+@dataclass(frozen=True)
+class NotificationFilters:
+    receiver: str | None = None
+    notification_type: NotificationType | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+
+
+@dataclass(frozen=True)
+class NotificationCursor:
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(orjson.dumps([self.created_at.isoformat(), str(self.id)])).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> 'NotificationCursor':
+        try:
+            created_at, notification_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+            created_at = datetime.fromisoformat(created_at)
+            return cls(
+                created_at=created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc),
+                id=UUID(notification_id),
+            )
+        except (ValueError, TypeError, AttributeError):
+            raise InvalidNotificationCursorException(cursor=cursor) from None
@@ -1,25 +1,57 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 from domain.entities.notifications import EmailNotificationEntity
+from infrastructure.senders.reports import MassDeliveryReport
+from infrastructure.tracing.otel import trace_methods, traced
 
 
 logger = logging.getLogger(__name__)
 
 
 class BaseEmailSender(ABC):
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self):
+        ...
+
+    async def stop(self):
+        ...
+
+    async def check_health(self) -> bool:
+        return True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, ('send_email', 'send_targeted_email', 'send_mass_email'))
+
+    @traced('BaseEmailSender.send_email')
     async def send_email(
         self,
         email_notification: EmailNotificationEntity,
-    ) -> None:
+    ) -> MassDeliveryReport:
         if len(email_notification.receivers) > 1:
-            await self.send_mass_email(
+            report = await self.send_mass_email(
                 sender=email_notification.sender.as_generic(),
-                receivers=[receiver.as_generic() for receiver in email_notification.receivers],
+                receivers=(receiver.as_generic() for receiver in email_notification.receivers),
                 subject=email_notification.subject,
                 text=email_notification.text,
                 html=email_notification.html,
             )
+            if report.failed:
+                logger.warning(
+                    'Email notification \'%s\' was not delivered to %d of %d receivers',
+                    email_notification.id,
+                    len(report.failed),
+                    report.processed,
+                )
+            return report
         else:
             await self.send_targeted_email(
                 sender=email_notification.sender.as_generic(),
@@ -28,6 +60,7 @@ class BaseEmailSender(ABC):
                 text=email_notification.text,
                 html=email_notification.html,
             )
+            return MassDeliveryReport(delivered=1)
 
     @abstractmethod
     async def send_targeted_email(
@@ -44,9 +77,9 @@ class BaseEmailSender(ABC):
     async def send_mass_email(
         self,
         sender: str,
-        receivers: list[str],
+        receivers: Iterable[str],
         subject: str,
         text: str,
         html: str | None = None,
-    ) -> None:
+    ) -> MassDeliveryReport:
         ...
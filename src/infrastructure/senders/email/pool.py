@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import ssl
+import time
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+import aiosmtplib
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class PooledSMTPConnection:
+    smtp: aiosmtplib.SMTP
+    last_used_at: float = field(default_factory=time.monotonic)
+    last_checked_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class SMTPConnectionPool:
+    host: str
+    port: int
+    username: str
+    password: str
+    use_tls: bool = False
+    use_ssl: bool = False
+    min_size: int = 1
+    max_size: int = 10
+    idle_timeout: float = 60.0
+    health_check_interval: float = 30.0
+    timeout: float = 30.0
+    ssl_context: ssl.SSLContext = field(default_factory=ssl.create_default_context, repr=False)
+    idle_connections: deque[PooledSMTPConnection] = field(default_factory=deque, init=False, repr=False)
+    opened_connections: int = field(default=0, init=False)
+    reaper_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _permits: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._permits = asyncio.Semaphore(self.max_size)
+
+    @property
+    def size(self) -> int:
+        return self.opened_connections
+
+    @property
+    def idle_size(self) -> int:
+        return len(self.idle_connections)
+
+    async def start(self):
+        for _ in range(self.min_size - self.opened_connections):
+            try:
+                self.idle_connections.append(await self._connect())
+            except Exception as e:
+                logger.warning('Failed to pre-open SMTP connection: %s', str(e))
+                break
+
+        if self.reaper_task is None:
+            self.reaper_task = asyncio.create_task(self._reap_idle_connections())
+
+    async def stop(self):
+        if self.reaper_task:
+            self.reaper_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.reaper_task
+            self.reaper_task = None
+
+        while self.idle_connections:
+            await self._close(self.idle_connections.pop())
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        async with self._permits:
+            connection = await self._checkout()
+            try:
+                yield connection.smtp
+            except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused):
+                self._checkin(connection)
+                raise
+            except BaseException:
+                await self._close(connection)
+                raise
+            else:
+                self._checkin(connection)
+
+    async def check_health(self) -> bool:
+        if self._permits.locked():
+            return True
+
+        try:
+            async with self.acquire() as smtp:
+                await smtp.noop()
+        except Exception as e:
+            logger.warning('SMTP connection pool failed health check: %s', str(e))
+            return False
+        return True
+
+    async def _checkout(self) -> PooledSMTPConnection:
+        while self.idle_connections:
+            connection = self.idle_connections.pop()
+
+            if not connection.smtp.is_connected:
+                await self._close(connection)
+                continue
+
+            unchecked_for = time.monotonic() - connection.last_checked_at
+            if unchecked_for > self.health_check_interval and not await self._is_healthy(connection):
+                await self._close(connection)
+                continue
+
+            return connection
+
+        return await self._connect()
+
+    def _checkin(self, connection: PooledSMTPConnection):
+        connection.last_used_at = connection.last_checked_at = time.monotonic()
+        self.idle_connections.append(connection)
+
+    async def _connect(self) -> PooledSMTPConnection:
+        smtp = await self._open_connection()
+        self.opened_connections += 1
+        logger.debug('Opened SMTP connection to %s:%d (%d open)', self.host, self.port, self.opened_connections)
+        return PooledSMTPConnection(smtp=smtp)
+
+    async def _open_connection(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            tls_context=self.ssl_context,
+            use_tls=self.use_ssl,
+            start_tls=self.use_tls,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        try:
+            await smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    async def _close(self, connection: PooledSMTPConnection):
+        self.opened_connections -= 1
+        try:
+            if connection.smtp.is_connected:
+                await connection.smtp.quit()
+        except Exception as e:
+            logger.debug('Error closing SMTP connection: %s', str(e))
+            connection.smtp.close()
+
+    async def _is_healthy(self, connection: PooledSMTPConnection) -> bool:
+        try:
+            await connection.smtp.noop()
+        except Exception as e:
+            logger.info('SMTP connection failed health check: %s', str(e))
+            return False
+        connection.last_checked_at = time.monotonic()
+        return True
+
+    async def _reap_idle_connections(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            now = time.monotonic()
+            for connection in list(self.idle_connections):
+                if connection not in self.idle_connections:
+                    continue
+
+                if now - connection.last_used_at > self.idle_timeout and self.opened_connections > self.min_size:
+                    self.idle_connections.remove(connection)
+                    await self._close(connection)
+                elif now - connection.last_checked_at >= self.health_check_interval:
+                    self.idle_connections.remove(connection)
+                    if await self._is_healthy(connection):
+                        self.idle_connections.appendleft(connection)
+                    else:
+                        await self._close(connection)
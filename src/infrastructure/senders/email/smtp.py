@@ -1,5 +1,7 @@
+import asyncio
+import itertools
 import logging
-import ssl
+from typing import Iterable
 
 import aiosmtplib
 from dataclasses import dataclass
@@ -8,6 +10,8 @@ from email.mime.text import MIMEText
 
 from infrastructure.exceptions.notifications import MutuallyExclusiveFlagsException
 from infrastructure.senders.email.base import BaseEmailSender
+from infrastructure.senders.email.pool import SMTPConnectionPool
+from infrastructure.senders.reports import MassDeliveryReport
 
 
 logger = logging.getLogger(__name__)
@@ -21,11 +25,39 @@ class SMTPEmailSender(BaseEmailSender):
     password: str
     use_tls: bool = False
     use_ssl: bool = False
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    pool_idle_timeout: float = 60.0
+    pool_health_check_interval: float = 30.0
+    mass_email_chunk_size: int = 50
+    mass_email_concurrency: int = 10
 
     def __post_init__(self):
         if self.use_tls and self.use_ssl:
             raise MutuallyExclusiveFlagsException
 
+        self.pool = SMTPConnectionPool(
+            host=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            use_ssl=self.use_ssl,
+            min_size=self.pool_min_size,
+            max_size=self.pool_max_size,
+            idle_timeout=self.pool_idle_timeout,
+            health_check_interval=self.pool_health_check_interval,
+        )
+
+    async def start(self):
+        await self.pool.start()
+
+    async def stop(self):
+        await self.pool.stop()
+
+    async def check_health(self) -> bool:
+        return await self.pool.check_health()
+
     async def send_targeted_email(
             self,
             sender: str,
@@ -34,38 +66,82 @@ class SMTPEmailSender(BaseEmailSender):
             text: str,
             html: str | None = None,
     ) -> None:
-        message = MIMEMultipart('alternative')
-        message['Subject'], message['From'], message['To'] = subject, sender, receiver
-        message.attach(MIMEText(text, 'plain'))
+        message = self._build_message(sender, receiver, subject, text, html)
+        await self._sendmail(sender, [receiver], message)
 
-        if html:
-            message.attach(MIMEText(html, 'html'))
-
-        ssl_context = ssl.create_default_context()
+    async def send_mass_email(
+        self,
+        sender: str,
+        receivers: Iterable[str],
+        subject: str,
+        text: str,
+        html: str | None = None,
+    ) -> MassDeliveryReport:
+        message = self._build_message(sender, 'undisclosed-recipients:;', subject, text, html)
+        report = MassDeliveryReport()
+        permits = asyncio.Semaphore(self.mass_email_concurrency)
 
-        smtp_kwargs = {
-            'hostname': self.host,
-            'port': self.port,
-            'tls_context': ssl_context,
-            'start_tls': False,
-        }
+        async with asyncio.TaskGroup() as group:
+            for chunk in itertools.batched(receivers, self.mass_email_chunk_size):
+                await permits.acquire()
+                group.create_task(self._send_chunk(sender, list(chunk), message, report, permits))
 
-        if self.use_ssl:
-            smtp_kwargs['use_tls'] = True
-        elif self.use_tls:
-            smtp_kwargs['start_tls'] = True
+        logger.info(
+            'Mass email delivered to %d receivers, %d failed',
+            report.delivered,
+            len(report.failed),
+        )
+        return report
 
-        async with aiosmtplib.SMTP(**smtp_kwargs) as smtp:
-            await smtp.login(self.username, self.password)
-            await smtp.sendmail(sender, receiver, message.as_string())
+    async def _send_chunk(
+        self,
+        sender: str,
+        receivers: list[str],
+        message: str,
+        report: MassDeliveryReport,
+        permits: asyncio.Semaphore,
+    ) -> None:
+        try:
+            errors = await self._sendmail(sender, receivers, message)
+        except aiosmtplib.SMTPRecipientsRefused as e:
+            errors = {error.recipient: error for error in e.recipients}
+        except Exception as e:
+            logger.exception('Failed to send mass email chunk of %d receivers', len(receivers))
+            errors = dict.fromkeys(receivers, e)
+        finally:
+            permits.release()
 
+        report.delivered += len(receivers) - len(errors)
+        report.failed.update((receiver, str(error)) for receiver, error in errors.items())
 
-    async def send_mass_email(
+    def _build_message(
         self,
         sender: str,
-        receivers: list[str],
+        receiver: str,
         subject: str,
         text: str,
         html: str | None = None,
-    ) -> None:
-        ...
+    ) -> str:
+        message = MIMEMultipart('alternative')
+        message['Subject'], message['From'], message['To'] = subject, sender, receiver
+        message.attach(MIMEText(text, 'plain'))
+
+        if html:
+            message.attach(MIMEText(html, 'html'))
+
+        return message.as_string()
+
+    async def _sendmail(
+        self,
+        sender: str,
+        receivers: list[str],
+        message: str,
+    ) -> dict[str, aiosmtplib.SMTPResponse]:
+        try:
+            async with self.pool.acquire() as smtp:
+                errors, _ = await smtp.sendmail(sender, receivers, message)
+        except aiosmtplib.SMTPServerDisconnected:
+            logger.info('Pooled SMTP connection was dropped by the server, retrying on a fresh one')
+            async with self.pool.acquire() as smtp:
+                errors, _ = await smtp.sendmail(sender, receivers, message)
+        return errors
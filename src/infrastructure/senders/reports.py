@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class MassDeliveryReport:
+    delivered: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def processed(self) -> int:
+        return self.delivered + len(self.failed)
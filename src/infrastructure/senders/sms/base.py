@@ -1,17 +1,38 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 from domain.entities.notifications import SMSNotificationEntity
+from infrastructure.senders.reports import MassDeliveryReport
+from infrastructure.tracing.otel import trace_methods, traced
 
 
 logger = logging.getLogger(__name__)
 
 
 class BaseSMSSender(ABC):
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self):
+        ...
+
+    async def stop(self):
+        ...
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, ('send_sms', 'send_targeted_sms', 'send_mass_sms'))
+
+    @traced('BaseSMSSender.send_sms')
     async def send_sms(
         self,
         sms_notification: SMSNotificationEntity,
-    ) -> None:
+    ) -> MassDeliveryReport:
         logger.warning(
             '\nSending sms from <%s> to <%s> \nwith text: %s',
             sms_notification.sender.as_generic(),
@@ -19,17 +40,26 @@ class BaseSMSSender(ABC):
             sms_notification.text,
         )
         if len(sms_notification.receivers) > 1:
-            await self.send_mass_sms(
+            report = await self.send_mass_sms(
                 sender=sms_notification.sender.as_generic(),
-                receivers=[receiver.as_generic() for receiver in sms_notification.receivers],
+                receivers=(receiver.as_generic() for receiver in sms_notification.receivers),
                 text=sms_notification.text,
             )
+            if report.failed:
+                logger.warning(
+                    'SMS notification \'%s\' was not delivered to %d of %d receivers',
+                    sms_notification.id,
+                    len(report.failed),
+                    report.processed,
+                )
+            return report
         else:
             await self.send_targeted_sms(
                 sender=sms_notification.sender.as_generic(),
                 receiver=sms_notification.receivers[0].as_generic(),
                 text=sms_notification.text,
             )
+            return MassDeliveryReport(delivered=1)
 
     @abstractmethod
     async def send_targeted_sms(
@@ -44,7 +74,8 @@ class BaseSMSSender(ABC):
     async def send_mass_sms(
         self,
         sender: str,
-        receivers: list[str],
+        receivers: Iterable[str],
         text: str,
-    ) -> None:
+        report: MassDeliveryReport | None = None,
+    ) -> MassDeliveryReport:
         ...
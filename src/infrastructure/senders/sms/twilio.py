@@ -1,18 +1,56 @@
+import asyncio
+import itertools
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Iterable
 
+from twilio.http.async_http_client import AsyncTwilioHttpClient
 from twilio.rest import Client
 
+from infrastructure.senders.reports import MassDeliveryReport
 from infrastructure.senders.sms.base import BaseSMSSender
+from infrastructure.senders.throttling import TokenBucket
 
 
 logger = logging.getLogger(__name__)
 
 
+class TimeoutAsyncTwilioHttpClient(AsyncTwilioHttpClient):
+    async def request(self, *args, timeout: float | None = None, **kwargs):
+        return await super().request(*args, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+
 @dataclass
 class TwilioSMSSender(BaseSMSSender):
     account_sid: str
     auth_token: str
+    api_base_url: str | None = None
+    timeout: float = 10.0
+    messages_per_second: float = 1.0
+    mass_sms_batch_size: int = 100
+    client: Client | None = field(default=None, init=False, repr=False)
+    throttle: TokenBucket = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.throttle = TokenBucket(rate=self.messages_per_second, capacity=max(1.0, self.messages_per_second))
+
+    async def start(self):
+        if self.client:
+            return
+
+        self.client = Client(
+            self.account_sid,
+            self.auth_token,
+            http_client=TimeoutAsyncTwilioHttpClient(timeout=self.timeout),
+        )
+        if self.api_base_url:
+            self.client.api.base_url = self.api_base_url
+        logger.debug('Twilio client with pooled HTTP session created')
+
+    async def stop(self):
+        if self.client:
+            await self.client.http_client.close()
+            self.client = None
 
     async def send_targeted_sms(
         self,
@@ -20,13 +58,46 @@ class TwilioSMSSender(BaseSMSSender):
         receiver: str,
         text: str,
     ) -> None:
-        client = Client(self.account_sid, self.auth_token)
-        client.messages.create(from_=sender, body=text, to=receiver)
+        if not self.client:
+            await self.start()
+
+        await self.client.messages.create_async(from_=sender, body=text, to=receiver)
 
     async def send_mass_sms(
         self,
         sender: str,
-        receivers: list[str],
+        receivers: Iterable[str],
+        text: str,
+        report: MassDeliveryReport | None = None,
+    ) -> MassDeliveryReport:
+        report = report or MassDeliveryReport()
+        pending_receivers = itertools.islice(receivers, report.processed, None)
+
+        for batch in itertools.batched(pending_receivers, self.mass_sms_batch_size):
+            results = await asyncio.gather(
+                *(self._send_throttled_sms(sender, receiver, text) for receiver in batch),
+                return_exceptions=True,
+            )
+            for receiver, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    report.failed[receiver] = str(result)
+                else:
+                    report.delivered += 1
+
+            logger.debug('Mass SMS progress: %d processed, %d failed', report.processed, len(report.failed))
+
+        logger.info(
+            'Mass SMS delivered to %d receivers, %d failed',
+            report.delivered,
+            len(report.failed),
+        )
+        return report
+
+    async def _send_throttled_sms(
+        self,
+        sender: str,
+        receiver: str,
         text: str,
     ) -> None:
-        ...
+        await self.throttle.acquire()
+        await self.send_targeted_sms(sender=sender, receiver=receiver, text=text)
@@ -0,0 +1,88 @@
+import asyncio
+import gzip
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import orjson
+
+from infrastructure.models.notifications import NotificationModel
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NotificationArchiver:
+    directory: Path
+    retention: float
+    interval: float = 3600.0
+    batch_size: int = 1000
+    archive_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+
+    async def start(self):
+        if self.archive_task is None:
+            self.archive_task = asyncio.create_task(self._archive_periodically())
+
+    async def stop(self):
+        if self.archive_task:
+            self.archive_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.archive_task
+            self.archive_task = None
+
+    async def archive(self) -> int:
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(seconds=self.retention)
+        path = self.directory / f'notifications-{now:%Y%m%dT%H%M%S}.ndjson.gz'
+        partial_path = path.with_name(f'{path.name}.part')
+
+        await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+        archive_file = await asyncio.to_thread(gzip.open, partial_path, 'wb')
+        archived = 0
+        try:
+            lines: list[bytes] = []
+            async for document in self._find_expired(cutoff):
+                lines.append(orjson.dumps(document) + b'\n')
+                if len(lines) >= self.batch_size:
+                    await asyncio.to_thread(archive_file.writelines, lines)
+                    archived += len(lines)
+                    lines = []
+            if lines:
+                await asyncio.to_thread(archive_file.writelines, lines)
+                archived += len(lines)
+        except BaseException:
+            await asyncio.to_thread(archive_file.close)
+            partial_path.unlink(missing_ok=True)
+            raise
+        await asyncio.to_thread(archive_file.close)
+
+        if not archived:
+            partial_path.unlink(missing_ok=True)
+            return 0
+
+        partial_path.rename(path)
+        deleted = await self._delete_expired(cutoff)
+        logger.info('Archived %d notifications to %s, deleted %d', archived, path, deleted)
+        return archived
+
+    async def _find_expired(self, cutoff: datetime) -> AsyncIterator[dict[str, Any]]:
+        async for notification in NotificationModel.find(NotificationModel.created_at < cutoff).sort('+created_at'):
+            yield notification.model_dump(mode='json')
+
+    async def _delete_expired(self, cutoff: datetime) -> int:
+        result = await NotificationModel.find(NotificationModel.created_at < cutoff).delete()
+        return result.deleted_count if result else 0
+
+    async def _archive_periodically(self):
+        while True:
+            try:
+                await self.archive()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception('Failed to archive notifications: %s', str(e))
+            await asyncio.sleep(self.interval)
@@ -1,11 +1,49 @@
+import logging
+
 from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING
+
+from infrastructure.models.idempotency import ProcessedMessageModel
 from infrastructure.models.notifications import NotificationModel, NotificationTemplateModel
+from infrastructure.models.schedules import ScheduledCommandModel
 from settings.config import settings
 
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATIONS_TTL_INDEX_NAME = 'created_at_ttl'
+
+
 async def init_mongodb(client: AsyncIOMotorClient):
     await init_beanie(
         database=client[settings.MONGODB_DB],
-        document_models=[NotificationModel, NotificationTemplateModel]
+        document_models=[NotificationModel, NotificationTemplateModel, ProcessedMessageModel, ScheduledCommandModel]
     )
+    await ensure_notifications_ttl_index(settings.NOTIFICATIONS_EXPIRE_AFTER_SECONDS)
+
+
+async def ensure_notifications_ttl_index(expire_after_seconds: int | None):
+    collection = NotificationModel.get_motor_collection()
+    ttl_index = (await collection.index_information()).get(NOTIFICATIONS_TTL_INDEX_NAME)
+
+    if expire_after_seconds is None:
+        if ttl_index:
+            logger.info('Dropping notifications TTL index')
+            await collection.drop_index(NOTIFICATIONS_TTL_INDEX_NAME)
+        return
 
+    if ttl_index is None:
+        logger.info('Creating notifications TTL index (expire after %d seconds)', expire_after_seconds)
+        await collection.create_index(
+            [('created_at', ASCENDING)],
+            name=NOTIFICATIONS_TTL_INDEX_NAME,
+            expireAfterSeconds=expire_after_seconds,
+        )
+    elif ttl_index.get('expireAfterSeconds') != expire_after_seconds:
+        logger.info('Updating notifications TTL index (expire after %d seconds)', expire_after_seconds)
+        await collection.database.command(
+            'collMod',
+            collection.name,
+            index={'name': NOTIFICATIONS_TTL_INDEX_NAME, 'expireAfterSeconds': expire_after_seconds},
+        )
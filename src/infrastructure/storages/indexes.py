@@ -0,0 +1,6 @@
+from pymongo import IndexModel
+
+
+def build_in_background(index: IndexModel) -> IndexModel:
+    options = {option: value for option, value in index.document.items() if option != 'key'}
+    return IndexModel(index.document['key'], background=True, **options)
@@ -0,0 +1,142 @@
+import logging
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Awaitable, Callable, Mapping
+
+try:
+    from opentelemetry import context, propagate, trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+        SpanExporter,
+    )
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:
+    trace = None
+
+
+logger = logging.getLogger(__name__)
+
+_NO_SPAN = nullcontext()
+_tracer = None
+_tracer_provider = None
+
+
+def is_tracing_available() -> bool:
+    return trace is not None
+
+
+def is_tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def configure_tracing(
+    service_name: str,
+    sample_ratio: float = 1.0,
+    exporter: 'str | SpanExporter' = 'otlp',
+) -> 'TracerProvider | None':
+    global _tracer, _tracer_provider
+
+    if not is_tracing_available():
+        logger.error('Tracing is enabled but opentelemetry-sdk is not installed, spans will not be recorded')
+        return None
+
+    if isinstance(exporter, str):
+        exporter = get_span_exporter(exporter)
+
+    _tracer_provider = TracerProvider(
+        resource=Resource.create({'service.name': service_name}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+    )
+    span_processor = SimpleSpanProcessor if isinstance(exporter, InMemorySpanExporter) else BatchSpanProcessor
+    _tracer_provider.add_span_processor(span_processor(exporter))
+    _tracer = _tracer_provider.get_tracer(__name__)
+    logger.info('Tracing %s with sample ratio %.3f', service_name, sample_ratio)
+    return _tracer_provider
+
+
+def shutdown_tracing():
+    global _tracer, _tracer_provider
+
+    if _tracer_provider is not None:
+        _tracer_provider.shutdown()
+    _tracer = _tracer_provider = None
+
+
+def get_span_exporter(name: str) -> 'SpanExporter':
+    if name == 'memory':
+        return InMemorySpanExporter()
+    if name == 'console':
+        return ConsoleSpanExporter()
+    if name == 'otlp':
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter()
+    raise ValueError(f'Unknown span exporter: {name}')
+
+
+@dataclass
+class CurrentSpan:
+    name: str
+    attributes: Mapping[str, Any] | None = None
+    headers: Mapping[str, Any] | None = None
+    consumer: bool = False
+    span: Any = field(default=None, init=False, repr=False)
+    token: object = field(default=None, init=False, repr=False)
+
+    def __enter__(self):
+        self.span = _tracer.start_span(
+            self.name,
+            context=propagate.extract(self.headers) if self.headers else None,
+            kind=SpanKind.CONSUMER if self.consumer else SpanKind.INTERNAL,
+            attributes=self.attributes,
+        )
+        self.token = context.attach(trace.set_span_in_context(self.span))
+        return self.span
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        context.detach(self.token)
+        if exc_val is not None:
+            record_span_error(self.span, exc_val)
+        self.span.end()
+
+
+def start_span(
+    name: str,
+    attributes: Mapping[str, Any] | None = None,
+    headers: Mapping[str, Any] | None = None,
+    consumer: bool = False,
+) -> AbstractContextManager:
+    if _tracer is None:
+        return _NO_SPAN
+    return CurrentSpan(name, attributes, headers, consumer)
+
+
+def record_span_error(span, error: BaseException):
+    if span is not None:
+        span.record_exception(error)
+        span.set_status(Status(StatusCode.ERROR, str(error)))
+
+
+def traced(name: str) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    def decorator(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @wraps(method)
+        async def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return await method(*args, **kwargs)
+            with CurrentSpan(name):
+                return await method(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_methods(cls: type, method_names: tuple[str, ...]):
+    for method_name in method_names:
+        method = cls.__dict__.get(method_name)
+        if method is not None and not getattr(method, '__isabstractmethod__', False):
+            setattr(cls, method_name, traced(f'{cls.__name__}.{method_name}')(method))
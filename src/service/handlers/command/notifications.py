@@ -1,5 +1,9 @@
 import logging
-from dataclasses import dataclass
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+from uuid import UUID
 
 from domain.commands.notifications import (
     SendUserRegistrationCompletedMessageCommand,
@@ -9,10 +13,15 @@ from domain.commands.notifications import (
     SendUserEmailUpdatedMessageCommand,
     SendUserPhoneNumberUpdatedMessageCommand, UserCredentialsStatus,
 )
-from domain.entities.notifications import EmailNotificationEntity, SMSNotificationEntity
+from domain.entities.notifications import DeliveryStatus, EmailNotificationEntity, SMSNotificationEntity
+from domain.events.notifications import NotificationCreatedEvent
 from domain.value_objects.notifications import EmailVO, PhoneNumberVO
+from infrastructure.metrics.prometheus import get_current_message_metrics
+from infrastructure.renderers.base import BaseNotificationTemplateRenderer, RenderedNotificationTemplate
+from infrastructure.renderers.compiled import CompiledNotificationTemplateRenderer
 from infrastructure.repositories.base import BaseNotificationRepository, BaseNotificationTemplateRepository
 from infrastructure.senders.email.base import BaseEmailSender
+from infrastructure.senders.reports import MassDeliveryReport
 from infrastructure.senders.sms.base import BaseSMSSender
 from service.handlers.command.base import BaseCommandHandler
 from settings.config import settings
@@ -21,12 +30,98 @@ from settings.config import settings
 logger = logging.getLogger(__name__)
 
 
+async def fetch_notification_template(
+    notification_template_repo: BaseNotificationTemplateRepository,
+    name: str,
+) -> dict[str, str]:
+    started_at = time.perf_counter()
+    try:
+        return await notification_template_repo.get(name)
+    finally:
+        metrics = get_current_message_metrics()
+        if metrics is not None:
+            metrics.template_fetch.observe(time.perf_counter() - started_at)
+
+
+def render_notification_template(
+    template_renderer: BaseNotificationTemplateRenderer,
+    template: dict[str, str | None],
+    variables: dict[str, str],
+) -> RenderedNotificationTemplate:
+    started_at = time.perf_counter()
+    try:
+        return template_renderer.render(template, variables)
+    finally:
+        metrics = get_current_message_metrics()
+        if metrics is not None:
+            metrics.render.observe(time.perf_counter() - started_at)
+
+
+async def add_notification(
+    notification_repo: BaseNotificationRepository,
+    notification: EmailNotificationEntity | SMSNotificationEntity,
+) -> None:
+    notification.events.append(
+        NotificationCreatedEvent(
+            notification_id=notification.id,
+            notification_type='email' if isinstance(notification, EmailNotificationEntity) else 'sms',
+            receivers=[receiver.as_generic() for receiver in notification.receivers],
+        )
+    )
+    started_at = time.perf_counter()
+    try:
+        await notification_repo.add(notification)
+    finally:
+        metrics = get_current_message_metrics()
+        if metrics is not None:
+            metrics.db_insert.observe(time.perf_counter() - started_at)
+
+
+async def send_tracked_notification(
+    notification_repo: BaseNotificationRepository,
+    send: Callable[..., Awaitable[MassDeliveryReport]],
+    notification: EmailNotificationEntity | SMSNotificationEntity,
+) -> None:
+    await _update_delivery_status(notification_repo, notification.id, DeliveryStatus.SENDING)
+    started_at = time.perf_counter()
+    try:
+        report = await send(notification)
+    except Exception as e:
+        await _update_delivery_status(notification_repo, notification.id, DeliveryStatus.FAILED, error=str(e))
+        raise
+    finally:
+        metrics = get_current_message_metrics()
+        if metrics is not None:
+            metrics.provider_send.observe(time.perf_counter() - started_at)
+
+    failed_receivers: dict[str, list[str]] = defaultdict(list)
+    for receiver, error in report.failed.items():
+        failed_receivers[error].append(receiver)
+    for error, receivers in failed_receivers.items():
+        await _update_delivery_status(notification_repo, notification.id, DeliveryStatus.FAILED, receivers, error)
+    await _update_delivery_status(notification_repo, notification.id, DeliveryStatus.SENT)
+
+
+async def _update_delivery_status(
+    notification_repo: BaseNotificationRepository,
+    notification_id: UUID,
+    status: DeliveryStatus,
+    receivers: list[str] | None = None,
+    error: str | None = None,
+) -> None:
+    try:
+        await notification_repo.update_delivery_status(notification_id, status, receivers, error)
+    except Exception as e:
+        logger.error('Failed to mark notification \'%s\' as %s: %s', notification_id, status.value, str(e))
+
+
 @dataclass
 class SendUserRegistrationCompletedMessageCommandHandler(BaseCommandHandler):
     notification_template_repo: BaseNotificationTemplateRepository
     notification_repo: BaseNotificationRepository
     email_sender: BaseEmailSender
     sms_sender: BaseSMSSender
+    template_renderer: BaseNotificationTemplateRenderer = field(default_factory=CompiledNotificationTemplateRenderer)
 
     async def __call__(self, command: SendUserRegistrationCompletedMessageCommand):
         action_name = (
@@ -34,30 +129,33 @@ class SendUserRegistrationCompletedMessageCommandHandler(BaseCommandHandler):
             else 'registration_failed' if command.credentials_status == UserCredentialsStatus.FAILED
             else 'registration_pending'
         )
-        notification_template = await self.notification_template_repo.get(action_name)
+        notification_template = await fetch_notification_template(self.notification_template_repo, action_name)
         initials = {
             'first_name': command.first_name.as_generic() if command.first_name else '',
             'last_name': command.last_name.as_generic() if command.last_name else '',
             'middle_name': command.middle_name.as_generic() if command.middle_name else '',
         }
+        rendered = render_notification_template(self.template_renderer, notification_template, initials)
         if command.email:
             notification = EmailNotificationEntity(
+                id=command.command_id,
                 sender=EmailVO(settings.FROM_EMAIL),
                 receivers=[command.email],
                 subject=action_name.replace('_', ' ').title(),
-                text=notification_template['text_template'] % initials,
-                html=notification_template['html_template'] % initials,
+                text=rendered.text,
+                html=rendered.html,
             )
-            await self.notification_repo.add(notification)
-            await self.email_sender.send_email(notification)
+            await add_notification(self.notification_repo, notification)
+            await send_tracked_notification(self.notification_repo, self.email_sender.send_email, notification)
         else:
             notification = SMSNotificationEntity(
+                id=command.command_id,
                 sender=PhoneNumberVO(settings.FROM_PHONE_NUMBER),
                 receivers=[command.phone_number],
-                text=notification_template['text_template'] % initials,
+                text=rendered.text,
             )
-            await self.notification_repo.add(notification)
-            await self.sms_sender.send_sms(notification)
+            await add_notification(self.notification_repo, notification)
+            await send_tracked_notification(self.notification_repo, self.sms_sender.send_sms, notification)
 
 
 
@@ -66,19 +164,22 @@ class SendUserEmailUpdateInitiatedMessageCommandHandler(BaseCommandHandler):
     notification_template_repo: BaseNotificationTemplateRepository
     notification_repo: BaseNotificationRepository
     email_sender: BaseEmailSender
+    template_renderer: BaseNotificationTemplateRenderer = field(default_factory=CompiledNotificationTemplateRenderer)
 
     async def __call__(self, command: SendUserEmailUpdateInitiatedMessageCommand):
         action_name = 'email_update_initiated'
-        notification_template = await self.notification_template_repo.get(action_name)
+        notification_template = await fetch_notification_template(self.notification_template_repo, action_name)
+        rendered = render_notification_template(self.template_renderer, notification_template, {'verify_token': command.verification_token})
         notification = EmailNotificationEntity(
+            id=command.command_id,
             sender=EmailVO(settings.FROM_EMAIL),
             receivers=[command.new_email],
             subject=action_name.replace('_', ' ').title(),
-            text=notification_template['text_template'] % {'verify_token': command.verification_token},
-            html=notification_template['html_template'] % {'verify_token': command.verification_token},
+            text=rendered.text,
+            html=rendered.html,
         )
-        await self.notification_repo.add(notification)
-        await self.email_sender.send_email(notification)
+        await add_notification(self.notification_repo, notification)
+        await send_tracked_notification(self.notification_repo, self.email_sender.send_email, notification)
 
 
 @dataclass
@@ -86,17 +187,20 @@ class SendUserPhoneNumberUpdateInitiatedMessageCommandHandler(BaseCommandHandler
     notification_template_repo: BaseNotificationTemplateRepository
     notification_repo: BaseNotificationRepository
     sms_sender: BaseSMSSender
+    template_renderer: BaseNotificationTemplateRenderer = field(default_factory=CompiledNotificationTemplateRenderer)
 
     async def __call__(self, command: SendUserPhoneNumberUpdateInitiatedMessageCommand):
         action_name = 'phone_number_update_initiated'
-        notification_template = await self.notification_template_repo.get(action_name)
+        notification_template = await fetch_notification_template(self.notification_template_repo, action_name)
+        rendered = render_notification_template(self.template_renderer, notification_template, {'verify_token': command.verification_token})
         notification = SMSNotificationEntity(
+            id=command.command_id,
             sender=PhoneNumberVO(settings.FROM_PHONE_NUMBER),
             receivers=[command.new_phone_number],
-            text=notification_template['text_template'] % {'verify_token': command.verification_token},
+            text=rendered.text,
         )
-        await self.notification_repo.add(notification)
-        await self.sms_sender.send_sms(notification)
+        await add_notification(self.notification_repo, notification)
+        await send_tracked_notification(self.notification_repo, self.sms_sender.send_sms, notification)
 
 
 @dataclass
@@ -105,28 +209,32 @@ class SendUserPasswordResetInitiatedMessageCommandHandler(BaseCommandHandler):
     notification_repo: BaseNotificationRepository
     email_sender: BaseEmailSender
     sms_sender: BaseSMSSender
+    template_renderer: BaseNotificationTemplateRenderer = field(default_factory=CompiledNotificationTemplateRenderer)
 
     async def __call__(self, command: SendUserPasswordResetInitiatedMessageCommand):
         action_name = 'password_reset_initiated'
-        notification_template = await self.notification_template_repo.get(action_name)
+        notification_template = await fetch_notification_template(self.notification_template_repo, action_name)
+        rendered = render_notification_template(self.template_renderer, notification_template, {'verify_token': command.verification_token})
         if command.email:
             notification = EmailNotificationEntity(
+                id=command.command_id,
                 sender=EmailVO(settings.FROM_EMAIL),
                 receivers=[command.email],
                 subject=action_name.replace('_', ' ').title(),
-                text=notification_template['text_template'] % {'verify_token': command.verification_token},
-                html=notification_template['html_template'] % {'verify_token': command.verification_token},
+                text=rendered.text,
+                html=rendered.html,
             )
-            await self.notification_repo.add(notification)
-            await self.email_sender.send_email(notification)
+            await add_notification(self.notification_repo, notification)
+            await send_tracked_notification(self.notification_repo, self.email_sender.send_email, notification)
         else:
             notification = SMSNotificationEntity(
+                id=command.command_id,
                 sender=PhoneNumberVO(settings.FROM_PHONE_NUMBER),
                 receivers=[command.phone_number],
-                text=notification_template['text_template'] % {'verify_token': command.verification_token},
+                text=rendered.text,
             )
-            await self.notification_repo.add(notification)
-            await self.sms_sender.send_sms(notification)
+            await add_notification(self.notification_repo, notification)
+            await send_tracked_notification(self.notification_repo, self.sms_sender.send_sms, notification)
 
 
 @dataclass
@@ -134,19 +242,22 @@ class SendUserEmailUpdatedMessageCommandHandler(BaseCommandHandler):
     notification_template_repo: BaseNotificationTemplateRepository
     notification_repo: BaseNotificationRepository
     email_sender: BaseEmailSender
+    template_renderer: BaseNotificationTemplateRenderer = field(default_factory=CompiledNotificationTemplateRenderer)
 
     async def __call__(self, command: SendUserEmailUpdatedMessageCommand):
         action_name = 'email_updated'
-        notification_template = await self.notification_template_repo.get(action_name)
+        notification_template = await fetch_notification_template(self.notification_template_repo, action_name)
+        rendered = render_notification_template(self.template_renderer, notification_template, {'new_email': command.new_email.as_generic()})
         notification = EmailNotificationEntity(
+            id=command.command_id,
             sender=EmailVO(settings.FROM_EMAIL),
             receivers=[command.new_email],
             subject=action_name.replace('_', ' ').title(),
-            text=notification_template['text_template'] % {'new_email': command.new_email.as_generic()},
-            html=notification_template['html_template'] % {'new_email': command.new_email.as_generic()},
+            text=rendered.text,
+            html=rendered.html,
         )
-        await self.notification_repo.add(notification)
-        await self.email_sender.send_email(notification)
+        await add_notification(self.notification_repo, notification)
+        await send_tracked_notification(self.notification_repo, self.email_sender.send_email, notification)
 
 
 @dataclass
@@ -154,14 +265,17 @@ class SendUserPhoneNumberUpdatedMessageCommandHandler(BaseCommandHandler):
     notification_template_repo: BaseNotificationTemplateRepository
     notification_repo: BaseNotificationRepository
     sms_sender: BaseSMSSender
+    template_renderer: BaseNotificationTemplateRenderer = field(default_factory=CompiledNotificationTemplateRenderer)
 
     async def __call__(self, command: SendUserPhoneNumberUpdatedMessageCommand):
         action_name = 'phone_number_updated'
-        notification_template = await self.notification_template_repo.get(action_name)
+        notification_template = await fetch_notification_template(self.notification_template_repo, action_name)
+        rendered = render_notification_template(self.template_renderer, notification_template, {'new_phone_number': command.new_phone_number.as_generic()})
         notification = SMSNotificationEntity(
+            id=command.command_id,
             sender=PhoneNumberVO(settings.FROM_PHONE_NUMBER),
             receivers=[command.new_phone_number],
-            text=notification_template['text_template'] % {'new_phone_number': command.new_phone_number.as_generic()},
+            text=rendered.text,
         )
-        await self.notification_repo.add(notification)
-        await self.sms_sender.send_sms(notification)
+        await add_notification(self.notification_repo, notification)
+        await send_tracked_notification(self.notification_repo, self.sms_sender.send_sms, notification)
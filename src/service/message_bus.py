@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Union
 
@@ -6,6 +8,7 @@ from domain.commands.base import BaseCommand
 from domain.events.base import BaseEvent
 
 from infrastructure.repositories.base import BaseNotificationRepository
+from infrastructure.tracing.otel import start_span
 from service.exceptions.notifications import WrongMessageBusMessageType, HandlerNotFoundException
 from service.handlers.command.base import BaseCommandHandler
 from service.handlers.event.base import BaseEventHandler
@@ -27,61 +30,98 @@ class MessageBus:
         default_factory=dict,
         kw_only=True,
     )
-    queue: list[Message] = field(
-        default_factory=list,
-        kw_only=True
-    )
+    max_queue_size: int | None = field(default=None, kw_only=True)
+    queue_size: int = field(default=0, init=False)
+    queue_high_water_mark: int = field(default=0, init=False)
+    _queue_capacity: asyncio.Condition = field(default_factory=asyncio.Condition, init=False, repr=False)
 
     async def handle(self, message: Message):
         logger.info('Processing message: %s', message.__class__.__name__)
-        self.queue.append(message)
+        queue: deque[Message] = deque()
+        await self._admit(message)
+        queue.append(message)
 
         try:
-            while self.queue:
-                message = self.queue.pop(0)
-                if isinstance(message, BaseCommand):
-                    await self._handle_command(message)
-                elif isinstance(message, BaseEvent):
-                    await self._handle_event(message)
-                else:
-                    logger.error('Unrecognized message type: %r', message)
-                    raise WrongMessageBusMessageType(message.__class__.__name__)
+            with self.repo.scope():
+                await self._drain(queue)
         except Exception as e:
             logger.exception('Failed to process message queue')
             raise
+        finally:
+            if queue:
+                await self._release(len(queue))
 
         logger.info('Message queue processing completed')
 
-    async def _handle_command(self, command: BaseCommand):
-        logger.info('Handling command: %s', command.__class__.__name__)
-        try:
-            handler = self.commands_map.get(command.__class__)
-            if not handler:
-                logger.error('No handler found for command: %s', command.__class__.__name__)
-                raise HandlerNotFoundException(command.__class__.__name__)
-
-            logger.debug(
-                'Using handler %s for command %s',
-                handler.__class__.__name__,
-                command.__class__.__name__
-            )
-            await handler(command)
-            self.queue.extend(self.collect_new_event())
-        except HandlerNotFoundException:
-            raise
-        except Exception as e:
-            logger.exception(
-                'Failed to handle command: %s',
-                command.__class__.__name__,
-                exc_info=e,
-            )
-            raise
-        logger.info('Command handled successfully: %s', command.__class__.__name__)
+    async def _drain(self, queue: deque[Message]):
+        while queue:
+            message = queue.popleft()
+            await self._release()
+            if isinstance(message, BaseCommand):
+                await self._handle_command(message, queue)
+            elif isinstance(message, BaseEvent):
+                await self._handle_event(message, queue)
+            else:
+                logger.error('Unrecognized message type: %r', message)
+                raise WrongMessageBusMessageType(message.__class__.__name__)
+
+    async def _admit(self, message: Message):
+        async with self._queue_capacity:
+            if self.max_queue_size is not None and self.queue_size >= self.max_queue_size:
+                logger.warning(
+                    'Message bus queue is full (%d messages), delaying %s',
+                    self.queue_size,
+                    message.__class__.__name__,
+                )
+                await self._queue_capacity.wait_for(lambda: self.queue_size < self.max_queue_size)
+            self._track_enqueued(1)
+
+    async def _release(self, count: int = 1):
+        async with self._queue_capacity:
+            self.queue_size -= count
+            self._queue_capacity.notify(count)
+
+    def _enqueue_new_events(self, queue: deque[Message]):
+        size = len(queue)
+        queue.extend(self.collect_new_event())
+        self._track_enqueued(len(queue) - size)
+
+    def _track_enqueued(self, count: int):
+        self.queue_size += count
+        if self.queue_size > self.queue_high_water_mark:
+            self.queue_high_water_mark = self.queue_size
+
+    async def _handle_command(self, command: BaseCommand, queue: deque[Message]):
+        with start_span('MessageBus.handle_command', {'command': command.__class__.__name__}):
+            logger.info('Handling command: %s', command.__class__.__name__)
+            try:
+                handler = self.commands_map.get(command.__class__)
+                if not handler:
+                    logger.error('No handler found for command: %s', command.__class__.__name__)
+                    raise HandlerNotFoundException(command.__class__.__name__)
+
+                logger.debug(
+                    'Using handler %s for command %s',
+                    handler.__class__.__name__,
+                    command.__class__.__name__
+                )
+                await handler(command)
+                self._enqueue_new_events(queue)
+            except HandlerNotFoundException:
+                raise
+            except Exception as e:
+                logger.exception(
+                    'Failed to handle command: %s',
+                    command.__class__.__name__,
+                    exc_info=e,
+                )
+                raise
+            logger.info('Command handled successfully: %s', command.__class__.__name__)
 
-    async def _handle_event(self, event: BaseEvent):
+    async def _handle_event(self, event: BaseEvent, queue: deque[Message]):
         logger.info('Handling event: %s', event.__class__.__name__)
         handlers = self.events_map.get(event.__class__)
-        if not handlers:
+        if handlers is None:
             logger.error('No handlers registered for event: %s', event.__class__.__name__)
             return
 
@@ -93,7 +133,7 @@ class MessageBus:
                     event.__class__.__name__
                 )
                 await handler(event)
-                self.queue.extend(self.collect_new_event())
+                self._enqueue_new_events(queue)
             except Exception as e:
                 logger.exception(
                     'Handler %s failed for event %s',
@@ -105,5 +145,6 @@ class MessageBus:
 
     def collect_new_event(self):
         for notification in self.repo.loaded_notifications:
-            while notification.events:
-                yield notification.events.pop(0)
+            events = notification.events.copy()
+            notification.events.clear()
+            yield from events
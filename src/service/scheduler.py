@@ -0,0 +1,166 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from domain.commands.base import BaseCommand
+from domain.entities.schedules import ScheduledCommandEntity
+from infrastructure.repositories.base import BaseScheduledCommandRepository
+from service.message_bus import MessageBus
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CommandScheduler:
+    bus: MessageBus
+    repo: BaseScheduledCommandRepository
+    window: float = 60.0
+    poll_interval: float = 5.0
+    batch_size: int = 1000
+    lease: float = 300.0
+    max_attempts: int = 5
+    retry_delay: float = 30.0
+    max_concurrent_dispatches: int = 16
+    pending: list[tuple[datetime, int, ScheduledCommandEntity]] = field(default_factory=list, init=False, repr=False)
+    dispatched: int = field(default=0, init=False)
+    failed: int = field(default=0, init=False)
+    scheduler_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _wakeup: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    _sequence: itertools.count = field(default_factory=itertools.count, init=False, repr=False)
+    _dispatch_limiter: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._dispatch_limiter = asyncio.Semaphore(self.max_concurrent_dispatches)
+
+    async def start(self):
+        if self.scheduler_task is None:
+            self.scheduler_task = asyncio.create_task(self._schedule_periodically())
+
+    async def stop(self):
+        if self.scheduler_task:
+            self.scheduler_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.scheduler_task
+            self.scheduler_task = None
+
+        if self.pending:
+            scheduled_command_ids = [scheduled_command.id for _, _, scheduled_command in self.pending]
+            self.pending.clear()
+            try:
+                await self.repo.release(scheduled_command_ids)
+            except Exception as e:
+                logger.error('Failed to release %d scheduled commands: %s', len(scheduled_command_ids), str(e))
+
+    async def schedule(self, command: BaseCommand, due_at: datetime) -> ScheduledCommandEntity:
+        scheduled_command = ScheduledCommandEntity(id=command.command_id, command=command, due_at=due_at)
+        await self.repo.add(scheduled_command)
+        logger.info('Scheduled %s at %s', command.__class__.__name__, due_at.isoformat())
+
+        if due_at <= datetime.now(timezone.utc) + timedelta(seconds=self.window):
+            self._wakeup.set()
+        return scheduled_command
+
+    async def tick(self) -> int:
+        now = datetime.now(timezone.utc)
+        if len(self.pending) < self.batch_size:
+            claimed = await self.repo.claim_due(
+                until=now + timedelta(seconds=self.window),
+                limit=self.batch_size - len(self.pending),
+                lease=self.window + self.lease,
+            )
+            for scheduled_command in claimed:
+                heapq.heappush(self.pending, (scheduled_command.due_at, next(self._sequence), scheduled_command))
+
+        due = []
+        while self.pending and self.pending[0][0] <= now:
+            due.append(heapq.heappop(self.pending)[2])
+
+        if due:
+            renewal_task = asyncio.create_task(self._renew_leases(due))
+            try:
+                await asyncio.gather(*(self._dispatch(scheduled_command) for scheduled_command in due))
+            finally:
+                renewal_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await renewal_task
+        return len(due)
+
+    def get_next_tick_delay(self) -> float:
+        delay = self.poll_interval
+        if self.pending:
+            delay = min(delay, (self.pending[0][0] - datetime.now(timezone.utc)).total_seconds())
+        return max(delay, 0.0)
+
+    async def _dispatch(self, scheduled_command: ScheduledCommandEntity):
+        command_name = scheduled_command.command.__class__.__name__
+        async with self._dispatch_limiter:
+            try:
+                await self.bus.handle(scheduled_command.command)
+            except Exception as e:
+                await self._retry_or_drop(scheduled_command, e)
+                return
+
+            self.dispatched += 1
+            try:
+                await self.repo.remove(scheduled_command.id)
+            except Exception as e:
+                logger.error('Failed to remove dispatched %s \'%s\': %s', command_name, scheduled_command.id, str(e))
+
+    async def _renew_leases(self, dispatching: list[ScheduledCommandEntity]):
+        # Dispatching a large batch through a slow provider can outlast the claim lease;
+        # keep the batch and the still pending commands locked so no other instance reclaims them.
+        while True:
+            await asyncio.sleep(self.lease / 3)
+            scheduled_command_ids = [scheduled_command.id for scheduled_command in dispatching]
+            scheduled_command_ids.extend(scheduled_command.id for _, _, scheduled_command in self.pending)
+            try:
+                await self.repo.renew(scheduled_command_ids, self.window + self.lease)
+            except Exception as e:
+                logger.error('Failed to renew leases of %d scheduled commands: %s', len(scheduled_command_ids), str(e))
+
+    async def _retry_or_drop(self, scheduled_command: ScheduledCommandEntity, error: Exception):
+        command_name = scheduled_command.command.__class__.__name__
+        attempts = scheduled_command.attempts + 1
+        try:
+            if attempts >= self.max_attempts:
+                self.failed += 1
+                logger.error(
+                    'Dropping scheduled %s \'%s\' after %d attempts: %s',
+                    command_name,
+                    scheduled_command.id,
+                    attempts,
+                    str(error),
+                )
+                await self.repo.remove(scheduled_command.id)
+                return
+
+            due_at = datetime.now(timezone.utc) + timedelta(seconds=self.retry_delay * 2 ** (attempts - 1))
+            logger.warning(
+                'Scheduled %s \'%s\' failed (attempt %d), retrying at %s: %s',
+                command_name,
+                scheduled_command.id,
+                attempts,
+                due_at.isoformat(),
+                str(error),
+            )
+            await self.repo.reschedule(scheduled_command.id, due_at, attempts)
+        except Exception as e:
+            logger.error('Failed to reschedule %s \'%s\': %s', command_name, scheduled_command.id, str(e))
+
+    async def _schedule_periodically(self):
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception('Failed to dispatch scheduled commands: %s', str(e))
+
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.get_next_tick_delay())
+            self._wakeup.clear()
@@ -11,8 +11,17 @@ class Settings(BaseSettings):
     NOTIFICATION_SERVICE_API_HOST: str = '127.0.0.1'
     NOTIFICATION_SERVICE_API_PORT: int
     NOTIFICATION_SERVICE_API_PREFIX: str = '/api/v1'
+    NOTIFICATION_SERVICE_API_MAX_PAGE_SIZE: int = 1000
     NOTIFICATION_SERVICE_API_DOCS_URL: str = '/api/docs'
     NOTIFICATION_SERVICE_DEBUG: bool = True
+    NOTIFICATION_SERVICE_METRICS_ENABLED: bool = True
+    NOTIFICATION_SERVICE_METRICS_PATH: str = '/metrics'
+    NOTIFICATION_SERVICE_HEALTH_PATH: str = '/health'
+    NOTIFICATION_SERVICE_HEALTH_CACHE_TTL: float = 5.0
+    NOTIFICATION_SERVICE_HEALTH_CHECK_TIMEOUT: float = 2.0
+    NOTIFICATION_SERVICE_TRACING_ENABLED: bool = False
+    NOTIFICATION_SERVICE_TRACING_SAMPLE_RATIO: float = 0.1
+    NOTIFICATION_SERVICE_TRACING_EXPORTER: str = 'otlp'
 
     MONGODB_HOST: str
     MONGODB_PORT: int
@@ -20,6 +29,19 @@ class Settings(BaseSettings):
     MONGODB_PASSWORD: str
     MONGODB_DB: str
 
+    NOTIFICATIONS_WRITE_BEHIND: bool = False
+    NOTIFICATIONS_FLUSH_SIZE: int = 100
+    NOTIFICATIONS_FLUSH_INTERVAL: float = 0.5
+    NOTIFICATIONS_MAX_BUFFER_SIZE: int = 10000
+    NOTIFICATIONS_QUERY_BATCH_SIZE: int = 500
+    NOTIFICATIONS_RETENTION_SECONDS: int | None = None
+    NOTIFICATIONS_ARCHIVE_DIR: Path | None = None
+    NOTIFICATIONS_ARCHIVE_INTERVAL: float = 3600.0
+    NOTIFICATIONS_ARCHIVE_BATCH_SIZE: int = 1000
+    NOTIFICATIONS_ARCHIVE_GRACE_SECONDS: int = 86400
+    NOTIFICATION_TEMPLATES_CACHE_TTL: float = 300.0
+    NOTIFICATION_TEMPLATES_CACHE_WATCH_CHANGES: bool = False
+
     RABBITMQ_HOST: str
     RABBITMQ_USER: str
     RABBITMQ_PASSWORD: str
@@ -29,6 +51,36 @@ class Settings(BaseSettings):
     NANOSERVICES_EXCH_NAME: str
     NOTIFICATION_SERVICE_QUEUE_NAME: str = 'notification_service_queue'
     NOTIFICATION_SERVICE_CONSUMING_TOPICS: list[str] = ['user.#']
+    NOTIFICATION_SERVICE_MAX_CONCURRENT_MESSAGES: int = 16
+    NOTIFICATION_SERVICE_PRIORITY_TOPICS: list[str] = ['user.password.reset.initiated', 'user.*.update.initiated']
+    NOTIFICATION_SERVICE_PRIORITY_MAX_CONCURRENT_MESSAGES: int = 4
+    RABBITMQ_PREFETCH_COUNT: int = 32
+    RABBITMQ_PUBLISH_BATCH_SIZE: int = 100
+    RABBITMQ_OUTBOX_MAX_SIZE: int = 10000
+    RABBITMQ_OUTBOX_FLUSH_INTERVAL: float = 1.0
+    OUTBOX_RELAY_ENABLED: bool = True
+    OUTBOX_RELAY_BATCH_SIZE: int = 100
+    OUTBOX_RELAY_INTERVAL: float = 1.0
+    NOTIFICATION_SERVICE_DISPATCHER_LANES: int = 16
+    NOTIFICATION_SERVICE_DISPATCHER_LANE_DEPTH: int = 8
+    NOTIFICATION_SERVICE_DISPATCHER_PARTITION_KEY: str = 'user_id'
+    NOTIFICATION_SERVICE_MESSAGE_BUS_MAX_QUEUE_SIZE: int | None = None
+    NOTIFICATION_SERVICE_MAX_RETRIES: int = 5
+    NOTIFICATION_SERVICE_RETRY_BASE_DELAY: float = 1.0
+    NOTIFICATION_SERVICE_RETRY_MAX_DELAY: float = 300.0
+    NOTIFICATION_SERVICE_RETRY_JITTER: float = 0.2
+    NOTIFICATION_SERVICE_IDEMPOTENCY_ENABLED: bool = True
+    NOTIFICATION_SERVICE_IDEMPOTENCY_PERSISTENT: bool = True
+    NOTIFICATION_SERVICE_IDEMPOTENCY_CACHE_SIZE: int = 100_000
+    NOTIFICATION_SERVICE_IDEMPOTENCY_LEASE: float = 300.0
+    NOTIFICATION_SERVICE_SCHEDULER_ENABLED: bool = True
+    NOTIFICATION_SERVICE_SCHEDULER_WINDOW: float = 60.0
+    NOTIFICATION_SERVICE_SCHEDULER_POLL_INTERVAL: float = 5.0
+    NOTIFICATION_SERVICE_SCHEDULER_BATCH_SIZE: int = 1000
+    NOTIFICATION_SERVICE_SCHEDULER_LEASE: float = 300.0
+    NOTIFICATION_SERVICE_SCHEDULER_MAX_ATTEMPTS: int = 5
+    NOTIFICATION_SERVICE_SCHEDULER_RETRY_DELAY: float = 30.0
+    NOTIFICATION_SERVICE_SCHEDULER_MAX_CONCURRENT_DISPATCHES: int = 16
 
     SMTP_HOST: str
     SMTP_USER: str
@@ -36,9 +88,19 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str
     SMTP_USE_TLS: bool = False
     SMTP_USE_SSL: bool = False
+    SMTP_POOL_MIN_SIZE: int = 1
+    SMTP_POOL_MAX_SIZE: int = 10
+    SMTP_POOL_IDLE_TIMEOUT: float = 60.0
+    SMTP_POOL_HEALTH_CHECK_INTERVAL: float = 30.0
+    SMTP_MASS_EMAIL_CHUNK_SIZE: int = 50
+    SMTP_MASS_EMAIL_CONCURRENCY: int = 10
 
     TWILIO_ACCOUNT_SID: str
     TWILIO_AUTH_TOKEN: str
+    TWILIO_API_BASE_URL: str | None = None
+    TWILIO_TIMEOUT: float = 10.0
+    TWILIO_MESSAGES_PER_SECOND: float = 1.0
+    TWILIO_MASS_SMS_BATCH_SIZE: int = 100
 
     FROM_EMAIL: str
     FROM_PHONE_NUMBER: str
@@ -46,6 +108,10 @@ class Settings(BaseSettings):
 
     LOG_LEVEL: int = logging.WARNING  # one of logging.getLevelNamesMapping().values()
     LOG_FORMAT: str = '[%(asctime)s.%(msecs)03d] %(module)10s:%(lineno)-3d %(levelname)s - %(message)s'
+    LOG_JSON: bool = False
+    LOG_QUEUE_ENABLED: bool = True
+    LOG_RATE_LIMIT: float = 0.0  # INFO and lower records per second per logger, 0 disables
+    LOG_RATE_LIMIT_BURST: int = 100
 
     @property
     def MONGODB_URL(self):
@@ -59,6 +125,14 @@ class Settings(BaseSettings):
             f'?authSource=admin'
         )
 
+    @property
+    def NOTIFICATIONS_EXPIRE_AFTER_SECONDS(self) -> int | None:
+        if self.NOTIFICATIONS_RETENTION_SECONDS is None:
+            return None
+        if self.NOTIFICATIONS_ARCHIVE_DIR is None:
+            return self.NOTIFICATIONS_RETENTION_SECONDS
+        return self.NOTIFICATIONS_RETENTION_SECONDS + self.NOTIFICATIONS_ARCHIVE_GRACE_SECONDS
+
     model_config = SettingsConfigDict(
         env_file=BASE_PATH / '.env',
         case_sensitive=True
@@ -4,6 +4,8 @@ from punq import Container, Scope
 
 from application.external_events.consumers.base import BaseConsumer
 from application.external_events.consumers.rabbitmq import RabbitMQConsumer
+from application.external_events.dispatchers.base import BaseExternalEventDispatcher
+from application.external_events.dispatchers.partitioned import PartitionedExternalEventDispatcher
 from application.external_events.handlers.base import BaseExternalEventHandler
 from application.external_events.handlers.notifications import (
     UserRegistrationCompletedExternalEventHandler,
@@ -23,14 +25,34 @@ from domain.commands.notifications import (
     SendUserPhoneNumberUpdatedMessageCommand,
 )
 from domain.events.base import BaseEvent
+from domain.events.notifications import NotificationCreatedEvent
+from infrastructure.idempotency.base import BaseIdempotencyStore
+from infrastructure.idempotency.memory import InMemoryIdempotencyStore
+from infrastructure.idempotency.mongodb import BeanieIdempotencyStore
 from infrastructure.producers.base import BaseProducer
+from infrastructure.producers.outbox import OutboxRelay
 from infrastructure.producers.rabbitmq import RabbitMQProducer
-from infrastructure.repositories.base import BaseNotificationRepository, BaseNotificationTemplateRepository
-from infrastructure.repositories.mongodb import BeanieNotificationRepository, BeanieNotificationTemplateRepository
+from infrastructure.renderers.base import BaseNotificationTemplateRenderer
+from infrastructure.renderers.compiled import CompiledNotificationTemplateRenderer
+from infrastructure.repositories.base import (
+    BaseNotificationQueryRepository,
+    BaseNotificationRepository,
+    BaseNotificationTemplateRepository,
+    BaseScheduledCommandRepository,
+)
+from infrastructure.repositories.buffered import BufferedBeanieNotificationRepository
+from infrastructure.repositories.cached import CachedNotificationTemplateRepository
+from infrastructure.repositories.mongodb import (
+    BeanieNotificationQueryRepository,
+    BeanieNotificationRepository,
+    BeanieNotificationTemplateRepository,
+    BeanieScheduledCommandRepository,
+)
 from infrastructure.senders.email.base import BaseEmailSender
 from infrastructure.senders.email.smtp import SMTPEmailSender
 from infrastructure.senders.sms.base import BaseSMSSender
 from infrastructure.senders.sms.twilio import TwilioSMSSender
+from infrastructure.storages.archive import NotificationArchiver
 from service.handlers.command.base import BaseCommandHandler
 from service.handlers.command.notifications import (
     SendUserRegistrationCompletedMessageCommandHandler,
@@ -42,6 +64,7 @@ from service.handlers.command.notifications import (
 )
 from service.handlers.event.base import BaseEventHandler
 from service.message_bus import MessageBus
+from service.scheduler import CommandScheduler
 from settings.config import Settings, settings
 
 
@@ -50,38 +73,48 @@ def get_commands_map(
     notification_repo: BaseNotificationRepository,
     email_sender: BaseEmailSender,
     sms_sender: BaseSMSSender,
+    template_renderer: BaseNotificationTemplateRenderer | None = None,
 ) -> dict[type[BaseCommand], BaseCommandHandler]:
+    if template_renderer is None:
+        template_renderer = CompiledNotificationTemplateRenderer()
+
     send_user_registration_completed_message_handler = SendUserRegistrationCompletedMessageCommandHandler(
         notification_template_repo=notification_template_repo,
         notification_repo=notification_repo,
         email_sender=email_sender,
         sms_sender=sms_sender,
+        template_renderer=template_renderer,
     )
     send_user_email_update_initiated_message_handler = SendUserEmailUpdateInitiatedMessageCommandHandler(
         notification_template_repo=notification_template_repo,
         notification_repo=notification_repo,
         email_sender=email_sender,
+        template_renderer=template_renderer,
     )
     send_user_phone_number_update_initiated_message_handler = SendUserPhoneNumberUpdateInitiatedMessageCommandHandler(
         notification_template_repo=notification_template_repo,
         notification_repo=notification_repo,
         sms_sender=sms_sender,
+        template_renderer=template_renderer,
     )
     send_user_password_reset_initiated_message_handler = SendUserPasswordResetInitiatedMessageCommandHandler(
         notification_template_repo=notification_template_repo,
         notification_repo=notification_repo,
         email_sender=email_sender,
         sms_sender=sms_sender,
+        template_renderer=template_renderer,
     )
     send_user_email_updated_message_handler = SendUserEmailUpdatedMessageCommandHandler(
         notification_template_repo=notification_template_repo,
         notification_repo=notification_repo,
         email_sender=email_sender,
+        template_renderer=template_renderer,
     )
     send_user_phone_number_updated_message_handler = SendUserPhoneNumberUpdatedMessageCommandHandler(
         notification_template_repo=notification_template_repo,
         notification_repo=notification_repo,
         sms_sender=sms_sender,
+        template_renderer=template_renderer,
     )
 
     commands_map = {
@@ -96,17 +129,41 @@ def get_commands_map(
 
 
 def get_events_map(producer: BaseProducer) -> dict[type[BaseEvent], list[BaseEventHandler]]:
-    events_map = {}
+    events_map = {
+        NotificationCreatedEvent: [],
+    }
     return events_map
 
 
-def get_external_events_map(bus: MessageBus) -> dict[str, BaseExternalEventHandler]:
-    user_registration_completed_handler = UserRegistrationCompletedExternalEventHandler(bus=bus)
-    user_email_update_initiated_handler = UserEmailUpdateInitiatedExternalEventHandler(bus=bus)
-    user_phone_number_update_initiated_handler = UserPhoneNumberUpdateInitiatedExternalEventHandler(bus=bus)
-    user_password_reset_initiated_handler = UserPasswordResetInitiatedExternalEventHandler(bus=bus)
-    user_email_updated_handler = UserEmailUpdatedExternalEventHandler(bus=bus)
-    user_phone_number_updated_handler = UserPhoneNumberUpdatedExternalEventHandler(bus=bus)
+def get_event_topics() -> dict[type[BaseEvent], str]:
+    event_topics = {
+        NotificationCreatedEvent: 'notification.created',
+    }
+    return event_topics
+
+
+def get_scheduled_command_types() -> dict[str, type[BaseCommand]]:
+    command_types = [
+        SendUserRegistrationCompletedMessageCommand,
+        SendUserEmailUpdateInitiatedMessageCommand,
+        SendUserPhoneNumberUpdateInitiatedMessageCommand,
+        SendUserPasswordResetInitiatedMessageCommand,
+        SendUserEmailUpdatedMessageCommand,
+        SendUserPhoneNumberUpdatedMessageCommand,
+    ]
+    return {command_type.__name__: command_type for command_type in command_types}
+
+
+def get_external_events_map(
+    bus: MessageBus,
+    scheduler: CommandScheduler | None = None,
+) -> dict[str, BaseExternalEventHandler]:
+    user_registration_completed_handler = UserRegistrationCompletedExternalEventHandler(bus=bus, scheduler=scheduler)
+    user_email_update_initiated_handler = UserEmailUpdateInitiatedExternalEventHandler(bus=bus, scheduler=scheduler)
+    user_phone_number_update_initiated_handler = UserPhoneNumberUpdateInitiatedExternalEventHandler(bus=bus, scheduler=scheduler)
+    user_password_reset_initiated_handler = UserPasswordResetInitiatedExternalEventHandler(bus=bus, scheduler=scheduler)
+    user_email_updated_handler = UserEmailUpdatedExternalEventHandler(bus=bus, scheduler=scheduler)
+    user_phone_number_updated_handler = UserPhoneNumberUpdatedExternalEventHandler(bus=bus, scheduler=scheduler)
 
     external_events_map = {
         'user.registration.completed': user_registration_completed_handler,
@@ -123,11 +180,27 @@ def _initialize_container() -> Container:
     container = Container()
 
     def initialize_notification_template_beanie_db_repo() -> BaseNotificationTemplateRepository:
-        return BeanieNotificationTemplateRepository()
+        return CachedNotificationTemplateRepository(
+            repo=BeanieNotificationTemplateRepository(),
+            ttl=settings.NOTIFICATION_TEMPLATES_CACHE_TTL,
+            watch_changes=settings.NOTIFICATION_TEMPLATES_CACHE_WATCH_CHANGES,
+        )
 
 
     def initialize_notification_beanie_db_repo() -> BaseNotificationRepository:
-        return BeanieNotificationRepository()
+        if not settings.NOTIFICATIONS_WRITE_BEHIND:
+            return BeanieNotificationRepository(event_topics=get_event_topics())
+
+        return BufferedBeanieNotificationRepository(
+            event_topics=get_event_topics(),
+            flush_size=settings.NOTIFICATIONS_FLUSH_SIZE,
+            flush_interval=settings.NOTIFICATIONS_FLUSH_INTERVAL,
+            max_buffer_size=settings.NOTIFICATIONS_MAX_BUFFER_SIZE,
+        )
+
+
+    def initialize_notification_query_repo() -> BaseNotificationQueryRepository:
+        return BeanieNotificationQueryRepository(batch_size=settings.NOTIFICATIONS_QUERY_BATCH_SIZE)
 
 
     def initialize_email_sender() -> BaseEmailSender:
@@ -138,6 +211,12 @@ def _initialize_container() -> Container:
             password=settings.SMTP_PASSWORD,
             use_tls=settings.SMTP_USE_TLS,
             use_ssl=settings.SMTP_USE_SSL,
+            pool_min_size=settings.SMTP_POOL_MIN_SIZE,
+            pool_max_size=settings.SMTP_POOL_MAX_SIZE,
+            pool_idle_timeout=settings.SMTP_POOL_IDLE_TIMEOUT,
+            pool_health_check_interval=settings.SMTP_POOL_HEALTH_CHECK_INTERVAL,
+            mass_email_chunk_size=settings.SMTP_MASS_EMAIL_CHUNK_SIZE,
+            mass_email_concurrency=settings.SMTP_MASS_EMAIL_CONCURRENCY,
         )
 
 
@@ -145,6 +224,19 @@ def _initialize_container() -> Container:
         return TwilioSMSSender(
             account_sid=settings.TWILIO_ACCOUNT_SID,
             auth_token=settings.TWILIO_AUTH_TOKEN,
+            api_base_url=settings.TWILIO_API_BASE_URL,
+            timeout=settings.TWILIO_TIMEOUT,
+            messages_per_second=settings.TWILIO_MESSAGES_PER_SECOND,
+            mass_sms_batch_size=settings.TWILIO_MASS_SMS_BATCH_SIZE,
+        )
+
+
+    def initialize_notification_archiver() -> NotificationArchiver:
+        return NotificationArchiver(
+            directory=settings.NOTIFICATIONS_ARCHIVE_DIR,
+            retention=settings.NOTIFICATIONS_RETENTION_SECONDS,
+            interval=settings.NOTIFICATIONS_ARCHIVE_INTERVAL,
+            batch_size=settings.NOTIFICATIONS_ARCHIVE_BATCH_SIZE,
         )
 
 
@@ -153,7 +245,8 @@ def _initialize_container() -> Container:
         notification_repo: BaseNotificationRepository = None,
         email_sender: BaseEmailSender = None,
         sms_sender: BaseSMSSender = None,
-        producer: BaseProducer = None
+        producer: BaseProducer = None,
+        template_renderer: BaseNotificationTemplateRenderer = None,
     ) -> MessageBus:
         if notification_template_repo is None:
             notification_template_repo = container.resolve(BaseNotificationTemplateRepository)
@@ -170,6 +263,9 @@ def _initialize_container() -> Container:
         if producer is None:
             producer = container.resolve(BaseProducer)
 
+        if template_renderer is None:
+            template_renderer = container.resolve(BaseNotificationTemplateRenderer)
+
         bus = MessageBus(
             repo=notification_repo,
             commands_map=get_commands_map(
@@ -177,10 +273,12 @@ def _initialize_container() -> Container:
                 notification_repo=notification_repo,
                 email_sender=email_sender,
                 sms_sender=sms_sender,
+                template_renderer=template_renderer,
             ),
             events_map=get_events_map(
                 producer=producer,
             ),
+            max_queue_size=settings.NOTIFICATION_SERVICE_MESSAGE_BUS_MAX_QUEUE_SIZE,
         )
         return bus
 
@@ -193,17 +291,87 @@ def _initialize_container() -> Container:
             password=settings.RABBITMQ_PASSWORD,
             virtual_host=settings.RABBITMQ_VHOST,
             exchange_name=settings.NANOSERVICES_EXCH_NAME,
+            publish_batch_size=settings.RABBITMQ_PUBLISH_BATCH_SIZE,
+            outbox_max_size=settings.RABBITMQ_OUTBOX_MAX_SIZE,
+            outbox_flush_interval=settings.RABBITMQ_OUTBOX_FLUSH_INTERVAL,
+        )
+
+
+    def initialize_outbox_relay(producer: BaseProducer = None) -> OutboxRelay:
+        if producer is None:
+            producer = container.resolve(BaseProducer)
+
+        return OutboxRelay(
+            producer=producer,
+            batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+            interval=settings.OUTBOX_RELAY_INTERVAL,
+        )
+
+
+    def initialize_external_event_dispatcher() -> BaseExternalEventDispatcher:
+        return PartitionedExternalEventDispatcher(
+            lanes_count=settings.NOTIFICATION_SERVICE_DISPATCHER_LANES,
+            lane_depth=settings.NOTIFICATION_SERVICE_DISPATCHER_LANE_DEPTH,
+            partition_key=settings.NOTIFICATION_SERVICE_DISPATCHER_PARTITION_KEY,
+        )
+
+
+    def initialize_idempotency_store() -> BaseIdempotencyStore:
+        if settings.NOTIFICATION_SERVICE_IDEMPOTENCY_PERSISTENT:
+            return BeanieIdempotencyStore(
+                max_cached_keys=settings.NOTIFICATION_SERVICE_IDEMPOTENCY_CACHE_SIZE,
+                lease=settings.NOTIFICATION_SERVICE_IDEMPOTENCY_LEASE,
+            )
+        return InMemoryIdempotencyStore(max_cached_keys=settings.NOTIFICATION_SERVICE_IDEMPOTENCY_CACHE_SIZE)
+
+
+    def initialize_scheduled_command_repo() -> BaseScheduledCommandRepository:
+        return BeanieScheduledCommandRepository(command_types=get_scheduled_command_types())
+
+
+    def initialize_scheduler(
+        bus: MessageBus = None,
+        repo: BaseScheduledCommandRepository = None,
+    ) -> CommandScheduler:
+        if bus is None:
+            bus = container.resolve(MessageBus)
+
+        if repo is None:
+            repo = container.resolve(BaseScheduledCommandRepository)
+
+        return CommandScheduler(
+            bus=bus,
+            repo=repo,
+            window=settings.NOTIFICATION_SERVICE_SCHEDULER_WINDOW,
+            poll_interval=settings.NOTIFICATION_SERVICE_SCHEDULER_POLL_INTERVAL,
+            batch_size=settings.NOTIFICATION_SERVICE_SCHEDULER_BATCH_SIZE,
+            lease=settings.NOTIFICATION_SERVICE_SCHEDULER_LEASE,
+            max_attempts=settings.NOTIFICATION_SERVICE_SCHEDULER_MAX_ATTEMPTS,
+            retry_delay=settings.NOTIFICATION_SERVICE_SCHEDULER_RETRY_DELAY,
+            max_concurrent_dispatches=settings.NOTIFICATION_SERVICE_SCHEDULER_MAX_CONCURRENT_DISPATCHES,
         )
 
 
     def initialize_consumer(
-        bus: MessageBus = None
+        bus: MessageBus = None,
+        dispatcher: BaseExternalEventDispatcher = None,
+        idempotency_store: BaseIdempotencyStore = None,
+        scheduler: CommandScheduler = None,
     ) -> BaseConsumer:
         if bus is None:
             bus = container.resolve(MessageBus)
 
+        if scheduler is None and settings.NOTIFICATION_SERVICE_SCHEDULER_ENABLED:
+            scheduler = container.resolve(CommandScheduler)
+
+        if dispatcher is None:
+            dispatcher = container.resolve(BaseExternalEventDispatcher)
+
+        if idempotency_store is None and settings.NOTIFICATION_SERVICE_IDEMPOTENCY_ENABLED:
+            idempotency_store = container.resolve(BaseIdempotencyStore)
+
         return RabbitMQConsumer(
-            external_events_map=get_external_events_map(bus),
+            external_events_map=get_external_events_map(bus, scheduler),
             host=settings.RABBITMQ_HOST,
             port=settings.RABBITMQ_PORT,
             login=settings.RABBITMQ_USER,
@@ -212,16 +380,34 @@ def _initialize_container() -> Container:
             queue_name=settings.NOTIFICATION_SERVICE_QUEUE_NAME,
             exchange_name=settings.NANOSERVICES_EXCH_NAME,
             consuming_topics=settings.NOTIFICATION_SERVICE_CONSUMING_TOPICS,
+            prefetch_count=settings.RABBITMQ_PREFETCH_COUNT,
+            max_concurrent_messages=settings.NOTIFICATION_SERVICE_MAX_CONCURRENT_MESSAGES,
+            dispatcher=dispatcher,
+            idempotency_store=idempotency_store,
+            max_retries=settings.NOTIFICATION_SERVICE_MAX_RETRIES,
+            retry_base_delay=settings.NOTIFICATION_SERVICE_RETRY_BASE_DELAY,
+            retry_max_delay=settings.NOTIFICATION_SERVICE_RETRY_MAX_DELAY,
+            retry_jitter=settings.NOTIFICATION_SERVICE_RETRY_JITTER,
+            priority_topics=settings.NOTIFICATION_SERVICE_PRIORITY_TOPICS,
+            priority_max_concurrent_messages=settings.NOTIFICATION_SERVICE_PRIORITY_MAX_CONCURRENT_MESSAGES,
         )
 
 
     container.register(Settings, instance=settings, scope=Scope.singleton)
-    container.register(BaseNotificationTemplateRepository, factory=initialize_notification_template_beanie_db_repo)
-    container.register(BaseNotificationRepository, factory=initialize_notification_beanie_db_repo)
+    container.register(BaseNotificationTemplateRepository, factory=initialize_notification_template_beanie_db_repo, scope=Scope.singleton)
+    container.register(BaseNotificationRepository, factory=initialize_notification_beanie_db_repo, scope=Scope.singleton)
+    container.register(BaseNotificationQueryRepository, factory=initialize_notification_query_repo, scope=Scope.singleton)
+    container.register(BaseNotificationTemplateRenderer, CompiledNotificationTemplateRenderer, scope=Scope.singleton)
     container.register(BaseEmailSender, factory=initialize_email_sender, scope=Scope.singleton)
     container.register(BaseSMSSender, factory=initialize_sms_sender, scope=Scope.singleton)
+    container.register(NotificationArchiver, factory=initialize_notification_archiver, scope=Scope.singleton)
     container.register(MessageBus, factory=initialize_message_bus)
     container.register(BaseProducer, factory=initialize_producer, scope=Scope.singleton)
+    container.register(OutboxRelay, factory=initialize_outbox_relay, scope=Scope.singleton)
+    container.register(BaseExternalEventDispatcher, factory=initialize_external_event_dispatcher, scope=Scope.singleton)
+    container.register(BaseIdempotencyStore, factory=initialize_idempotency_store, scope=Scope.singleton)
+    container.register(BaseScheduledCommandRepository, factory=initialize_scheduled_command_repo, scope=Scope.singleton)
+    container.register(CommandScheduler, factory=initialize_scheduler, scope=Scope.singleton)
     container.register(BaseConsumer, factory=initialize_consumer, scope=Scope.singleton)
 
     return container
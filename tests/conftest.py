@@ -13,8 +13,11 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from application.external_events.consumers.rabbitmq import RabbitMQConsumer
 from domain.entities.notifications import EmailNotificationEntity, SMSNotificationEntity
 from domain.value_objects.notifications import PhoneNumberVO, EmailVO
+from infrastructure.models.idempotency import ProcessedMessageModel
 from infrastructure.models.notifications import NotificationModel, NotificationTemplateModel
+from infrastructure.models.schedules import ScheduledCommandModel
 from infrastructure.producers.rabbitmq import RabbitMQProducer
+from infrastructure.repositories.buffered import BufferedBeanieNotificationRepository
 from infrastructure.repositories.mongodb import BeanieNotificationRepository, BeanieNotificationTemplateRepository
 from infrastructure.senders.email.smtp import SMTPEmailSender
 from infrastructure.senders.sms.twilio import TwilioSMSSender
@@ -56,7 +59,7 @@ async def mongodb_db():
 
     await init_beanie(
         database=client[test_settings.TESTS_MONGODB_DB],
-        document_models=[NotificationModel, NotificationTemplateModel]
+        document_models=[NotificationModel, NotificationTemplateModel, ProcessedMessageModel, ScheduledCommandModel]
     )
 
     await run_migrate(
@@ -78,6 +81,14 @@ def beanie_notification_repository():
     return BeanieNotificationRepository()
 
 
+@pytest_asyncio.fixture
+async def buffered_beanie_notification_repository():
+    repo = BufferedBeanieNotificationRepository(flush_size=2, flush_interval=0.05)
+    await repo.start()
+    yield repo
+    await repo.stop()
+
+
 @pytest.fixture
 def beanie_notification_template_repository():
     return BeanieNotificationTemplateRepository()
@@ -1,20 +1,40 @@
 import asyncio
 import logging
 from dataclasses import field, dataclass
-from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Iterable
+from uuid import UUID, uuid4
+
+import orjson
+from aiohttp import web
 
 from application.external_events.consumers.base import BaseConsumer
 from application.external_events.handlers.base import BaseExternalEventHandler
 from domain.commands.base import BaseCommand
-from domain.entities.notifications import EmailNotificationEntity, SMSNotificationEntity
+from domain.entities.notifications import (
+    DeliveryStatus,
+    EmailNotificationEntity,
+    SMSNotificationEntity,
+    is_delivery_status_transition_allowed,
+)
+from domain.entities.schedules import ScheduledCommandEntity
 from domain.events.base import BaseEvent
 from infrastructure.exceptions.notifications import NotificationTemplateNotFoundException, NotificationNotFoundException
-from infrastructure.producers.base import BaseProducer
+from infrastructure.producers.base import BaseProducer, SerializedEvent
 
 
-from infrastructure.repositories.base import BaseNotificationRepository, BaseNotificationTemplateRepository
+from infrastructure.repositories.base import (
+    BaseNotificationQueryRepository,
+    BaseNotificationRepository,
+    BaseNotificationTemplateRepository,
+    BaseScheduledCommandRepository,
+)
+from infrastructure.repositories.queries import NotificationCursor, NotificationFilters
 from infrastructure.senders.email.base import BaseEmailSender
+from infrastructure.senders.email.pool import SMTPConnectionPool
+from infrastructure.senders.reports import MassDeliveryReport
 from infrastructure.senders.sms.base import BaseSMSSender
+from infrastructure.storages.archive import NotificationArchiver
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +52,19 @@ class SingletonMeta(type):
 @dataclass
 class FakeNotificationRepository(BaseNotificationRepository):
     notifications_list: list[EmailNotificationEntity | SMSNotificationEntity] = field(default_factory=list)
+    delivery_statuses: dict[UUID, dict[str, DeliveryStatus]] = field(default_factory=dict)
 
     async def add(
         self,
         notification: EmailNotificationEntity | SMSNotificationEntity
     ) -> None:
         logger.debug('Adding notification with ID \'%s\'', notification.id)
+        if notification.id in self.delivery_statuses:
+            return
         self.notifications_list.append(notification)
+        self.delivery_statuses[notification.id] = {
+            receiver.as_generic(): DeliveryStatus.QUEUED for receiver in notification.receivers
+        }
 
     async def get(
         self,
@@ -52,6 +78,18 @@ class FakeNotificationRepository(BaseNotificationRepository):
         logger.warning('Notification not found: %s', notification_id)
         raise NotificationNotFoundException(notification_id=notification_id)
 
+    async def update_delivery_status(
+        self,
+        notification_id: UUID,
+        status: DeliveryStatus,
+        receivers: Iterable[str] | None = None,
+        error: str | None = None,
+    ) -> None:
+        statuses = self.delivery_statuses.get(notification_id, {})
+        for receiver in statuses if receivers is None else receivers:
+            if receiver in statuses and is_delivery_status_transition_allowed(statuses[receiver], status):
+                statuses[receiver] = status
+
 
 @dataclass
 class FakeNotificationTemplateRepository(BaseNotificationTemplateRepository):
@@ -84,6 +122,68 @@ class FakeNotificationTemplateRepository(BaseNotificationTemplateRepository):
         raise NotificationTemplateNotFoundException(name=name)
 
 
+@dataclass
+class FakeNotificationQueryRepository(BaseNotificationQueryRepository):
+    notifications: list[dict] = field(default_factory=list)
+
+    async def find(
+        self,
+        filters: NotificationFilters,
+        limit: int,
+        cursor: NotificationCursor | None = None,
+    ) -> AsyncIterator[dict]:
+        notifications = sorted(self.notifications, key=lambda n: (n['created_at'], n['id']), reverse=True)
+        for notification in notifications:
+            if limit == 0:
+                return
+            if filters.receiver is not None and filters.receiver not in notification['receivers']:
+                continue
+            if cursor is not None and (notification['created_at'], notification['id']) >= (cursor.created_at, cursor.id):
+                continue
+            limit -= 1
+            yield notification
+
+
+@dataclass
+class FakeScheduledCommandRepository(BaseScheduledCommandRepository):
+    scheduled_commands: dict[UUID, ScheduledCommandEntity] = field(default_factory=dict)
+    locked_until: dict[UUID, datetime] = field(default_factory=dict)
+
+    async def add(self, scheduled_command: ScheduledCommandEntity) -> None:
+        self.scheduled_commands[scheduled_command.id] = scheduled_command
+
+    async def claim_due(self, until: datetime, limit: int, lease: float) -> list[ScheduledCommandEntity]:
+        now = datetime.now(timezone.utc)
+        claimable = sorted(
+            (
+                scheduled_command for scheduled_command in self.scheduled_commands.values()
+                if scheduled_command.due_at <= until and self.locked_until.get(scheduled_command.id, now) <= now
+            ),
+            key=lambda scheduled_command: scheduled_command.due_at,
+        )[:limit]
+        for scheduled_command in claimable:
+            self.locked_until[scheduled_command.id] = now + timedelta(seconds=lease)
+        return claimable
+
+    async def reschedule(self, scheduled_command_id: UUID, due_at: datetime, attempts: int) -> None:
+        self.scheduled_commands[scheduled_command_id].due_at = due_at
+        self.scheduled_commands[scheduled_command_id].attempts = attempts
+        self.locked_until.pop(scheduled_command_id, None)
+
+    async def renew(self, scheduled_command_ids: list[UUID], lease: float) -> None:
+        for scheduled_command_id in scheduled_command_ids:
+            if scheduled_command_id in self.locked_until:
+                self.locked_until[scheduled_command_id] = datetime.now(timezone.utc) + timedelta(seconds=lease)
+
+    async def release(self, scheduled_command_ids: list[UUID]) -> None:
+        for scheduled_command_id in scheduled_command_ids:
+            self.locked_until.pop(scheduled_command_id, None)
+
+    async def remove(self, scheduled_command_id: UUID) -> None:
+        self.scheduled_commands.pop(scheduled_command_id, None)
+        self.locked_until.pop(scheduled_command_id, None)
+
+
 @dataclass
 class FakeEmailSender(BaseEmailSender):
     async def send_targeted_email(
@@ -105,11 +205,14 @@ class FakeEmailSender(BaseEmailSender):
         subject: str,
         text: str,
         html: str | None = None,
-    ) -> None:
-        logger.debug('Sending mass email to %d receivers with subject: %s', len(receivers), subject)
+    ) -> MassDeliveryReport:
+        logger.debug('Sending mass email with subject: %s', subject)
         await asyncio.sleep(0.1)
+        report = MassDeliveryReport()
         for receiver in receivers:
             logger.info('Email sent to %s with subject: %s;\ntext: %s', receiver, subject, text)
+            report.delivered += 1
+        return report
 
 
 @dataclass
@@ -129,11 +232,120 @@ class FakeSMSSender(BaseSMSSender):
         sender: str,
         receivers: list[str],
         text: str,
-    ) -> None:
-        logger.debug('Sending mass SMS to %d receivers', len(receivers))
+        report: MassDeliveryReport | None = None,
+    ) -> MassDeliveryReport:
+        logger.debug('Sending mass SMS')
         await asyncio.sleep(0.1)
+        report = report or MassDeliveryReport()
         for receiver in receivers:
             logger.info('SMS sent to %s with text: %s', receiver, text)
+            report.delivered += 1
+        return report
+
+
+@dataclass
+class FakeSMTP:
+    is_connected: bool = True
+    healthy: bool = True
+    sent_messages: list[tuple[str, list[str], str]] = field(default_factory=list)
+
+    async def noop(self):
+        if not self.healthy:
+            raise ConnectionError('Fake SMTP connection is broken')
+
+    async def sendmail(self, sender: str, recipients: list[str], message: str):
+        await asyncio.sleep(0.01)
+        self.sent_messages.append((sender, list(recipients), message))
+        return {recipient: 'Recipient refused' for recipient in recipients if recipient.startswith('refused')}, 'OK'
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+
+@dataclass
+class FakeSMTPConnectionPool(SMTPConnectionPool):
+    connections: list[FakeSMTP] = field(default_factory=list, kw_only=True)
+
+    async def _open_connection(self) -> FakeSMTP:
+        logger.debug('Opening fake SMTP connection')
+        smtp = FakeSMTP()
+        self.connections.append(smtp)
+        return smtp
+
+
+@dataclass
+class FakeTwilioServer:
+    host: str = '127.0.0.1'
+    port: int = 0
+    response_delay: float = 0.0
+    failing_receivers: set[str] = field(default_factory=set)
+    messages: list[dict[str, str]] = field(default_factory=list)
+    runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/2010-04-01/Accounts/{account_sid}/Messages.json', self.create_message)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        logger.debug('Fake Twilio server listening on %s', self.url)
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def create_message(self, request: web.Request) -> web.Response:
+        data = dict(await request.post())
+        await asyncio.sleep(self.response_delay)
+        if data.get('To') in self.failing_receivers:
+            return web.json_response(
+                {'code': 21211, 'message': f'The \'To\' number {data.get('To')} is not a valid phone number.', 'status': 400},
+                status=400,
+            )
+        self.messages.append(data)
+        return web.json_response(
+            {
+                'sid': f'SM{uuid4().hex}',
+                'account_sid': request.match_info['account_sid'],
+                'from': data.get('From'),
+                'to': data.get('To'),
+                'body': data.get('Body'),
+                'status': 'queued',
+            },
+            status=201,
+        )
+
+
+@dataclass
+class FakeNotificationArchiver(NotificationArchiver):
+    documents: list[dict] = field(default_factory=list)
+
+    async def _find_expired(self, cutoff: datetime) -> AsyncIterator[dict]:
+        for document in sorted(self.documents, key=lambda document: document['created_at']):
+            if document['created_at'] < cutoff.isoformat():
+                yield document
+
+    async def _delete_expired(self, cutoff: datetime) -> int:
+        expired = [document for document in self.documents if document['created_at'] < cutoff.isoformat()]
+        self.documents = [document for document in self.documents if document not in expired]
+        return len(expired)
 
 
 @dataclass
@@ -156,6 +368,11 @@ class FakeProducer(BaseProducer):
         logger.debug('Publishing event to topic: %s', topic)
         self.broker.queue.append({'topic': topic, 'event': event.__class__.__name__, 'body': event.__dict__})
 
+    async def publish_serialized(self, events: Iterable[SerializedEvent], buffer: bool = True):
+        for event in events:
+            logger.debug('Publishing serialized event to topic: %s', event.topic)
+            self.broker.queue.append({'topic': event.topic, 'event': event.event_type, 'body': orjson.loads(event.body)})
+
 
 @dataclass
 class FakeConsumer(BaseConsumer):
@@ -32,3 +32,35 @@ class TestRabbitMQConsumer:
         assert handler.body == orjson.loads(orjson.dumps(event.__dict__))
 
         consuming_task.cancel()
+
+    async def test_consumer_processes_messages_concurrently(self, rabbitmq_consumer, rabbitmq_producer):
+        in_flight, max_in_flight, processed = 0, 0, 0
+
+        async def slow_handler(body: dict) -> None:
+            nonlocal in_flight, max_in_flight, processed
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.2)
+            in_flight -= 1
+            processed += 1
+
+        await rabbitmq_consumer.stop()
+        rabbitmq_consumer.prefetch_count = 4
+        rabbitmq_consumer.max_concurrent_messages = 4
+        await rabbitmq_consumer.start()
+        rabbitmq_consumer.external_events_map = {'fake.notification.topic': slow_handler}
+
+        for _ in range(4):
+            await rabbitmq_producer.publish(event=FakeEvent(), topic='fake.notification.topic')
+        consuming_task = asyncio.create_task(rabbitmq_consumer.consume())
+
+        retry_count = 0
+        max_retries = 10
+        while processed < 4 and retry_count < max_retries:
+            await asyncio.sleep(0.1)
+            retry_count += 1
+
+        assert processed == 4
+        assert max_in_flight > 1
+
+        consuming_task.cancel()
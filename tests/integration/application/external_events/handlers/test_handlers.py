@@ -77,7 +77,7 @@ class TestExternalEventHandlers:
         message_bus.repo = beanie_notification_repository
 
         handler = UserRegistrationCompletedExternalEventHandler(bus=message_bus)
-        with expectation:
+        with expectation, beanie_notification_repository.scope():
             await handler(body)
 
             assert len(beanie_notification_repository.loaded_notifications) == 1
@@ -111,7 +111,7 @@ class TestExternalEventHandlers:
         message_bus.repo = beanie_notification_repository
 
         handler = UserEmailUpdateInitiatedExternalEventHandler(bus=message_bus)
-        with expectation:
+        with expectation, beanie_notification_repository.scope():
             await handler(body)
 
             assert len(beanie_notification_repository.loaded_notifications) == 1
@@ -141,7 +141,7 @@ class TestExternalEventHandlers:
         message_bus.repo = beanie_notification_repository
 
         handler = UserPhoneNumberUpdateInitiatedExternalEventHandler(bus=message_bus)
-        with expectation:
+        with expectation, beanie_notification_repository.scope():
             await handler(body)
 
             assert len(beanie_notification_repository.loaded_notifications) == 1
@@ -196,7 +196,7 @@ class TestExternalEventHandlers:
         message_bus.repo = beanie_notification_repository
 
         handler = UserPasswordResetInitiatedExternalEventHandler(bus=message_bus)
-        with expectation:
+        with expectation, beanie_notification_repository.scope():
             await handler(body)
 
             assert len(beanie_notification_repository.loaded_notifications) == 1
@@ -231,7 +231,7 @@ class TestExternalEventHandlers:
         message_bus.repo = beanie_notification_repository
 
         handler = UserEmailUpdatedExternalEventHandler(bus=message_bus)
-        with expectation:
+        with expectation, beanie_notification_repository.scope():
             await handler(body)
 
             assert len(beanie_notification_repository.loaded_notifications) == 1
@@ -261,7 +261,7 @@ class TestExternalEventHandlers:
         message_bus.repo = beanie_notification_repository
 
         handler = UserPhoneNumberUpdatedExternalEventHandler(bus=message_bus)
-        with expectation:
+        with expectation, beanie_notification_repository.scope():
             await handler(body)
 
             assert len(beanie_notification_repository.loaded_notifications) == 1
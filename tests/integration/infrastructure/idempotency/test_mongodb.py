@@ -0,0 +1,28 @@
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.idempotency.mongodb import BeanieIdempotencyStore
+
+
+@pytest.mark.asyncio
+class TestBeanieIdempotencyStore:
+    async def test_claim_is_shared_between_processes(self, mongodb_db):
+        key = str(uuid4())
+        first, second = BeanieIdempotencyStore(), BeanieIdempotencyStore()
+
+        assert await first.claim(key) is True
+        assert await second.claim(key) is False
+
+        await first.complete(key)
+        assert await BeanieIdempotencyStore(lease=0).claim(key) is False
+
+    async def test_released_or_expired_claims_can_be_reclaimed(self, mongodb_db):
+        key = str(uuid4())
+        store = BeanieIdempotencyStore()
+
+        await store.claim(key)
+        await store.release(key)
+        assert await BeanieIdempotencyStore().claim(key) is True
+
+        assert await BeanieIdempotencyStore(lease=0).claim(key) is True
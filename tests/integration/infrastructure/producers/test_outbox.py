@@ -0,0 +1,28 @@
+import pytest
+
+from infrastructure.models.notifications import NotificationModel
+from infrastructure.producers.outbox import OutboxRelay
+from infrastructure.repositories.mongodb import BeanieNotificationRepository
+from tests.fakes import FakeEvent
+
+
+@pytest.mark.asyncio
+class TestOutboxRelay:
+    async def test_outbox_events_are_persisted_and_relayed(
+        self, mongodb_db, random_email_notification_entity, rabbitmq_producer,
+    ):
+        event = FakeEvent()
+        random_email_notification_entity.events.append(event)
+        repo = BeanieNotificationRepository(event_topics={FakeEvent: 'fake.notification.topic'})
+        await repo.add(random_email_notification_entity)
+
+        notification = await NotificationModel.get(random_email_notification_entity.id)
+        assert [entry.event_id for entry in notification.outbox] == [str(event.event_id)]
+
+        relay = OutboxRelay(producer=rabbitmq_producer)
+        while await relay.relay_once():
+            pass
+
+        notification = await NotificationModel.get(random_email_notification_entity.id)
+        assert notification.outbox == []
+        assert relay.relayed_events >= 1
@@ -1,9 +1,20 @@
+import asyncio
 import logging
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
 
+from domain.commands.notifications import SendUserEmailUpdatedMessageCommand
+from domain.entities.notifications import DeliveryStatus, EmailNotificationEntity
+from domain.entities.schedules import ScheduledCommandEntity
+from domain.value_objects.notifications import EmailVO
 from infrastructure.exceptions.notifications import NotificationTemplateNotFoundException, NotificationNotFoundException
+from infrastructure.models.notifications import NotificationModel, NotificationTemplateModel
+from infrastructure.models.schedules import ScheduledCommandModel
+from infrastructure.repositories.mongodb import BeanieNotificationQueryRepository, BeanieScheduledCommandRepository
+from infrastructure.repositories.queries import NotificationCursor, NotificationFilters
+from settings.container import get_scheduled_command_types
 
 
 logger = logging.getLogger(__name__)
@@ -41,6 +52,116 @@ class TestBeanieNotificationRepository:
         with pytest.raises(NotificationNotFoundException):
             await beanie_notification_repository.get(uuid4())
 
+    async def test_update_delivery_status(self, mongodb_db, random_email_notification_entity, beanie_notification_repository):
+        notification_id = random_email_notification_entity.id
+        receiver = random_email_notification_entity.receivers[0].as_generic()
+        await beanie_notification_repository.add(random_email_notification_entity)
+
+        await beanie_notification_repository.update_delivery_status(notification_id, DeliveryStatus.SENDING)
+        await beanie_notification_repository.update_delivery_status(notification_id, DeliveryStatus.FAILED, [receiver], 'timeout')
+        await beanie_notification_repository.update_delivery_status(notification_id, DeliveryStatus.SENDING)
+        await beanie_notification_repository.update_delivery_status(notification_id, DeliveryStatus.SENT)
+        await beanie_notification_repository.update_delivery_status(notification_id, DeliveryStatus.QUEUED)
+
+        notification = await NotificationModel.get(notification_id)
+        assert [delivery.receiver for delivery in notification.deliveries] == [receiver]
+        assert notification.deliveries[0].status == DeliveryStatus.SENT
+        assert notification.deliveries[0].attempts == 2
+        assert notification.deliveries[0].error is None
+
+    async def test_retried_notification_keeps_delivery_history(
+        self, mongodb_db, random_email_notification_entity, beanie_notification_repository,
+    ):
+        notification_id = random_email_notification_entity.id
+        await beanie_notification_repository.add(random_email_notification_entity)
+        await beanie_notification_repository.update_delivery_status(notification_id, DeliveryStatus.SENDING)
+        await beanie_notification_repository.update_delivery_status(notification_id, DeliveryStatus.FAILED, error='timeout')
+
+        await beanie_notification_repository.add(random_email_notification_entity)
+        await beanie_notification_repository.update_delivery_status(notification_id, DeliveryStatus.SENDING)
+
+        assert await NotificationModel.find(NotificationModel.id == notification_id).count() == 1
+        notification = await NotificationModel.get(notification_id)
+        assert notification.deliveries[0].status == DeliveryStatus.SENDING
+        assert notification.deliveries[0].attempts == 2
+
+
+@pytest.mark.asyncio
+class TestBufferedBeanieNotificationRepository:
+    async def test_buffered_notification_is_readable_before_flush(
+        self, mongodb_db, random_email_notification_entity, buffered_beanie_notification_repository,
+    ):
+        buffered_beanie_notification_repository.flush_interval = 60
+        await buffered_beanie_notification_repository.add(random_email_notification_entity)
+
+        assert buffered_beanie_notification_repository.buffer_size == 1
+        assert await NotificationModel.find_one(NotificationModel.id == random_email_notification_entity.id) is None
+
+        result = await buffered_beanie_notification_repository.get(random_email_notification_entity.id)
+        assert result.id == random_email_notification_entity.id
+        assert result.text == random_email_notification_entity.text
+
+    async def test_delivery_status_of_buffered_notification_is_flushed(
+        self, mongodb_db, random_email_notification_entity, buffered_beanie_notification_repository,
+    ):
+        buffered_beanie_notification_repository.flush_interval = 60
+        await buffered_beanie_notification_repository.add(random_email_notification_entity)
+
+        await buffered_beanie_notification_repository.update_delivery_status(random_email_notification_entity.id, DeliveryStatus.SENDING)
+        await buffered_beanie_notification_repository.update_delivery_status(random_email_notification_entity.id, DeliveryStatus.SENT)
+        await buffered_beanie_notification_repository.flush()
+
+        notification = await NotificationModel.get(random_email_notification_entity.id)
+        assert notification.deliveries[0].status == DeliveryStatus.SENT
+        assert notification.deliveries[0].attempts == 1
+
+    async def test_retried_notification_is_merged_on_flush(
+        self, mongodb_db, random_email_notification_entity, buffered_beanie_notification_repository,
+    ):
+        repo = buffered_beanie_notification_repository
+        notification_id = random_email_notification_entity.id
+        repo.flush_interval = 60
+        await repo.add(random_email_notification_entity)
+        await repo.update_delivery_status(notification_id, DeliveryStatus.SENDING)
+        await repo.update_delivery_status(notification_id, DeliveryStatus.FAILED, error='timeout')
+        await repo.flush()
+
+        await repo.add(random_email_notification_entity)
+        await repo.update_delivery_status(notification_id, DeliveryStatus.SENDING)
+        await repo.update_delivery_status(notification_id, DeliveryStatus.SENT)
+        await repo.flush()
+
+        notification = await NotificationModel.get(notification_id)
+        assert notification.deliveries[0].status == DeliveryStatus.SENT
+        assert notification.deliveries[0].attempts == 2
+
+    async def test_buffer_is_flushed_on_interval(
+        self, mongodb_db, random_sms_notification_entity, buffered_beanie_notification_repository,
+    ):
+        await buffered_beanie_notification_repository.add(random_sms_notification_entity)
+        await asyncio.sleep(0.2)
+
+        assert buffered_beanie_notification_repository.buffer_size == 0
+        assert buffered_beanie_notification_repository.flushed_notifications == 1
+        assert await NotificationModel.find_one(NotificationModel.id == random_sms_notification_entity.id)
+
+    async def test_buffer_is_flushed_on_size_and_stop(
+        self, mongodb_db, random_email_notification_entity, random_sms_notification_entity, buffered_beanie_notification_repository,
+    ):
+        buffered_beanie_notification_repository.flush_interval = 60
+        await buffered_beanie_notification_repository.add(random_email_notification_entity)
+        await buffered_beanie_notification_repository.add(random_sms_notification_entity)
+        await asyncio.sleep(0.05)
+
+        assert buffered_beanie_notification_repository.buffer_size == 0
+        assert buffered_beanie_notification_repository.flushes == 1
+
+        await buffered_beanie_notification_repository.add(random_email_notification_entity)
+        await buffered_beanie_notification_repository.stop()
+
+        assert buffered_beanie_notification_repository.buffer_size == 0
+        assert buffered_beanie_notification_repository.flushed_notifications == 2
+
 
 @pytest.mark.asyncio
 class TestBeanieNotificationTemplateRepository:
@@ -82,4 +203,77 @@ class TestBeanieNotificationTemplateRepository:
 
     async def test_get_nonexistent_template(self, mongodb_db, beanie_notification_template_repository):
         with pytest.raises(NotificationTemplateNotFoundException):
-            await beanie_notification_template_repository.get('nonexistent_template')
\ No newline at end of file
+            await beanie_notification_template_repository.get('nonexistent_template')
+
+    async def test_declared_indexes_exist(self, mongodb_db):
+        template_indexes = await NotificationTemplateModel.get_motor_collection().index_information()
+        notification_indexes = await NotificationModel.get_motor_collection().index_information()
+
+        assert template_indexes['name_unique']['unique'] is True
+        assert {'receivers_created_at_id', 'notification_type_created_at_id', 'created_at_id'} <= notification_indexes.keys()
+
+@pytest.mark.asyncio
+class TestBeanieScheduledCommandRepository:
+    async def test_claim_due_commands(self, mongodb_db):
+        await ScheduledCommandModel.delete_all()
+        repo = BeanieScheduledCommandRepository(command_types=get_scheduled_command_types())
+        now = datetime.now(timezone.utc)
+        due = ScheduledCommandEntity(
+            command=SendUserEmailUpdatedMessageCommand(user_id=uuid4(), new_email=EmailVO('example@example.com')),
+            due_at=now,
+        )
+        later = ScheduledCommandEntity(
+            command=SendUserEmailUpdatedMessageCommand(user_id=uuid4(), new_email=EmailVO('example@example.com')),
+            due_at=now + timedelta(hours=1),
+        )
+        await repo.add(due)
+        await repo.add(later)
+
+        [claimed] = await repo.claim_due(until=now + timedelta(minutes=1), limit=10, lease=60)
+        assert claimed.id == due.id
+        assert claimed.command == due.command
+        assert await repo.claim_due(until=now + timedelta(minutes=1), limit=10, lease=60) == []
+
+        await repo.release([due.id])
+        assert [scheduled_command.id for scheduled_command in await repo.claim_due(now, 10, 60)] == [due.id]
+
+        await repo.remove(due.id)
+        await repo.reschedule(later.id, now, attempts=1)
+        [claimed] = await repo.claim_due(until=now + timedelta(minutes=1), limit=10, lease=60)
+        assert claimed.id == later.id
+        assert claimed.attempts == 1
+
+
+@pytest.mark.asyncio
+class TestBeanieNotificationQueryRepository:
+    async def test_find_pages_by_receiver(self, mongodb_db, beanie_notification_repository):
+        receiver = f'user_{uuid4()}@example.com'
+        created_at = datetime.now(timezone.utc).replace(microsecond=0)
+        notifications = [
+            EmailNotificationEntity(
+                sender=EmailVO('sender@example.com'),
+                receivers=[EmailVO(receiver)],
+                subject='Test Email Subject',
+                text='Test Email Body',
+                html='<p>Test Email Body</p>',
+                created_at=created_at - timedelta(minutes=i // 2),
+            )
+            for i in range(5)
+        ]
+        for notification in notifications:
+            await beanie_notification_repository.add(notification)
+
+        repo = BeanieNotificationQueryRepository(batch_size=2)
+        filters = NotificationFilters(receiver=receiver)
+        found = []
+        cursor = None
+        while True:
+            page = [notification async for notification in repo.find(filters, 2, cursor)]
+            if not page:
+                break
+            found.extend(page)
+            cursor = NotificationCursor(page[-1]['created_at'], page[-1]['id'])
+
+        assert sorted(notification['id'] for notification in found) == sorted(notification.id for notification in notifications)
+        assert 'message' not in found[0]
+        assert found[0]['created_at'] >= found[-1]['created_at']
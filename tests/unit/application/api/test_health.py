@@ -0,0 +1,106 @@
+import asyncio
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from application.api.health import HealthMonitor, get_liveness, get_readiness
+from application.external_events.consumers.base import BaseConsumer
+
+
+@dataclass
+class StubConsumer(BaseConsumer):
+    connected: bool = True
+    saturated: bool = False
+
+    @property
+    def is_connected(self) -> bool:
+        return self.connected
+
+    @property
+    def is_saturated(self) -> bool:
+        return self.saturated
+
+    async def start(self):
+        ...
+
+    async def consume(self):
+        await asyncio.Event().wait()
+
+    async def stop(self):
+        ...
+
+
+@dataclass
+class StubMongoDBAdmin:
+    pings: int = 0
+    available: bool = True
+
+    async def command(self, name: str) -> dict:
+        self.pings += 1
+        if not self.available:
+            raise ConnectionError('MongoDB is unavailable')
+        return {'ok': 1}
+
+
+@pytest.fixture
+async def health_monitor(fake_email_sender):
+    consumer = StubConsumer()
+    consume_task = asyncio.create_task(consumer.consume())
+    yield HealthMonitor(
+        consumer=consumer,
+        consume_task=consume_task,
+        mongodb_client=SimpleNamespace(admin=StubMongoDBAdmin()),
+        email_sender=fake_email_sender,
+        cache_ttl=60.0,
+    )
+    consume_task.cancel()
+
+
+def make_request(health_monitor: HealthMonitor | None) -> SimpleNamespace:
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(health_monitor=health_monitor)))
+
+
+@pytest.mark.asyncio
+class TestHealthMonitor:
+    async def test_healthy_service_is_live_and_ready(self, health_monitor):
+        liveness = await get_liveness(make_request(health_monitor))
+        readiness = await get_readiness(make_request(health_monitor))
+
+        assert liveness.status_code == 200
+        assert readiness.status_code == 200
+        assert orjson.loads(readiness.body)['checks'] == {
+            'consumer': True,
+            'broker': True,
+            'mongodb': True,
+            'smtp': True,
+            'consumer_capacity': True,
+        }
+
+    async def test_dead_consumer_task_fails_liveness(self, health_monitor):
+        health_monitor.consume_task.cancel()
+        await asyncio.sleep(0)
+
+        assert (await get_liveness(make_request(health_monitor))).status_code == 503
+        assert (await get_readiness(make_request(health_monitor))).status_code == 503
+
+    async def test_saturated_consumer_fails_readiness_only(self, health_monitor):
+        health_monitor.consumer.saturated = True
+
+        assert (await get_liveness(make_request(health_monitor))).status_code == 200
+        assert (await get_readiness(make_request(health_monitor))).status_code == 503
+
+    async def test_dependency_checks_are_cached(self, health_monitor):
+        mongodb_admin = health_monitor.mongodb_client.admin
+        await asyncio.gather(*(health_monitor.check_readiness() for _ in range(5)))
+        mongodb_admin.available = False
+
+        assert (await health_monitor.check_readiness())['mongodb']
+        assert mongodb_admin.pings == 1
+
+        health_monitor.checked_at = float('-inf')
+        assert not (await health_monitor.check_readiness())['mongodb']
+
+    async def test_not_started_service_is_unavailable(self):
+        assert (await get_readiness(make_request(None))).status_code == 503
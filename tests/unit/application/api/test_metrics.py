@@ -0,0 +1,62 @@
+import pytest
+from prometheus_client import CollectorRegistry
+
+from application.api.metrics import track_component_metrics
+from application.external_events.consumers.rabbitmq import RabbitMQConsumer
+from application.external_events.dispatchers.partitioned import PartitionedExternalEventDispatcher
+from infrastructure.idempotency.memory import InMemoryIdempotencyStore
+from infrastructure.metrics.prometheus import ComponentMetricsCollector
+from infrastructure.producers.rabbitmq import RabbitMQProducer
+from infrastructure.repositories.buffered import BufferedBeanieNotificationRepository
+from infrastructure.repositories.cached import CachedNotificationTemplateRepository
+
+
+@pytest.mark.asyncio
+async def test_component_metrics_are_exposed(fake_message_bus, fake_notification_template_repository):
+    registry = CollectorRegistry()
+    collector = ComponentMetricsCollector()
+    registry.register(collector)
+    consumer = RabbitMQConsumer(
+        host='127.0.0.1',
+        port=5672,
+        login='guest',
+        password='guest',
+        virtual_host='/',
+        exchange_name='exchange',
+        queue_name='queue',
+        dispatcher=PartitionedExternalEventDispatcher(lanes_count=2, lane_depth=1),
+        idempotency_store=InMemoryIdempotencyStore(),
+    )
+    producer = RabbitMQProducer(
+        host='127.0.0.1',
+        port=5672,
+        login='guest',
+        password='guest',
+        virtual_host='/',
+        exchange_name='exchange',
+    )
+    notification_repo = BufferedBeanieNotificationRepository()
+    notification_template_repo = CachedNotificationTemplateRepository(repo=fake_notification_template_repository)
+
+    track_component_metrics(
+        message_buses=[fake_message_bus],
+        consumer=consumer,
+        producer=producer,
+        notification_repo=notification_repo,
+        notification_template_repo=notification_template_repo,
+        collector=collector,
+    )
+    fake_message_bus.queue_high_water_mark = 7
+    consumer.idempotency_store.checks, consumer.idempotency_store.duplicates = 4, 1
+    producer.pending_confirms = 2
+    notification_repo.buffer = {'notification-id': None}
+    notification_template_repo.hits = 3
+
+    assert registry.get_sample_value('notification_service_message_bus_queue_high_water_mark') == 7
+    assert registry.get_sample_value('notification_service_idempotency_duplicates_total') == 1
+    assert registry.get_sample_value('notification_service_idempotency_duplicate_rate') == 0.25
+    assert registry.get_sample_value('notification_service_producer_pending_confirms') == 2
+    assert registry.get_sample_value('notification_service_write_buffer_size') == 1
+    assert registry.get_sample_value('notification_service_template_cache_hits_total') == 3
+    async with consumer.dispatcher:
+        assert registry.get_sample_value('notification_service_dispatcher_lane_depth', {'lane': '1'}) == 0
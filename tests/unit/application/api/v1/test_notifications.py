@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from application.api.v1.notifications import stream_notifications
+from infrastructure.repositories.queries import NotificationCursor, NotificationFilters
+from tests.fakes import FakeNotificationQueryRepository
+
+
+@pytest.fixture
+def fake_notification_query_repository():
+    created_at = datetime(2026, 10, 18, tzinfo=timezone.utc)
+    return FakeNotificationQueryRepository(
+        notifications=[
+            {
+                'id': uuid4(),
+                'notification_type': 'email',
+                'sender': 'sender@example.com',
+                'receivers': ['example@example.com'],
+                'created_at': created_at - timedelta(minutes=i // 2),
+                'deliveries': [],
+            }
+            for i in range(5)
+        ],
+    )
+
+
+async def read_page(repo, limit: int, cursor: str | None = None) -> list[dict]:
+    lines = [
+        line
+        async for line in stream_notifications(
+            repo,
+            NotificationFilters(receiver='example@example.com'),
+            limit,
+            NotificationCursor.decode(cursor) if cursor else None,
+        )
+    ]
+    return [orjson.loads(line) for line in lines]
+
+
+@pytest.mark.asyncio
+async def test_pages_cover_all_notifications_once(fake_notification_query_repository):
+    streamed_ids = []
+    cursor = None
+    for _ in range(3):
+        page = await read_page(fake_notification_query_repository, 2, cursor)
+        cursor = page[-1].get('next_cursor')
+        streamed_ids.extend(notification['id'] for notification in page if 'id' in notification)
+
+    assert cursor is None
+    assert len(streamed_ids) == len(set(streamed_ids)) == 5
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_cursor(fake_notification_query_repository):
+    page = await read_page(fake_notification_query_repository, 5)
+
+    assert len(page) == 5
+    assert all('next_cursor' not in line for line in page)
@@ -0,0 +1,344 @@
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
+from types import SimpleNamespace
+from uuid import uuid4
+
+import orjson
+import pytest
+from prometheus_client import REGISTRY
+
+from application.external_events.consumers.rabbitmq import (
+    RabbitMQConsumer,
+    LAST_ERROR_HEADER,
+    RETRY_ATTEMPT_HEADER,
+    ORIGINAL_ROUTING_KEY_HEADER,
+    topic_matches,
+)
+from application.external_events.handlers.base import get_current_message_key
+from domain.exceptions.base import DomainException
+from infrastructure.exceptions.notifications import InvalidNotificationTemplateException
+from infrastructure.idempotency.memory import InMemoryIdempotencyStore
+from tests.fakes import FakeExternalEventHandler
+
+
+ROUTING_KEY = 'user.email.updated'
+
+
+@dataclass
+class RecordingExchange:
+    published: list[tuple[str, object]] = field(default_factory=list)
+
+    async def publish(self, message, routing_key: str):
+        self.published.append((routing_key, message))
+
+
+@dataclass
+class StubQueue:
+    messages: list[SimpleNamespace]
+
+    def iterator(self) -> 'StubQueue':
+        return self
+
+    async def __aenter__(self) -> 'StubQueue':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        ...
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for message in self.messages:
+            yield message
+
+
+@dataclass
+class RecordingDispatcher:
+    dispatched: list[tuple[dict, bool]] = field(default_factory=list)
+
+    async def dispatch(self, body: dict, job, priority: bool = False) -> None:
+        self.dispatched.append((body, priority))
+
+
+class RejectingDispatcher:
+    async def dispatch(self, body: dict, job, priority: bool = False) -> None:
+        raise RuntimeError('Dispatcher is stopped')
+
+
+@dataclass
+class FailingExchange:
+    async def publish(self, message, routing_key: str):
+        raise ConnectionError('Channel closed')
+
+
+@dataclass
+class UnavailableIdempotencyStore(InMemoryIdempotencyStore):
+    async def _claim(self, key: str) -> bool:
+        raise ConnectionError('MongoDB unavailable')
+
+
+@dataclass
+class UnreleasableIdempotencyStore(InMemoryIdempotencyStore):
+    async def _release(self, key: str) -> None:
+        raise ConnectionError('MongoDB unavailable')
+
+
+class MessageKeyRecordingExternalEventHandler(FakeExternalEventHandler):
+    message_key: str | None = None
+
+    async def __call__(self, body: dict) -> None:
+        self.message_key = get_current_message_key()
+
+
+class FailingExternalEventHandler(FakeExternalEventHandler):
+    error: Exception = ConnectionError('SMTP server unavailable')
+
+    async def __call__(self, body: dict) -> None:
+        raise self.error
+
+
+async def record_rejection(message: SimpleNamespace, requeue: bool = False):
+    message.rejected = True
+
+
+@pytest.fixture
+def consumer():
+    consumer = RabbitMQConsumer(
+        host='127.0.0.1',
+        port=5672,
+        login='guest',
+        password='guest',
+        virtual_host='/',
+        exchange_name='exchange',
+        queue_name='queue',
+        external_events_map={ROUTING_KEY: FakeExternalEventHandler(bus=None)},
+        idempotency_store=InMemoryIdempotencyStore(max_cached_keys=10),
+        max_retries=2,
+    )
+    consumer.channel = SimpleNamespace(default_exchange=RecordingExchange())
+    return consumer
+
+
+def make_message(body: dict, message_id: str | None = None, headers: dict | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        routing_key=ROUTING_KEY,
+        message_id=message_id,
+        headers=headers or {},
+        content_type='application/json',
+        body=orjson.dumps(body),
+        rejected=False,
+    )
+
+
+@pytest.mark.parametrize(
+    'pattern, routing_key, expected',
+    [
+        ('user.#', 'user.email.update.initiated', True),
+        ('user.#', 'user', True),
+        ('user.#', 'users.created', False),
+        ('user.*.update.initiated', 'user.email.update.initiated', True),
+        ('user.*.update.initiated', 'user.email.updated', False),
+        ('#.initiated', 'user.password.reset.initiated', True),
+        ('user.password.reset.initiated', 'user.password.reset.initiated', True),
+    ],
+)
+def test_topic_matches(pattern, routing_key, expected):
+    assert topic_matches(pattern, routing_key) is expected
+
+
+@pytest.mark.asyncio
+class TestRabbitMQConsumer:
+    async def test_redelivered_event_is_skipped(self, consumer):
+        body = {'event_id': str(uuid4()), 'new_email': 'user@example.com'}
+        handler = consumer.external_events_map[ROUTING_KEY]
+
+        await consumer.process_message(make_message(body), body)
+        handler.body = None
+        await consumer.process_message(make_message(body), body)
+
+        assert handler.body is None
+        assert consumer.idempotency_store.duplicates == 1
+
+    async def test_idempotency_key_prefers_message_id(self, consumer):
+        body = {'new_email': 'user@example.com'}
+        message_id = str(uuid4())
+
+        assert consumer.get_idempotency_key(make_message(body, message_id), body) == f'{ROUTING_KEY}:{message_id}'
+        assert consumer.get_idempotency_key(make_message(body), body) is None
+
+    async def test_idempotency_key_of_non_object_body(self, consumer):
+        message_id = str(uuid4())
+
+        assert consumer.get_idempotency_key(make_message([1], message_id), [1]) == f'{ROUTING_KEY}:{message_id}'
+        assert consumer.get_idempotency_key(make_message('x'), 'x') is None
+
+    async def test_handler_sees_message_key(self, consumer):
+        handler = consumer.external_events_map[ROUTING_KEY] = MessageKeyRecordingExternalEventHandler(bus=None)
+        message_id = str(uuid4())
+
+        await consumer.process_message(make_message({}, message_id), {})
+
+        assert handler.message_key == f'{ROUTING_KEY}:{message_id}'
+        assert get_current_message_key() is None
+
+    async def test_failed_message_is_scheduled_for_retry(self, consumer):
+        consumer.external_events_map[ROUTING_KEY] = FailingExternalEventHandler(bus=None)
+        body = {'event_id': str(uuid4())}
+
+        await consumer.process_message(make_message(body), body)
+
+        [(queue_name, message)] = consumer.channel.default_exchange.published
+        assert queue_name == 'queue.retry.1'
+        assert message.headers[RETRY_ATTEMPT_HEADER] == 1
+        assert message.headers[ORIGINAL_ROUTING_KEY_HEADER] == ROUTING_KEY
+        assert message.expiration is not None
+        assert await consumer.idempotency_store.claim(consumer.get_idempotency_key(make_message(body), body))
+
+    async def test_failed_claim_is_scheduled_for_retry(self, consumer):
+        consumer.idempotency_store = UnavailableIdempotencyStore()
+        body = {'event_id': str(uuid4())}
+
+        await consumer.process_message(make_message(body), body)
+
+        [(queue_name, message)] = consumer.channel.default_exchange.published
+        assert queue_name == 'queue.retry.1'
+        assert 'MongoDB unavailable' in message.headers[LAST_ERROR_HEADER]
+        assert consumer.external_events_map[ROUTING_KEY].body is None
+
+    async def test_failed_release_does_not_block_retry(self, consumer):
+        consumer.idempotency_store = UnreleasableIdempotencyStore()
+        consumer.external_events_map[ROUTING_KEY] = FailingExternalEventHandler(bus=None)
+        body = {'event_id': str(uuid4())}
+
+        await consumer.process_message(make_message(body), body)
+
+        [(queue_name, _)] = consumer.channel.default_exchange.published
+        assert queue_name == 'queue.retry.1'
+
+    async def test_failed_republish_backs_off_before_requeue(self, consumer, monkeypatch):
+        sleeps = []
+
+        async def record_sleep(delay: float):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, 'sleep', record_sleep)
+        consumer.retry_jitter = 0
+        consumer.channel = SimpleNamespace(default_exchange=FailingExchange())
+        consumer.external_events_map[ROUTING_KEY] = FailingExternalEventHandler(bus=None)
+
+        with pytest.raises(ConnectionError):
+            await consumer.process_message(make_message({}), {})
+
+        assert sleeps == [consumer.retry_base_delay]
+
+    async def test_retried_message_keeps_original_routing_key(self, consumer):
+        body = {'new_email': 'user@example.com'}
+        message = make_message(body, headers={ORIGINAL_ROUTING_KEY_HEADER: ROUTING_KEY, RETRY_ATTEMPT_HEADER: 1})
+        message.routing_key = 'queue'
+
+        await consumer.process_message(message, body)
+
+        assert consumer.external_events_map[ROUTING_KEY].body == body
+
+    @pytest.mark.parametrize(
+        'error, headers',
+        [
+            (ConnectionError('SMTP server unavailable'), {RETRY_ATTEMPT_HEADER: 2}),
+            (DomainException(), {}),
+            (KeyError('new_email'), {}),
+            (InvalidNotificationTemplateException(name='email_updated', reason='unknown placeholders'), {}),
+        ],
+    )
+    async def test_poison_message_is_dead_lettered(self, consumer, error, headers):
+        handler = FailingExternalEventHandler(bus=None)
+        handler.error = error
+        consumer.external_events_map[ROUTING_KEY] = handler
+
+        await consumer.process_message(make_message({}, headers=headers), {})
+
+        [(queue_name, message)] = consumer.channel.default_exchange.published
+        assert queue_name == 'queue.dead-letter'
+        assert message.expiration is None
+
+    async def test_retry_delay_backs_off_exponentially(self, consumer):
+        consumer.retry_jitter = 0
+        consumer.retry_max_delay = 5
+
+        assert [consumer.get_retry_delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    async def test_priority_topics_are_skipped_on_main_queue(self, consumer):
+        consumer.priority_topics = ['user.*.update.initiated']
+        priority_message = make_message({})
+        priority_message.routing_key = 'user.email.update.initiated'
+        retried_priority_message = make_message({}, headers={ORIGINAL_ROUTING_KEY_HEADER: 'user.email.update.initiated'})
+        retried_priority_message.routing_key = 'queue'
+
+        assert consumer.is_priority_message(priority_message)
+        assert not consumer.is_priority_message(retried_priority_message)
+        assert not consumer.is_priority_message(make_message({}))
+
+    async def test_message_outcomes_are_counted(self, consumer):
+        labels = {'routing_key': ROUTING_KEY}
+        succeeded = REGISTRY.get_sample_value('notification_service_messages_total', labels | {'outcome': 'succeeded'}) or 0
+        failed = REGISTRY.get_sample_value('notification_service_messages_total', labels | {'outcome': 'failed'}) or 0
+
+        await consumer.process_message(make_message({}), {})
+        consumer.external_events_map[ROUTING_KEY] = FailingExternalEventHandler(bus=None)
+        await consumer.process_message(make_message({}), {})
+
+        assert REGISTRY.get_sample_value('notification_service_messages_total', labels | {'outcome': 'succeeded'}) == succeeded + 1
+        assert REGISTRY.get_sample_value('notification_service_messages_total', labels | {'outcome': 'failed'}) == failed + 1
+
+    async def test_unhandled_routing_keys_share_unknown_label(self, consumer):
+        labels = {'routing_key': 'unknown', 'outcome': 'succeeded'}
+        succeeded = REGISTRY.get_sample_value('notification_service_messages_total', labels) or 0
+
+        for routing_key in ('user.random.1', 'user.random.2'):
+            message = make_message({})
+            message.routing_key = routing_key
+            await consumer.process_message(message, {})
+
+        assert REGISTRY.get_sample_value('notification_service_messages_total', labels) == succeeded + 2
+        assert REGISTRY.get_sample_value(
+            'notification_service_messages_total', {'routing_key': 'user.random.1', 'outcome': 'succeeded'},
+        ) is None
+
+    async def test_permit_is_released_when_dispatch_fails(self, consumer):
+        in_flight_limiter = asyncio.Semaphore(1)
+        labels = {'routing_key': ROUTING_KEY}
+        in_flight = REGISTRY.get_sample_value('notification_service_messages_in_flight', labels) or 0
+
+        with pytest.raises(RuntimeError):
+            await consumer._consume_queue(StubQueue([make_message({})]), in_flight_limiter, RejectingDispatcher())
+
+        assert not in_flight_limiter.locked()
+        assert REGISTRY.get_sample_value('notification_service_messages_in_flight', labels) == in_flight
+
+    async def test_non_object_bodies_are_rejected_before_dispatch(self, consumer):
+        dispatcher = RecordingDispatcher()
+        messages = [make_message({}) for _ in range(3)]
+        for message, body in zip(messages, (b'[1]', b'"x"', b'{"user_id": "user-1"}')):
+            message.body = body
+            message.reject = partial(record_rejection, message)
+
+        await consumer._consume_queue(StubQueue(messages), asyncio.Semaphore(3), dispatcher)
+
+        assert [message.rejected for message in messages] == [True, True, False]
+        assert dispatcher.dispatched == [({'user_id': 'user-1'}, False)]
+
+    async def test_priority_messages_are_dispatched_by_partition(self, consumer):
+        consumer.dispatcher = RecordingDispatcher()
+        consumer.in_flight_limiter = asyncio.Semaphore(1)
+        consumer.priority_in_flight_limiter = asyncio.Semaphore(1)
+        consumer.priority_queue = StubQueue([make_message({'user_id': 'user-1'})])
+        consumer.queue = StubQueue([make_message({'user_id': 'user-1'}, message_id='later')])
+        consumer.connection = object()
+
+        await consumer.consume()
+
+        assert sorted(consumer.dispatcher.dispatched, key=lambda dispatched: dispatched[1]) == [
+            ({'user_id': 'user-1'}, False),
+            ({'user_id': 'user-1'}, True),
+        ]
@@ -0,0 +1,98 @@
+import asyncio
+import random
+
+import pytest
+
+from application.external_events.dispatchers.partitioned import PartitionedExternalEventDispatcher
+
+
+@pytest.mark.asyncio
+class TestPartitionedExternalEventDispatcher:
+    async def test_preserves_order_per_partition_key(self):
+        processed: dict[str, list[int]] = {}
+
+        def make_job(user_id: str, sequence: int):
+            async def job():
+                await asyncio.sleep(random.random() / 100)
+                processed.setdefault(user_id, []).append(sequence)
+            return job
+
+        async with PartitionedExternalEventDispatcher(lanes_count=4, lane_depth=2) as dispatcher:
+            for sequence in range(10):
+                for user_id in ('user-1', 'user-2', 'user-3'):
+                    await dispatcher.dispatch({'user_id': user_id}, make_job(user_id, sequence))
+
+        assert processed == {user_id: list(range(10)) for user_id in ('user-1', 'user-2', 'user-3')}
+
+    async def test_processes_different_partition_keys_in_parallel(self):
+        in_flight, max_in_flight = 0, 0
+
+        async def job():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+        async with PartitionedExternalEventDispatcher(lanes_count=8, lane_depth=1) as dispatcher:
+            for _ in range(8):
+                await dispatcher.dispatch({}, job)
+
+        assert max_in_flight == 8
+
+    @pytest.mark.parametrize('user_id', ['user-1', '123e4567-e89b-12d3-a456-426614174000'])
+    async def test_same_partition_key_maps_to_same_lane(self, user_id):
+        dispatcher = PartitionedExternalEventDispatcher(lanes_count=16, lane_depth=1)
+
+        assert dispatcher.get_lane_index({'user_id': user_id}) == dispatcher.get_lane_index({'user_id': user_id})
+        assert 0 <= dispatcher.get_lane_index({'user_id': user_id}) < dispatcher.lanes_count
+
+    async def test_priority_jobs_skip_only_queued_jobs_of_other_keys(self):
+        processed = []
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        def make_job(name: str):
+            async def job():
+                processed.append(name)
+            return job
+
+        async def blocking_job():
+            started.set()
+            await release.wait()
+
+        async with PartitionedExternalEventDispatcher(lanes_count=1, lane_depth=4) as dispatcher:
+            await dispatcher.dispatch({'user_id': 'user-1'}, blocking_job)
+            await started.wait()
+            await dispatcher.dispatch({'user_id': 'user-2'}, make_job('queued'))
+            await dispatcher.dispatch({'user_id': 'user-1'}, make_job('email.update.initiated'), priority=True)
+            await dispatcher.dispatch({'user_id': 'user-1'}, make_job('email.updated'))
+            release.set()
+
+        assert processed == ['email.update.initiated', 'queued', 'email.updated']
+
+    async def test_priority_job_stays_behind_queued_job_of_same_key(self):
+        processed = []
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        def make_job(name: str):
+            async def job():
+                processed.append(name)
+            return job
+
+        async def blocking_job():
+            started.set()
+            await release.wait()
+
+        async with PartitionedExternalEventDispatcher(lanes_count=1, lane_depth=4) as dispatcher:
+            await dispatcher.dispatch({'user_id': 'user-1'}, blocking_job)
+            await started.wait()
+            await dispatcher.dispatch({'user_id': 'user-1'}, make_job('password.updated'))
+            await dispatcher.dispatch({'user_id': 'user-2'}, make_job('queued'))
+            await dispatcher.dispatch({'user_id': 'user-1'}, make_job('email.update.initiated'), priority=True)
+            await dispatcher.dispatch({'user_id': 'user-3'}, make_job('priority'), priority=True)
+            release.set()
+
+        assert processed == ['priority', 'password.updated', 'queued', 'email.update.initiated']
+        assert not dispatcher._queued_regular
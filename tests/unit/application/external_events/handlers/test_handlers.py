@@ -1,7 +1,9 @@
 from contextlib import nullcontext as not_raises
+from uuid import NAMESPACE_OID, uuid5
 
 import pytest
 
+from application.external_events.handlers.base import reset_current_message_key, set_current_message_key
 from application.external_events.handlers.notifications import (
     UserRegistrationCompletedExternalEventHandler,
     UserEmailUpdateInitiatedExternalEventHandler,
@@ -88,7 +90,7 @@ class TestExternalEventHandlers:
             self, fake_message_bus, body, expectation
     ):
         handler = UserRegistrationCompletedExternalEventHandler(bus=fake_message_bus)
-        with expectation:
+        with expectation, fake_message_bus.repo.scope():
             await handler(body=body)
 
             loaded_notifications = [notification for notification in fake_message_bus.repo.loaded_notifications]
@@ -134,7 +136,7 @@ class TestExternalEventHandlers:
             self, fake_message_bus, body, expectation
     ):
         handler = UserEmailUpdateInitiatedExternalEventHandler(bus=fake_message_bus)
-        with expectation:
+        with expectation, fake_message_bus.repo.scope():
             await handler(body=body)
 
             loaded_notifications = [notification for notification in fake_message_bus.repo.loaded_notifications]
@@ -175,7 +177,7 @@ class TestExternalEventHandlers:
             self, fake_message_bus, body, expectation
     ):
         handler = UserPhoneNumberUpdateInitiatedExternalEventHandler(bus=fake_message_bus)
-        with expectation:
+        with expectation, fake_message_bus.repo.scope():
             await handler(body=body)
 
             loaded_notifications = [notification for notification in fake_message_bus.repo.loaded_notifications]
@@ -222,7 +224,7 @@ class TestExternalEventHandlers:
             self, fake_message_bus, body, expectation
     ):
         handler = UserPasswordResetInitiatedExternalEventHandler(bus=fake_message_bus)
-        with expectation:
+        with expectation, fake_message_bus.repo.scope():
             await handler(body=body)
 
             loaded_notifications = [notification for notification in fake_message_bus.repo.loaded_notifications]
@@ -265,7 +267,7 @@ class TestExternalEventHandlers:
             self, fake_message_bus, body, expectation
     ):
         handler = UserEmailUpdatedExternalEventHandler(bus=fake_message_bus)
-        with expectation:
+        with expectation, fake_message_bus.repo.scope():
             await handler(body=body)
 
             loaded_notifications = [notification for notification in fake_message_bus.repo.loaded_notifications]
@@ -303,10 +305,25 @@ class TestExternalEventHandlers:
             self, fake_message_bus, body, expectation
     ):
         handler = UserPhoneNumberUpdatedExternalEventHandler(bus=fake_message_bus)
-        with expectation:
+        with expectation, fake_message_bus.repo.scope():
             await handler(body=body)
 
             loaded_notifications = [notification for notification in fake_message_bus.repo.loaded_notifications]
             assert len(loaded_notifications) == 1
             assert loaded_notifications[0].__class__ is SMSNotificationEntity
             assert loaded_notifications[0].receivers[0].as_generic() == body['new_phone_number']
+
+    async def test_retried_message_updates_the_same_notification(self, fake_message_bus):
+        handler = UserEmailUpdatedExternalEventHandler(bus=fake_message_bus)
+        body = {'user_id': '123e4567-e89b-12d3-a456-426614174000', 'new_email': 'example@example.com'}
+        message_key = 'user.email.updated:message-id'
+
+        token = set_current_message_key(message_key)
+        try:
+            await handler(body=body)
+            await handler(body=body)
+        finally:
+            reset_current_message_key(token)
+
+        [notification] = fake_message_bus.repo.notifications_list
+        assert notification.id == uuid5(NAMESPACE_OID, message_key)
@@ -0,0 +1,38 @@
+from uuid import uuid4
+
+import pytest
+
+from domain.commands.notifications import (
+    SendUserPasswordResetInitiatedMessageCommand,
+    SendUserRegistrationCompletedMessageCommand,
+    UserCredentialsStatus,
+)
+from domain.value_objects.notifications import EmailVO, NameVO, PhoneNumberVO
+from infrastructure.converters.commands import convert_command_to_document, convert_document_to_command
+
+
+@pytest.mark.parametrize(
+    'command',
+    [
+        SendUserRegistrationCompletedMessageCommand(
+            user_id=uuid4(),
+            email=EmailVO('example@example.com'),
+            phone_number=None,
+            first_name=NameVO('John'),
+            last_name=None,
+            middle_name=None,
+            credentials_status=UserCredentialsStatus.SUCCESS,
+        ),
+        SendUserPasswordResetInitiatedMessageCommand(
+            user_id=uuid4(),
+            email=None,
+            phone_number=PhoneNumberVO('+1234567890'),
+            verification_token='token',
+        ),
+    ],
+)
+def test_command_document_round_trip(command):
+    document = convert_command_to_document(command)
+
+    assert document['command_id'] == str(command.command_id)
+    assert convert_document_to_command(type(command), document) == command
@@ -0,0 +1,31 @@
+import pytest
+
+from infrastructure.idempotency.memory import InMemoryIdempotencyStore
+
+
+@pytest.mark.asyncio
+class TestInMemoryIdempotencyStore:
+    async def test_second_claim_is_duplicate(self):
+        store = InMemoryIdempotencyStore()
+
+        assert await store.claim('key') is True
+        assert await store.claim('key') is False
+        assert store.checks == 2
+        assert store.duplicates == 1
+        assert store.duplicate_rate == 0.5
+
+    async def test_released_key_can_be_claimed_again(self):
+        store = InMemoryIdempotencyStore()
+
+        await store.claim('key')
+        await store.release('key')
+
+        assert await store.claim('key') is True
+
+    async def test_cached_keys_are_bounded(self):
+        store = InMemoryIdempotencyStore(max_cached_keys=2)
+
+        for key in ('first', 'second', 'first', 'third'):
+            await store.claim(key)
+
+        assert list(store.cached_keys) == ['first', 'third']
@@ -0,0 +1,61 @@
+import io
+import logging
+
+import orjson
+import pytest
+
+from infrastructure.logs import handlers
+from infrastructure.logs.handlers import JSONFormatter, RateLimitFilter, configure_logging
+
+
+def make_record(name: str = 'service.message_bus', level: int = logging.INFO, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, 'Handling command: %s', ('SendEmailCommand',), exc_info)
+
+
+@pytest.fixture
+def root_logger():
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    yield root_logger
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
+
+
+def test_json_formatter_renders_record():
+    try:
+        raise ValueError('boom')
+    except ValueError as e:
+        record = make_record(level=logging.ERROR, exc_info=(type(e), e, e.__traceback__))
+
+    entry = orjson.loads(JSONFormatter().format(record))
+
+    assert entry['level'] == 'ERROR'
+    assert entry['logger'] == 'service.message_bus'
+    assert entry['message'] == 'Handling command: SendEmailCommand'
+    assert 'ValueError: boom' in entry['exception']
+
+
+def test_rate_limit_filter_drops_and_reports_suppressed_records(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(handlers.time, 'monotonic', lambda: now)
+    rate_limit_filter = RateLimitFilter(rate=1.0, burst=2)
+
+    assert [rate_limit_filter.filter(make_record()) for _ in range(5)] == [True, True, False, False, False]
+    assert rate_limit_filter.filter(make_record(name='infrastructure.repositories'))
+    assert rate_limit_filter.filter(make_record(level=logging.WARNING))
+
+    now += 1.0
+    record = make_record()
+    assert rate_limit_filter.filter(record)
+    assert record.suppressed == 3
+
+
+def test_queue_logging_writes_from_listener(root_logger):
+    stream = io.StringIO()
+    listener = configure_logging(logging.INFO, '%(message)s', json_output=True, stream=stream)
+    try:
+        logging.getLogger('service.message_bus').info('Handling command: %s', 'SendEmailCommand')
+    finally:
+        listener.stop()
+
+    assert orjson.loads(stream.getvalue())['message'] == 'Handling command: SendEmailCommand'
@@ -0,0 +1,57 @@
+import pytest
+from prometheus_client import CollectorRegistry, generate_latest
+
+from infrastructure.metrics.prometheus import (
+    MetricsCollectors,
+    get_current_message_metrics,
+    get_message_metrics,
+    reset_current_message_metrics,
+    set_current_message_metrics,
+)
+from infrastructure.renderers.compiled import CompiledNotificationTemplateRenderer
+from service.handlers.command.notifications import fetch_notification_template, render_notification_template
+
+
+@pytest.fixture
+def registry():
+    return CollectorRegistry()
+
+
+@pytest.fixture
+def metrics(registry):
+    metrics = MetricsCollectors.register(registry).bind('user.email.updated')
+    token = set_current_message_metrics(metrics)
+    yield metrics
+    reset_current_message_metrics(token)
+
+
+def test_routing_key_metrics_are_bound_once():
+    assert get_message_metrics('user.email.updated') is get_message_metrics('user.email.updated')
+    assert get_current_message_metrics() is None
+
+
+def test_bound_metrics_are_exposed(registry):
+    metrics = MetricsCollectors.register(registry).bind('user.email.updated')
+    metrics.consume_to_ack.observe(0.02)
+    metrics.succeeded.inc()
+    metrics.in_flight.inc()
+
+    labels = {'routing_key': 'user.email.updated'}
+    assert registry.get_sample_value(
+        'notification_service_stage_duration_seconds_count', labels | {'stage': 'consume_to_ack'},
+    ) == 1
+    assert registry.get_sample_value('notification_service_messages_total', labels | {'outcome': 'succeeded'}) == 1
+    assert registry.get_sample_value('notification_service_messages_in_flight', labels) == 1
+    assert b'notification_service_stage_duration_seconds_bucket' in generate_latest(registry)
+
+
+@pytest.mark.asyncio
+async def test_handler_stages_are_observed(registry, metrics, fake_notification_template_repository):
+    template = await fetch_notification_template(fake_notification_template_repository, 'email_updated')
+    render_notification_template(CompiledNotificationTemplateRenderer(), template, {'new_email': 'example@example.com'})
+
+    labels = {'routing_key': 'user.email.updated'}
+    for stage in ('template_fetch', 'render'):
+        assert registry.get_sample_value(
+            'notification_service_stage_duration_seconds_count', labels | {'stage': stage},
+        ) == 1
@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import orjson
+import pytest
+
+from infrastructure.converters.notifications import convert_event_to_outbox_model
+from infrastructure.producers.base import SerializedEvent
+from infrastructure.producers.outbox import OutboxRelay
+from tests.fakes import FakeEvent, FakeProducer
+
+
+@dataclass
+class RecordingProducer(FakeProducer):
+    available: bool = True
+    published: list[SerializedEvent] = field(default_factory=list)
+
+    async def publish_serialized(self, events: Iterable[SerializedEvent], buffer: bool = True):
+        if not self.available:
+            raise ConnectionError('Broker unavailable')
+        self.published.extend(events)
+
+
+@dataclass
+class InMemoryOutboxRelay(OutboxRelay):
+    documents: list[dict[str, Any]] = field(default_factory=list)
+
+    async def _find_pending(self) -> list[dict[str, Any]]:
+        return [document for document in self.documents if document['outbox']][:self.batch_size]
+
+    async def _acknowledge(self, event_ids: dict[Any, list[str]]):
+        for document in self.documents:
+            ids = event_ids.get(document['_id'], [])
+            document['outbox'] = [entry for entry in document['outbox'] if entry['event_id'] not in ids]
+
+
+def make_document(notification_id: int, events_count: int = 1) -> dict[str, Any]:
+    return {
+        '_id': notification_id,
+        'outbox': [
+            convert_event_to_outbox_model(FakeEvent(), 'fake.topic').model_dump()
+            for _ in range(events_count)
+        ],
+    }
+
+
+@pytest.mark.asyncio
+class TestOutboxRelay:
+    async def test_relay_once_publishes_and_acknowledges_batch(self):
+        relay = InMemoryOutboxRelay(
+            producer=RecordingProducer(),
+            batch_size=2,
+            documents=[make_document(1, events_count=2), make_document(2), make_document(3)],
+        )
+
+        assert await relay.relay_once() == 2
+        assert [event.topic for event in relay.producer.published] == ['fake.topic'] * 3
+        assert orjson.loads(relay.producer.published[0].body)['event_id'] == relay.producer.published[0].event_id
+        assert [document['_id'] for document in relay.documents if document['outbox']] == [3]
+        assert relay.relayed_events == 3
+
+        assert await relay.relay_once() == 1
+        assert await relay.relay_once() == 0
+
+    async def test_failed_publish_keeps_events_pending(self):
+        relay = InMemoryOutboxRelay(
+            producer=RecordingProducer(available=False),
+            documents=[make_document(1)],
+        )
+
+        with pytest.raises(ConnectionError):
+            await relay.relay_once()
+        assert relay.documents[0]['outbox']
+        assert relay.failed_relays == 1
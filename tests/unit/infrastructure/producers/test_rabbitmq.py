@@ -0,0 +1,100 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import orjson
+import pytest
+
+from infrastructure.exceptions.producers import ProducerOutboxFullException
+from infrastructure.producers.base import SerializedEvent
+from infrastructure.producers.rabbitmq import RabbitMQProducer
+from tests.fakes import FakeEvent
+
+
+@dataclass
+class FlakyExchange:
+    available: bool = True
+    published: list[tuple[str, dict]] = field(default_factory=list)
+
+    async def publish(self, message, routing_key: str):
+        await asyncio.sleep(0.01)
+        if not self.available:
+            raise ConnectionError('Broker unavailable')
+        self.published.append((routing_key, orjson.loads(message.body)))
+
+
+@pytest.fixture
+def producer():
+    producer = RabbitMQProducer(
+        host='127.0.0.1',
+        port=5672,
+        login='guest',
+        password='guest',
+        virtual_host='/',
+        exchange_name='exchange',
+        outbox_max_size=3,
+        outbox_flush_interval=0.01,
+    )
+    producer.exchange = FlakyExchange()
+    return producer
+
+
+@pytest.mark.asyncio
+class TestRabbitMQProducer:
+    async def test_publish_many_pipelines_confirms(self, producer):
+        events = [FakeEvent() for _ in range(10)]
+
+        await asyncio.wait_for(producer.publish_many((event, 'fake.topic') for event in events), timeout=0.05)
+
+        assert [body['event_id'] for _, body in producer.exchange.published] == [str(event.event_id) for event in events]
+        assert producer.published_count == 10
+        assert producer.pending_confirms == 0
+        assert producer.last_confirm_lag > 0
+
+    async def test_unpublished_messages_are_buffered_and_flushed(self, producer):
+        producer.exchange.available = False
+
+        await producer.publish(FakeEvent(), 'fake.topic')
+        assert len(producer.outbox) == 1
+
+        producer.exchange.available = True
+        await asyncio.sleep(0.05)
+
+        assert not producer.outbox
+        assert len(producer.exchange.published) == 1
+        await producer.stop()
+
+    async def test_failed_flush_keeps_unsent_messages_in_order(self, producer):
+        producer.outbox_flush_interval = 60
+        producer.exchange.available = False
+        events = [FakeEvent() for _ in range(3)]
+        await producer.publish_many((event, 'fake.topic') for event in events)
+
+        await producer.flush_outbox()
+        assert [event.event_id for event in producer.outbox] == [str(event.event_id) for event in events]
+
+        producer.exchange.available = True
+        await producer.flush_outbox()
+        assert not producer.outbox
+        assert [body['event_id'] for _, body in producer.exchange.published] == [str(event.event_id) for event in events]
+        await producer.stop()
+
+    async def test_full_outbox_raises(self, producer):
+        producer.exchange.available = False
+
+        with pytest.raises(ProducerOutboxFullException):
+            await producer.publish_many((FakeEvent(), 'fake.topic') for _ in range(4))
+        await producer.stop()
+
+    async def test_publish_raises_without_outbox(self, producer):
+        producer.outbox_max_size = 0
+        producer.exchange.available = False
+
+        with pytest.raises(ConnectionError):
+            await producer.publish(FakeEvent(), 'fake.topic')
+
+    async def test_publish_serialized_raises_without_buffering(self, producer):
+        producer.exchange.available = False
+
+        with pytest.raises(ConnectionError):
+            await producer.publish_serialized([SerializedEvent.from_event(FakeEvent(), 'fake.topic')], buffer=False)
+        assert not producer.outbox
@@ -0,0 +1,90 @@
+import pytest
+
+from infrastructure.exceptions.notifications import InvalidNotificationTemplateException
+from infrastructure.renderers import compiled
+from infrastructure.renderers.compiled import CompiledNotificationTemplateRenderer, get_template_version
+
+
+@pytest.fixture
+def template():
+    return {
+        'name': 'email_updated',
+        'text_template': 'Your email was updated to %(new_email)s (100%% done).',
+        'html_template': 'Your email was updated to <strong>%(new_email)s</strong>.',
+    }
+
+
+class TestCompiledNotificationTemplateRenderer:
+    def test_render_matches_percent_formatting(self, template):
+        renderer = CompiledNotificationTemplateRenderer()
+        variables = {'new_email': 'user@example.com'}
+
+        rendered = renderer.render(template, variables)
+
+        assert rendered.text == template['text_template'] % variables
+        assert rendered.html == template['html_template'] % variables
+
+    def test_html_variables_are_escaped(self, template):
+        renderer = CompiledNotificationTemplateRenderer()
+
+        rendered = renderer.render(template, {'new_email': '<script>"x"</script>'})
+
+        assert '<script>' in rendered.text
+        assert rendered.html == 'Your email was updated to <strong>&lt;script&gt;&quot;x&quot;&lt;/script&gt;</strong>.'
+
+    def test_template_without_html(self, template):
+        template['html_template'] = None
+        renderer = CompiledNotificationTemplateRenderer()
+
+        rendered = renderer.render(template, {'new_email': 'user@example.com'})
+
+        assert rendered.html is None
+
+    def test_template_is_compiled_once_per_version(self, template):
+        renderer = CompiledNotificationTemplateRenderer()
+
+        first = renderer.compile(template, ['new_email'])
+        assert renderer.compile(template, ['new_email']) is first
+
+        template['text_template'] = 'Updated to %(new_email)s'
+        second = renderer.compile(template, ['new_email'])
+
+        assert second is not first
+        assert second.version != first.version
+        assert renderer.compiled_templates == {'email_updated': second}
+
+    def test_versioned_template_is_not_hashed_on_render(self, template, monkeypatch):
+        template['version'] = get_template_version(template)
+        renderer = CompiledNotificationTemplateRenderer()
+        renderer.render(template, {'new_email': 'user@example.com'})
+
+        def fail_hashing(template):
+            raise AssertionError('template hashed on render')
+
+        monkeypatch.setattr(compiled, 'get_template_version', fail_hashing)
+        rendered = renderer.render(template, {'new_email': 'user@example.com'})
+
+        assert rendered.text == 'Your email was updated to user@example.com (100% done).'
+
+    def test_missing_variable_is_rejected_after_compilation(self, template):
+        renderer = CompiledNotificationTemplateRenderer()
+        renderer.compile(template, ['new_email'])
+
+        with pytest.raises(InvalidNotificationTemplateException):
+            renderer.render(template, {'verify_token': 'token'})
+
+    def test_unknown_placeholder_is_rejected_at_compile_time(self, template):
+        renderer = CompiledNotificationTemplateRenderer()
+
+        with pytest.raises(InvalidNotificationTemplateException) as exc_info:
+            renderer.compile(template, ['verify_token'])
+
+        assert 'new_email' in exc_info.value.message
+
+    @pytest.mark.parametrize('text_template', ['%s', 'Token %(verify_token)d', 'Broken %(verify_token', 'Trailing %'])
+    def test_unsupported_placeholders_are_rejected(self, template, text_template):
+        template['text_template'] = text_template
+        renderer = CompiledNotificationTemplateRenderer()
+
+        with pytest.raises(InvalidNotificationTemplateException):
+            renderer.compile(template, ['new_email', 'verify_token'])
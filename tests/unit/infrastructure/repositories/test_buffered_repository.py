@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from bson import Binary
+from pymongo.errors import BulkWriteError
+
+from infrastructure.exceptions.notifications import NotificationBufferFullException
+from infrastructure.repositories.buffered import DUPLICATE_KEY_ERROR_CODE, BufferedBeanieNotificationRepository
+
+
+@dataclass
+class FailingBufferedNotificationRepository(BufferedBeanieNotificationRepository):
+    write_errors: list[dict] = field(default_factory=list)
+    merged: list = field(default_factory=list)
+
+    async def _insert_many(self, documents) -> None:
+        raise BulkWriteError({'writeErrors': self.write_errors})
+
+    async def _merge_deliveries(self, documents) -> None:
+        self.merged.extend(document.id for document in documents)
+
+
+@pytest.mark.asyncio
+async def test_only_transient_write_errors_are_requeued():
+    duplicate_id, rejected_id, transient_id, inserted_id = uuid4(), uuid4(), uuid4(), uuid4()
+    repo = FailingBufferedNotificationRepository(
+        write_errors=[
+            {'index': 0, 'code': DUPLICATE_KEY_ERROR_CODE, 'op': {'_id': Binary.from_uuid(duplicate_id)}},
+            {'index': 1, 'code': 121, 'errmsg': 'Document failed validation', 'op': {'_id': Binary.from_uuid(rejected_id)}},
+            {'index': 2, 'code': 11602, 'op': {'_id': Binary.from_uuid(transient_id)}},
+        ],
+    )
+    repo.buffer = {
+        notification_id: SimpleNamespace(id=notification_id)
+        for notification_id in (duplicate_id, rejected_id, transient_id, inserted_id)
+    }
+
+    await repo.flush()
+
+    assert list(repo.buffer) == [transient_id]
+    assert repo.merged == [duplicate_id]
+    assert repo.dropped_notifications == 1
+    assert repo.flushed_notifications == 2
+    assert repo.failed_flushes == 1
+
+
+@pytest.mark.asyncio
+async def test_add_fails_when_buffer_is_full(random_email_notification_entity):
+    repo = BufferedBeanieNotificationRepository(flush_interval=60, max_buffer_size=1)
+    await repo.start()
+    try:
+        buffered_id = uuid4()
+        repo.buffer = {buffered_id: SimpleNamespace(id=buffered_id)}
+
+        with pytest.raises(NotificationBufferFullException):
+            await repo.add(random_email_notification_entity)
+
+        assert list(repo.buffer) == [buffered_id]
+    finally:
+        repo.buffer = {}
+        await repo.stop()
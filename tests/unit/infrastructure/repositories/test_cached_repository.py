@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from infrastructure.exceptions.notifications import NotificationTemplateNotFoundException
+from infrastructure.repositories.cached import CachedNotificationTemplateRepository
+
+
+@pytest.fixture
+def cached_notification_template_repository(fake_notification_template_repository):
+    return CachedNotificationTemplateRepository(repo=fake_notification_template_repository, ttl=60.0)
+
+
+@pytest.mark.asyncio
+class TestCachedNotificationTemplateRepository:
+    async def test_get_is_read_through(self, cached_notification_template_repository):
+        first = await cached_notification_template_repository.get('email_updated')
+        second = await cached_notification_template_repository.get('email_updated')
+
+        assert first == second
+        assert first['name'] == 'email_updated'
+        assert first['version']
+        assert cached_notification_template_repository.misses == 1
+        assert cached_notification_template_repository.hits == 1
+
+    async def test_expired_entries_are_reloaded(self, cached_notification_template_repository):
+        cached_notification_template_repository.ttl = 0
+
+        await cached_notification_template_repository.get('email_updated')
+        await cached_notification_template_repository.get('email_updated')
+
+        assert cached_notification_template_repository.misses == 2
+        assert cached_notification_template_repository.hits == 0
+
+    async def test_add_invalidates_cached_template(self, cached_notification_template_repository, fake_notification_template_repository):
+        await cached_notification_template_repository.get('email_updated')
+        fake_notification_template_repository.templates_list.clear()
+        await cached_notification_template_repository.add(name='email_updated', text_template='Updated to %(new_email)s')
+
+        template = await cached_notification_template_repository.get('email_updated')
+
+        assert template['text_template'] == 'Updated to %(new_email)s'
+        assert cached_notification_template_repository.misses == 2
+
+    async def test_concurrent_misses_load_once(self, cached_notification_template_repository, fake_notification_template_repository):
+        loads = 0
+        get = fake_notification_template_repository.get
+
+        async def counting_get(name: str) -> dict[str, str]:
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return await get(name)
+
+        fake_notification_template_repository.get = counting_get
+        templates = await asyncio.gather(*(cached_notification_template_repository.get('email_updated') for _ in range(5)))
+
+        assert loads == 1
+        assert all(template == templates[0] for template in templates)
+
+    async def test_waiter_reloads_after_loader_is_cancelled(
+        self, cached_notification_template_repository, fake_notification_template_repository,
+    ):
+        loads = 0
+        released = asyncio.Event()
+        get = fake_notification_template_repository.get
+
+        async def blocking_get(name: str) -> dict[str, str]:
+            nonlocal loads
+            loads += 1
+            if loads == 1:
+                await released.wait()
+            return await get(name)
+
+        fake_notification_template_repository.get = blocking_get
+        loader = asyncio.create_task(cached_notification_template_repository.get('email_updated'))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cached_notification_template_repository.get('email_updated'))
+        await asyncio.sleep(0)
+
+        loader.cancel()
+        template = await asyncio.wait_for(waiter, timeout=1)
+
+        assert loader.cancelled()
+        assert template['name'] == 'email_updated'
+        assert loads == 2
+
+    async def test_missing_template_is_not_cached(self, cached_notification_template_repository):
+        for _ in range(2):
+            with pytest.raises(NotificationTemplateNotFoundException):
+                await cached_notification_template_repository.get('nonexistent_template')
+
+        assert cached_notification_template_repository.misses == 2
+        assert 'nonexistent_template' not in cached_notification_template_repository.entries
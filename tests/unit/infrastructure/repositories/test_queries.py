@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from bson import Binary
+
+from infrastructure.converters.notifications import convert_notification_document_to_summary
+from infrastructure.exceptions.notifications import InvalidNotificationCursorException
+from infrastructure.models.notifications import NotificationType
+from infrastructure.repositories.mongodb import BeanieNotificationQueryRepository
+from infrastructure.repositories.queries import NotificationCursor, NotificationFilters
+
+
+def test_cursor_round_trip():
+    cursor = NotificationCursor(created_at=datetime(2026, 10, 18, 12, 30, tzinfo=timezone.utc), id=uuid4())
+
+    assert NotificationCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', 'W10=', 'eyJhIjogMX0=', 'WyIyMDI2LTAxLTAxIiw1XQ=='])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidNotificationCursorException):
+        NotificationCursor.decode(cursor)
+
+
+def test_query_continues_after_cursor():
+    cursor = NotificationCursor(created_at=datetime(2026, 10, 18, tzinfo=timezone.utc), id=uuid4())
+    created_after = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+    query = BeanieNotificationQueryRepository.build_query(
+        NotificationFilters(
+            receiver='example@example.com',
+            notification_type=NotificationType.EMAIL,
+            created_after=created_after,
+        ),
+        cursor,
+    )
+
+    assert query == {
+        'receivers': 'example@example.com',
+        'notification_type': 'email',
+        'created_at': {'$gte': created_after},
+        '$or': [
+            {'created_at': {'$lt': cursor.created_at}},
+            {'created_at': cursor.created_at, '_id': {'$lt': Binary.from_uuid(cursor.id)}},
+        ],
+    }
+
+
+def test_document_is_converted_to_summary():
+    notification_id = uuid4()
+    created_at = datetime(2026, 10, 18, 12, 30)
+
+    summary = convert_notification_document_to_summary({
+        '_id': Binary.from_uuid(notification_id),
+        'notification_type': 'sms',
+        'sender': '+10000000000',
+        'receivers': ['+10000000001'],
+        'created_at': created_at,
+        'deliveries': [{'receiver': '+10000000001', 'status': 'sent', 'updated_at': created_at}],
+    })
+
+    assert summary['id'] == notification_id
+    assert summary['created_at'] == created_at.replace(tzinfo=timezone.utc)
+    assert summary['deliveries'][0]['status'] == 'sent'
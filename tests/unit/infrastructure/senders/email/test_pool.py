@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from tests.fakes import FakeSMTPConnectionPool
+
+
+@pytest.fixture
+def fake_smtp_connection_pool():
+    return FakeSMTPConnectionPool(
+        host='smtp.example.com',
+        port=587,
+        username='example',
+        password='example',
+        min_size=1,
+        max_size=3,
+        idle_timeout=60.0,
+        health_check_interval=30.0,
+    )
+
+
+@pytest.mark.asyncio
+class TestSMTPConnectionPool:
+    async def test_reuses_connections(self, fake_smtp_connection_pool):
+        for _ in range(5):
+            async with fake_smtp_connection_pool.acquire() as smtp:
+                await smtp.sendmail('from@example.com', ['to@example.com'], 'message')
+
+        assert len(fake_smtp_connection_pool.connections) == 1
+        assert len(fake_smtp_connection_pool.connections[0].sent_messages) == 5
+
+    async def test_bounds_connections_by_max_size(self, fake_smtp_connection_pool):
+        async def send():
+            async with fake_smtp_connection_pool.acquire() as smtp:
+                await smtp.sendmail('from@example.com', ['to@example.com'], 'message')
+
+        await asyncio.gather(*(send() for _ in range(10)))
+
+        assert len(fake_smtp_connection_pool.connections) == fake_smtp_connection_pool.max_size
+        assert fake_smtp_connection_pool.idle_size == fake_smtp_connection_pool.max_size
+
+    async def test_prewarms_min_size_and_closes_on_stop(self, fake_smtp_connection_pool):
+        await fake_smtp_connection_pool.start()
+        assert fake_smtp_connection_pool.size == fake_smtp_connection_pool.min_size
+
+        await fake_smtp_connection_pool.stop()
+        assert fake_smtp_connection_pool.size == 0
+        assert not any(smtp.is_connected for smtp in fake_smtp_connection_pool.connections)
+
+    async def test_replaces_connection_failing_health_check(self, fake_smtp_connection_pool):
+        fake_smtp_connection_pool.health_check_interval = 0
+        async with fake_smtp_connection_pool.acquire():
+            ...
+        fake_smtp_connection_pool.connections[0].healthy = False
+
+        async with fake_smtp_connection_pool.acquire() as smtp:
+            assert smtp is fake_smtp_connection_pool.connections[1]
+
+        assert fake_smtp_connection_pool.size == 1
+
+    async def test_discards_connection_after_error(self, fake_smtp_connection_pool):
+        with pytest.raises(ConnectionError):
+            async with fake_smtp_connection_pool.acquire():
+                raise ConnectionError
+
+        assert fake_smtp_connection_pool.size == 0
+        assert fake_smtp_connection_pool.idle_size == 0
+
+    async def test_check_health_reports_unreachable_server(self, fake_smtp_connection_pool, monkeypatch):
+        assert await fake_smtp_connection_pool.check_health()
+
+        async def refuse_connection():
+            raise ConnectionRefusedError
+
+        fake_smtp_connection_pool.idle_connections.clear()
+        monkeypatch.setattr(fake_smtp_connection_pool, '_open_connection', refuse_connection)
+        assert not await fake_smtp_connection_pool.check_health()
@@ -0,0 +1,65 @@
+import pytest
+
+from infrastructure.senders.email.smtp import SMTPEmailSender
+from tests.fakes import FakeSMTPConnectionPool
+
+
+@pytest.fixture
+def pooled_smtp_email_sender():
+    sender = SMTPEmailSender(
+        host='smtp.example.com',
+        port=587,
+        username='example',
+        password='example',
+        pool_max_size=2,
+        mass_email_chunk_size=10,
+        mass_email_concurrency=2,
+    )
+    sender.pool = FakeSMTPConnectionPool(
+        host=sender.host,
+        port=sender.port,
+        username=sender.username,
+        password=sender.password,
+        max_size=sender.pool_max_size,
+    )
+    return sender
+
+
+@pytest.mark.asyncio
+class TestSMTPEmailSender:
+    async def test_send_mass_email_in_chunks(self, pooled_smtp_email_sender):
+        receivers = (f'user_{i}@example.com' for i in range(95))
+
+        report = await pooled_smtp_email_sender.send_mass_email(
+            sender='noreply@example.com',
+            receivers=receivers,
+            subject='Announcement',
+            text='Text',
+            html='<p>Text</p>',
+        )
+
+        sent_messages = [
+            message
+            for smtp in pooled_smtp_email_sender.pool.connections
+            for message in smtp.sent_messages
+        ]
+        assert report.delivered == 95
+        assert not report.failed
+        assert len(sent_messages) == 10
+        assert max(len(recipients) for _, recipients, _ in sent_messages) == 10
+        assert len({body for _, _, body in sent_messages}) == 1
+        assert len(pooled_smtp_email_sender.pool.connections) <= 2
+
+    async def test_send_mass_email_reports_refused_receivers(self, pooled_smtp_email_sender):
+        receivers = ['user_1@example.com', 'refused_1@example.com', 'user_2@example.com', 'refused_2@example.com']
+
+        report = await pooled_smtp_email_sender.send_mass_email(
+            sender='noreply@example.com',
+            receivers=receivers,
+            subject='Announcement',
+            text='Text',
+        )
+
+        assert report.delivered == 2
+        assert set(report.failed) == {'refused_1@example.com', 'refused_2@example.com'}
+        assert report.processed == len(receivers)
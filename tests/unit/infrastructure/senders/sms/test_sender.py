@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from infrastructure.senders.reports import MassDeliveryReport
+from infrastructure.senders.sms.twilio import TwilioSMSSender
+from infrastructure.senders.throttling import TokenBucket
+from tests.fakes import FakeTwilioServer
+
+
+@pytest_asyncio.fixture
+async def fake_twilio_server():
+    async with FakeTwilioServer(response_delay=0.1) as server:
+        yield server
+
+
+@pytest_asyncio.fixture
+async def fake_twilio_sms_sender(fake_twilio_server):
+    async with TwilioSMSSender(
+        account_sid='ACexample',
+        auth_token='example',
+        api_base_url=fake_twilio_server.url,
+    ) as sender:
+        yield sender
+
+
+@pytest.mark.asyncio
+class TestTwilioSMSSender:
+    async def test_send_targeted_sms(self, fake_twilio_server, fake_twilio_sms_sender):
+        await fake_twilio_sms_sender.send_targeted_sms(sender='+12345678910', receiver='+10987654321', text='Hello')
+
+        assert fake_twilio_server.messages == [{'From': '+12345678910', 'To': '+10987654321', 'Body': 'Hello'}]
+
+    async def test_send_targeted_sms_times_out(self, fake_twilio_server):
+        async with TwilioSMSSender(
+            account_sid='ACexample',
+            auth_token='example',
+            api_base_url=fake_twilio_server.url,
+            timeout=fake_twilio_server.response_delay / 5,
+        ) as sender:
+            with pytest.raises(asyncio.TimeoutError):
+                await sender.send_targeted_sms(sender='+12345678910', receiver='+10987654321', text='Hello')
+
+    async def test_send_targeted_sms_does_not_block_event_loop(self, fake_twilio_server, fake_twilio_sms_sender):
+        started_at = time.monotonic()
+        await asyncio.gather(*(
+            fake_twilio_sms_sender.send_targeted_sms(sender='+12345678910', receiver=f'+1098765432{i}', text='Hello')
+            for i in range(10)
+        ))
+
+        assert len(fake_twilio_server.messages) == 10
+        assert time.monotonic() - started_at < 10 * fake_twilio_server.response_delay
+
+    async def test_send_mass_sms_is_throttled(self, fake_twilio_server, fake_twilio_sms_sender):
+        fake_twilio_sms_sender.throttle = TokenBucket(rate=50, capacity=1)
+        receivers = [f'+1098765432{i}' for i in range(10)]
+
+        started_at = time.monotonic()
+        report = await fake_twilio_sms_sender.send_mass_sms(sender='+12345678910', receivers=receivers, text='Hello')
+
+        assert report.delivered == 10
+        assert time.monotonic() - started_at >= 9 / 50
+        assert {message['To'] for message in fake_twilio_server.messages} == set(receivers)
+
+    async def test_send_mass_sms_reports_failures_and_resumes(self, fake_twilio_server, fake_twilio_sms_sender):
+        fake_twilio_sms_sender.throttle = TokenBucket(rate=1000, capacity=10)
+        fake_twilio_sms_sender.mass_sms_batch_size = 2
+        fake_twilio_server.failing_receivers = {'+10987654324'}
+        receivers = [f'+1098765432{i}' for i in range(6)]
+
+        report = await fake_twilio_sms_sender.send_mass_sms(
+            sender='+12345678910',
+            receivers=receivers,
+            text='Hello',
+            report=MassDeliveryReport(delivered=2),
+        )
+
+        assert report.processed == 6
+        assert report.delivered == 5
+        assert list(report.failed) == ['+10987654324']
+        assert sorted(message['To'] for message in fake_twilio_server.messages) == ['+10987654322', '+10987654323', '+10987654325']
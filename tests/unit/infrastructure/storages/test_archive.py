@@ -0,0 +1,52 @@
+import gzip
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from tests.fakes import FakeNotificationArchiver
+
+
+def make_document(age: timedelta) -> dict:
+    return {
+        'id': str(uuid4()),
+        'notification_type': 'sms',
+        'sender': '+1234567890',
+        'receivers': ['+1987654321'],
+        'message': 'Test SMS Body',
+        'created_at': (datetime.now(timezone.utc) - age).isoformat(),
+    }
+
+
+@pytest.mark.asyncio
+class TestNotificationArchiver:
+    async def test_expired_notifications_are_archived_and_deleted(self, tmp_path):
+        expired = [make_document(timedelta(days=days)) for days in (3, 2)]
+        fresh = make_document(timedelta(minutes=5))
+        archiver = FakeNotificationArchiver(
+            directory=tmp_path,
+            retention=timedelta(days=1).total_seconds(),
+            batch_size=1,
+            documents=[fresh, *expired],
+        )
+
+        archived = await archiver.archive()
+
+        assert archived == 2
+        assert archiver.documents == [fresh]
+        [archive_path] = tmp_path.iterdir()
+        assert archive_path.name.endswith('.ndjson.gz')
+        with gzip.open(archive_path) as archive_file:
+            assert [orjson.loads(line) for line in archive_file] == expired
+
+    async def test_nothing_to_archive(self, tmp_path):
+        archiver = FakeNotificationArchiver(
+            directory=tmp_path,
+            retention=timedelta(days=1).total_seconds(),
+            documents=[make_document(timedelta(minutes=5))],
+        )
+
+        assert await archiver.archive() == 0
+        assert len(archiver.documents) == 1
+        assert not list(tmp_path.iterdir())
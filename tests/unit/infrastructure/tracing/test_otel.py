@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+pytest.importorskip('opentelemetry.sdk')
+
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+
+from application.external_events.consumers.rabbitmq import RabbitMQConsumer
+from domain.commands.base import BaseCommand
+from infrastructure.tracing.otel import configure_tracing, is_tracing_enabled, shutdown_tracing, start_span
+from service.exceptions.notifications import HandlerNotFoundException
+from tests.fakes import FakeExternalEventHandler
+
+
+ROUTING_KEY = 'user.email.updated'
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+PARENT_SPAN_ID = '00f067aa0ba902b7'
+
+
+class UnknownCommand(BaseCommand):
+    ...
+
+
+@pytest.fixture
+def span_exporter():
+    span_exporter = InMemorySpanExporter()
+    configure_tracing('notification-service-tests', sample_ratio=1.0, exporter=span_exporter)
+    yield span_exporter
+    shutdown_tracing()
+
+
+def get_span_names(span_exporter: InMemorySpanExporter) -> list[str]:
+    return [span.name for span in span_exporter.get_finished_spans()]
+
+
+def test_disabled_tracing_is_noop():
+    assert not is_tracing_enabled()
+    with start_span('noop') as span:
+        assert span is None
+
+
+@pytest.mark.asyncio
+async def test_consumer_span_continues_publisher_trace(span_exporter):
+    consumer = RabbitMQConsumer(
+        host='127.0.0.1',
+        port=5672,
+        login='guest',
+        password='guest',
+        virtual_host='/',
+        exchange_name='exchange',
+        queue_name='queue',
+        external_events_map={ROUTING_KEY: FakeExternalEventHandler(bus=None)},
+    )
+    message = SimpleNamespace(
+        routing_key=ROUTING_KEY,
+        message_id='message-id',
+        headers={'traceparent': f'00-{TRACE_ID}-{PARENT_SPAN_ID}-01'},
+        content_type='application/json',
+        body=orjson.dumps({}),
+    )
+
+    await consumer.process_message(message, {})
+
+    [span] = span_exporter.get_finished_spans()
+    assert span.name == f'{ROUTING_KEY} process'
+    assert span.kind == SpanKind.CONSUMER
+    assert span.context.trace_id == int(TRACE_ID, 16)
+    assert span.parent.span_id == int(PARENT_SPAN_ID, 16)
+    assert span.attributes['messaging.destination.name'] == ROUTING_KEY
+
+
+@pytest.mark.asyncio
+async def test_failed_command_span_records_error(span_exporter, fake_message_bus):
+    with pytest.raises(HandlerNotFoundException):
+        await fake_message_bus.handle(UnknownCommand())
+
+    [span] = span_exporter.get_finished_spans()
+    assert span.name == 'MessageBus.handle_command'
+    assert span.attributes['command'] == 'UnknownCommand'
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.events[0].name == 'exception'
+
+
+@pytest.mark.asyncio
+async def test_repository_and_sender_calls_are_traced(
+    span_exporter,
+    fake_notification_repository,
+    fake_email_sender,
+    random_email_notification_entity,
+):
+    with start_span('parent'):
+        await fake_notification_repository.add(random_email_notification_entity)
+        await fake_email_sender.send_email(random_email_notification_entity)
+
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    assert set(spans) >= {'FakeNotificationRepository.add', 'BaseEmailSender.send_email', 'parent'}
+    parent = spans['parent']
+    assert spans['FakeNotificationRepository.add'].parent.span_id == parent.context.span_id
+    assert spans['BaseEmailSender.send_email'].parent.span_id == parent.context.span_id
+    targeted = [name for name in spans if name.startswith('FakeEmailSender.send_')]
+    assert targeted and spans[targeted[0]].parent.span_id == spans['BaseEmailSender.send_email'].context.span_id
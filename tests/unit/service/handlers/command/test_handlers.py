@@ -12,10 +12,14 @@ from domain.commands.notifications import (
     SendUserEmailUpdatedMessageCommand,
     SendUserPhoneNumberUpdatedMessageCommand,
 )
-from domain.entities.notifications import EmailNotificationEntity, SMSNotificationEntity
+from domain.entities.notifications import DeliveryStatus, EmailNotificationEntity, SMSNotificationEntity
+from domain.events.notifications import NotificationCreatedEvent
 from domain.exceptions.notifications import InsufficientCredentialsInfoException
 from domain.value_objects.notifications import EmailVO, PhoneNumberVO, NameVO
+from infrastructure.senders.reports import MassDeliveryReport
 from service.handlers.command.notifications import (
+    add_notification,
+    send_tracked_notification,
     SendUserRegistrationCompletedMessageCommandHandler,
     SendUserEmailUpdateInitiatedMessageCommandHandler,
     SendUserPhoneNumberUpdateInitiatedMessageCommandHandler,
@@ -23,6 +27,7 @@ from service.handlers.command.notifications import (
     SendUserEmailUpdatedMessageCommandHandler,
     SendUserPhoneNumberUpdatedMessageCommandHandler,
 )
+from settings.container import get_event_topics
 
 
 @pytest.mark.asyncio
@@ -224,3 +229,60 @@ class TestCommandHandlers:
 
 
 
+
+
+@pytest.mark.asyncio
+class TestSendTrackedNotification:
+    @pytest.fixture
+    def email_notification(self):
+        return EmailNotificationEntity(
+            sender=EmailVO('sender@example.com'),
+            receivers=[EmailVO('first@example.com'), EmailVO('second@example.com')],
+            subject='Subject',
+            text='Text',
+            html=None,
+        )
+
+    async def test_added_notification_records_created_event(self, email_notification, fake_notification_repository):
+        await add_notification(fake_notification_repository, email_notification)
+
+        [event] = email_notification.events
+        assert isinstance(event, NotificationCreatedEvent)
+        assert event.notification_id == email_notification.id
+        assert event.notification_type == 'email'
+        assert event.receivers == ['first@example.com', 'second@example.com']
+        assert get_event_topics()[NotificationCreatedEvent] == 'notification.created'
+
+    async def test_delivered_receivers_are_marked_sent(self, email_notification, fake_notification_repository, fake_email_sender):
+        await fake_notification_repository.add(email_notification)
+
+        await send_tracked_notification(fake_notification_repository, fake_email_sender.send_email, email_notification)
+
+        assert fake_notification_repository.delivery_statuses[email_notification.id] == {
+            'first@example.com': DeliveryStatus.SENT,
+            'second@example.com': DeliveryStatus.SENT,
+        }
+
+    async def test_refused_receivers_are_marked_failed(self, email_notification, fake_notification_repository):
+        async def send(notification):
+            return MassDeliveryReport(delivered=1, failed={'second@example.com': 'Recipient refused'})
+
+        await fake_notification_repository.add(email_notification)
+
+        await send_tracked_notification(fake_notification_repository, send, email_notification)
+
+        assert fake_notification_repository.delivery_statuses[email_notification.id] == {
+            'first@example.com': DeliveryStatus.SENT,
+            'second@example.com': DeliveryStatus.FAILED,
+        }
+
+    async def test_send_error_marks_all_receivers_failed(self, email_notification, fake_notification_repository):
+        async def send(notification):
+            raise ConnectionError('SMTP server unavailable')
+
+        await fake_notification_repository.add(email_notification)
+
+        with pytest.raises(ConnectionError):
+            await send_tracked_notification(fake_notification_repository, send, email_notification)
+
+        assert set(fake_notification_repository.delivery_statuses[email_notification.id].values()) == {DeliveryStatus.FAILED}
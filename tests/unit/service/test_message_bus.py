@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import logging
 
@@ -53,3 +54,76 @@ class TestMessageBus:
         with expectation:
             await fake_message_bus.handle(message)
 
+
+    async def test_bulk_events_are_processed_in_order(self, fake_message_bus, random_email_notification_entity):
+        handled_events = []
+
+        class EmittingCommandHandler(BaseCommandHandler):
+            async def __call__(self, command: SomeKnownCommand) -> None:
+                random_email_notification_entity.events.extend(SomeKnownEvent() for _ in range(1000))
+                fake_message_bus.repo.loaded_notifications.add(random_email_notification_entity)
+
+        class RecordingEventHandler(BaseEventHandler):
+            async def __call__(self, event: SomeKnownEvent) -> None:
+                handled_events.append(event)
+
+        fake_message_bus.commands_map = {SomeKnownCommand: EmittingCommandHandler()}
+        fake_message_bus.events_map = {SomeKnownEvent: [RecordingEventHandler(producer=None, topic=None)]}
+
+        await fake_message_bus.handle(SomeKnownCommand())
+
+        assert len(handled_events) == 1000
+        assert fake_message_bus.queue_size == 0
+        assert fake_message_bus.queue_high_water_mark == 1000
+
+    async def test_full_queue_delays_new_messages(self, fake_message_bus, random_email_notification_entity):
+        release = asyncio.Event()
+        handled_commands = []
+
+        class EmittingCommandHandler(BaseCommandHandler):
+            async def __call__(self, command: SomeKnownCommand) -> None:
+                handled_commands.append(command)
+                if len(handled_commands) == 1:
+                    random_email_notification_entity.events.extend([SomeKnownEvent(), SomeKnownEvent()])
+                    fake_message_bus.repo.loaded_notifications.add(random_email_notification_entity)
+
+        class BlockingEventHandler(BaseEventHandler):
+            async def __call__(self, event: SomeKnownEvent) -> None:
+                await release.wait()
+
+        fake_message_bus.max_queue_size = 1
+        fake_message_bus.commands_map = {SomeKnownCommand: EmittingCommandHandler()}
+        fake_message_bus.events_map = {SomeKnownEvent: [BlockingEventHandler(producer=None, topic=None)]}
+
+        first = asyncio.create_task(fake_message_bus.handle(SomeKnownCommand()))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(fake_message_bus.handle(SomeKnownCommand()))
+        await asyncio.sleep(0.01)
+
+        assert len(handled_commands) == 1
+        assert fake_message_bus.queue_size == 1
+
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert len(handled_commands) == 2
+        assert fake_message_bus.queue_size == 0
+
+    async def test_loaded_notifications_are_scoped_to_handle(self, fake_message_bus, random_email_notification_entity, random_sms_notification_entity):
+        notifications = [random_email_notification_entity, random_sms_notification_entity]
+        seen_notifications = []
+
+        class AddingCommandHandler(BaseCommandHandler):
+            async def __call__(self, command: SomeKnownCommand) -> None:
+                await fake_message_bus.repo.add(notifications.pop())
+                await asyncio.sleep(0.01)
+                seen_notifications.append(set(fake_message_bus.repo.loaded_notifications))
+
+        fake_message_bus.commands_map = {SomeKnownCommand: AddingCommandHandler()}
+
+        await asyncio.gather(fake_message_bus.handle(SomeKnownCommand()), fake_message_bus.handle(SomeKnownCommand()))
+
+        assert all(len(notifications) == 1 for notifications in seen_notifications)
+        assert seen_notifications[0] != seen_notifications[1]
+        assert not fake_message_bus.repo.loaded_notifications
+        assert len(fake_message_bus.repo.notifications_list) == 2
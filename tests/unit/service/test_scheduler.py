@@ -0,0 +1,124 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from application.external_events.handlers.notifications import UserEmailUpdatedExternalEventHandler
+from domain.commands.base import BaseCommand
+from domain.commands.notifications import SendUserEmailUpdatedMessageCommand
+from service.handlers.command.base import BaseCommandHandler
+from service.scheduler import CommandScheduler
+from tests.fakes import FakeCommand, FakeScheduledCommandRepository
+
+
+@dataclass
+class RecordingCommandHandler(BaseCommandHandler):
+    failures: int = 0
+    handled: list[BaseCommand] = field(default_factory=list)
+
+    async def __call__(self, command: BaseCommand) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError('Handler failed')
+        self.handled.append(command)
+
+
+@dataclass
+class SlowCommandHandler(BaseCommandHandler):
+    scheduler: CommandScheduler | None = None
+    reclaimed: list = field(default_factory=list)
+
+    async def __call__(self, command: BaseCommand) -> None:
+        await asyncio.sleep(0.2)
+        self.reclaimed.extend(await self.scheduler.repo.claim_due(datetime.now(timezone.utc), 10, 0.05))
+
+
+@pytest.fixture
+def command_handler(fake_message_bus):
+    handler = RecordingCommandHandler()
+    fake_message_bus.commands_map = {FakeCommand: handler, SendUserEmailUpdatedMessageCommand: handler}
+    return handler
+
+
+@pytest.fixture
+def scheduler(fake_message_bus, command_handler):
+    return CommandScheduler(
+        bus=fake_message_bus,
+        repo=FakeScheduledCommandRepository(),
+        window=1.0,
+        poll_interval=0.01,
+        batch_size=10,
+        retry_delay=60.0,
+    )
+
+
+@pytest.mark.asyncio
+class TestCommandScheduler:
+    async def test_only_due_commands_are_dispatched(self, scheduler, command_handler):
+        now = datetime.now(timezone.utc)
+        due = await scheduler.schedule(FakeCommand(), now - timedelta(seconds=1))
+        soon = await scheduler.schedule(FakeCommand(), now + timedelta(seconds=0.5))
+        later = await scheduler.schedule(FakeCommand(), now + timedelta(hours=1))
+
+        assert await scheduler.tick() == 1
+        assert command_handler.handled == [due.command]
+        assert [scheduled_command.id for _, _, scheduled_command in scheduler.pending] == [soon.id]
+        assert set(scheduler.repo.scheduled_commands) == {soon.id, later.id}
+        assert 0 < scheduler.get_next_tick_delay() <= 0.5
+
+    async def test_scheduled_commands_are_dispatched_in_background(self, scheduler, command_handler):
+        await scheduler.start()
+        command = FakeCommand()
+        await scheduler.schedule(command, datetime.now(timezone.utc) + timedelta(seconds=0.05))
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+
+        assert command_handler.handled == [command]
+        assert scheduler.dispatched == 1
+        assert not scheduler.repo.scheduled_commands
+
+    async def test_failed_command_is_rescheduled_then_dropped(self, scheduler, command_handler):
+        command_handler.failures = 2
+        scheduler.max_attempts = 2
+        scheduled_command = await scheduler.schedule(FakeCommand(), datetime.now(timezone.utc))
+
+        await scheduler.tick()
+        assert scheduler.repo.scheduled_commands[scheduled_command.id].attempts == 1
+        assert scheduled_command.due_at > datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        scheduled_command.due_at = datetime.now(timezone.utc)
+        await scheduler.tick()
+        assert not scheduler.repo.scheduled_commands
+        assert scheduler.failed == 1
+        assert not command_handler.handled
+
+    async def test_stop_releases_claimed_commands(self, scheduler):
+        scheduled_command = await scheduler.schedule(FakeCommand(), datetime.now(timezone.utc) + timedelta(seconds=0.5))
+        await scheduler.tick()
+        assert scheduled_command.id in scheduler.repo.locked_until
+
+        await scheduler.stop()
+        assert not scheduler.pending
+        assert scheduled_command.id not in scheduler.repo.locked_until
+
+    async def test_external_event_with_send_at_is_scheduled(self, scheduler, command_handler, fake_message_bus):
+        handler = UserEmailUpdatedExternalEventHandler(bus=fake_message_bus, scheduler=scheduler)
+        send_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        await handler({'user_id': 'user', 'new_email': 'example@example.com', 'send_at': send_at.isoformat()})
+
+        assert not command_handler.handled
+        [scheduled_command] = scheduler.repo.scheduled_commands.values()
+        assert scheduled_command.due_at == send_at
+        assert scheduled_command.command.new_email.as_generic() == 'example@example.com'
+
+    async def test_lease_is_renewed_while_dispatching(self, scheduler, fake_message_bus):
+        handler = SlowCommandHandler(scheduler=scheduler)
+        fake_message_bus.commands_map = {FakeCommand: handler}
+        scheduler.window, scheduler.lease = 0.0, 0.06
+        await scheduler.schedule(FakeCommand(), datetime.now(timezone.utc))
+
+        assert await scheduler.tick() == 1
+        assert handler.reclaimed == []
+        assert not scheduler.repo.scheduled_commands